@@ -7,6 +7,7 @@ Create Date: 2026-02-13
 from typing import Sequence, Union
 
 from alembic import op
+import sqlalchemy as sa
 
 
 # revision identifiers, used by Alembic.
@@ -15,26 +16,56 @@ down_revision: Union[str, None] = '001_add_id_unidade'
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# Linhas atualizadas por transação — mantém locks e WAL limitados por lote
+BATCH_SIZE = 5000
+
+
+def _update_in_batches(conn, sql: str) -> None:
+    """Executa o UPDATE em lotes até não haver mais linhas afetadas."""
+    while True:
+        result = conn.execute(sa.text(sql), {"batch_size": BATCH_SIZE})
+        if result.rowcount == 0:
+            break
+
 
 def upgrade() -> None:
-    # Strip all non-digit characters from numero_processo
-    op.execute(
-        "UPDATE historico_pesquisas "
-        "SET numero_processo = regexp_replace(numero_processo, '[^0-9]', '', 'g') "
-        "WHERE numero_processo ~ '[^0-9]'"
-    )
-
-    # Backfill numero_processo_formatado where NULL and numero_processo is 17 digits
-    op.execute(
-        "UPDATE historico_pesquisas "
-        "SET numero_processo_formatado = "
-        "  substring(numero_processo from 1 for 5) || '.' || "
-        "  substring(numero_processo from 6 for 6) || '/' || "
-        "  substring(numero_processo from 12 for 4) || '-' || "
-        "  substring(numero_processo from 16 for 2) "
-        "WHERE numero_processo_formatado IS NULL "
-        "  AND numero_processo ~ '^[0-9]{17}$'"
-    )
+    conn = op.get_bind()
+
+    # Cada lote é commitado isoladamente: a migration pode ser interrompida
+    # e retomada, e nenhum lote segura locks por mais de 60s.
+    with op.get_context().autocommit_block():
+        conn.execute(sa.text("SET statement_timeout = '60s'"))
+
+        # Strip all non-digit characters from numero_processo
+        _update_in_batches(
+            conn,
+            "UPDATE historico_pesquisas "
+            "SET numero_processo = regexp_replace(numero_processo, '[^0-9]', '', 'g') "
+            "WHERE ctid IN ("
+            "  SELECT ctid FROM historico_pesquisas "
+            "  WHERE numero_processo ~ '[^0-9]' "
+            "  LIMIT :batch_size"
+            ")"
+        )
+
+        # Backfill numero_processo_formatado where NULL and numero_processo is 17 digits
+        _update_in_batches(
+            conn,
+            "UPDATE historico_pesquisas "
+            "SET numero_processo_formatado = "
+            "  substring(numero_processo from 1 for 5) || '.' || "
+            "  substring(numero_processo from 6 for 6) || '/' || "
+            "  substring(numero_processo from 12 for 4) || '-' || "
+            "  substring(numero_processo from 16 for 2) "
+            "WHERE ctid IN ("
+            "  SELECT ctid FROM historico_pesquisas "
+            "  WHERE numero_processo_formatado IS NULL "
+            "    AND numero_processo ~ '^[0-9]{17}$' "
+            "  LIMIT :batch_size"
+            ")"
+        )
+
+        conn.execute(sa.text("RESET statement_timeout"))
 
 
 def downgrade() -> None:
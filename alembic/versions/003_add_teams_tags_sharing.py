@@ -18,7 +18,7 @@ branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
 
-def upgrade() -> None:
+def _create_tables() -> None:
     # --- equipes ---
     op.create_table(
         'equipes',
@@ -32,10 +32,6 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint('id'),
         comment='Tabela de equipes de trabalho'
     )
-    op.create_index(
-        'idx_equipe_proprietario', 'equipes', ['proprietario_usuario'],
-        postgresql_where=sa.text("deletado_em IS NULL")
-    )
 
     # --- equipe_membros ---
     op.create_table(
@@ -50,20 +46,6 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint('id'),
         comment='Tabela de membros de equipe'
     )
-    op.create_index(
-        'idx_membro_equipe', 'equipe_membros', ['equipe_id'],
-        postgresql_where=sa.text("deletado_em IS NULL")
-    )
-    op.create_index(
-        'idx_membro_usuario', 'equipe_membros', ['usuario'],
-        postgresql_where=sa.text("deletado_em IS NULL")
-    )
-    # Partial unique index (acts as conditional unique constraint)
-    op.create_index(
-        'uq_equipe_membro_usuario', 'equipe_membros', ['equipe_id', 'usuario'],
-        unique=True,
-        postgresql_where=sa.text("deletado_em IS NULL")
-    )
 
     # --- tags ---
     op.create_table(
@@ -78,15 +60,6 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint('id'),
         comment='Tabela de tags para agrupamento de processos salvos'
     )
-    op.create_index(
-        'idx_tag_usuario', 'tags', ['usuario'],
-        postgresql_where=sa.text("deletado_em IS NULL")
-    )
-    op.create_index(
-        'uq_tag_usuario_nome', 'tags', ['usuario', 'nome'],
-        unique=True,
-        postgresql_where=sa.text("deletado_em IS NULL")
-    )
 
     # --- processos_salvos ---
     op.create_table(
@@ -102,19 +75,6 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint('id'),
         comment='Tabela de processos salvos em tags'
     )
-    op.create_index(
-        'idx_processo_salvo_tag', 'processos_salvos', ['tag_id'],
-        postgresql_where=sa.text("deletado_em IS NULL")
-    )
-    op.create_index(
-        'idx_processo_salvo_numero', 'processos_salvos', ['numero_processo'],
-        postgresql_where=sa.text("deletado_em IS NULL")
-    )
-    op.create_index(
-        'uq_processo_salvo_tag_numero', 'processos_salvos', ['tag_id', 'numero_processo'],
-        unique=True,
-        postgresql_where=sa.text("deletado_em IS NULL")
-    )
 
     # --- compartilhamentos ---
     op.create_table(
@@ -136,20 +96,81 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint('id'),
         comment='Tabela de compartilhamentos de tags'
     )
+
+
+def _create_indexes() -> None:
+    op.create_index(
+        'idx_equipe_proprietario', 'equipes', ['proprietario_usuario'],
+        postgresql_where=sa.text("deletado_em IS NULL"),
+        postgresql_concurrently=True,
+        if_not_exists=True,
+    )
+    op.create_index(
+        'idx_membro_usuario', 'equipe_membros', ['usuario'],
+        postgresql_where=sa.text("deletado_em IS NULL"),
+        postgresql_concurrently=True,
+        if_not_exists=True,
+    )
+    # Partial unique index (acts as conditional unique constraint).
+    # Also serves WHERE equipe_id = ? lookups via its leading column.
+    op.create_index(
+        'uq_equipe_membro_usuario', 'equipe_membros', ['equipe_id', 'usuario'],
+        unique=True,
+        postgresql_where=sa.text("deletado_em IS NULL"),
+        postgresql_concurrently=True,
+        if_not_exists=True,
+    )
+    # Leading column also serves WHERE usuario = ? lookups
+    op.create_index(
+        'uq_tag_usuario_nome', 'tags', ['usuario', 'nome'],
+        unique=True,
+        postgresql_where=sa.text("deletado_em IS NULL"),
+        postgresql_concurrently=True,
+        if_not_exists=True,
+    )
+    op.create_index(
+        'idx_processo_salvo_numero', 'processos_salvos', ['numero_processo'],
+        postgresql_where=sa.text("deletado_em IS NULL"),
+        postgresql_concurrently=True,
+        if_not_exists=True,
+    )
+    # Leading column also serves WHERE tag_id = ? lookups
+    op.create_index(
+        'uq_processo_salvo_tag_numero', 'processos_salvos', ['tag_id', 'numero_processo'],
+        unique=True,
+        postgresql_where=sa.text("deletado_em IS NULL"),
+        postgresql_concurrently=True,
+        if_not_exists=True,
+    )
     op.create_index(
         'idx_compartilhamento_tag', 'compartilhamentos', ['tag_id'],
-        postgresql_where=sa.text("deletado_em IS NULL")
+        postgresql_where=sa.text("deletado_em IS NULL"),
+        postgresql_concurrently=True,
+        if_not_exists=True,
     )
     op.create_index(
         'idx_compartilhamento_usuario_destino', 'compartilhamentos', ['usuario_destino'],
-        postgresql_where=sa.text("deletado_em IS NULL")
+        postgresql_where=sa.text("deletado_em IS NULL AND usuario_destino IS NOT NULL"),
+        postgresql_concurrently=True,
+        if_not_exists=True,
     )
     op.create_index(
         'idx_compartilhamento_equipe_destino', 'compartilhamentos', ['equipe_destino_id'],
-        postgresql_where=sa.text("deletado_em IS NULL")
+        postgresql_where=sa.text("deletado_em IS NULL AND equipe_destino_id IS NOT NULL"),
+        postgresql_concurrently=True,
+        if_not_exists=True,
     )
 
 
+def upgrade() -> None:
+    # Todas as tabelas primeiro, na transação da migration; os índices vêm
+    # depois, num único bloco: CREATE INDEX CONCURRENTLY não pode rodar dentro
+    # de transação, e autocommit_block() faz COMMIT do DDL anterior.
+    _create_tables()
+    with op.get_context().autocommit_block():
+        _create_indexes()
+
+
 def downgrade() -> None:
     op.drop_table('compartilhamentos')
     op.drop_table('processos_salvos')
@@ -32,21 +32,28 @@ def upgrade() -> None:
         comment='Tabela de observacoes sobre processos'
     )
 
-    op.create_index(
-        'idx_observacao_processo',
-        'observacoes',
-        ['numero_processo'],
-        postgresql_where=sa.text('deletado_em IS NULL')
-    )
-    op.create_index(
-        'idx_observacao_usuario',
-        'observacoes',
-        ['usuario'],
-        postgresql_where=sa.text('deletado_em IS NULL')
-    )
+    # CREATE INDEX CONCURRENTLY não pode rodar dentro de transação
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_observacao_processo',
+            'observacoes',
+            ['numero_processo'],
+            postgresql_where=sa.text('deletado_em IS NULL'),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'idx_observacao_usuario',
+            'observacoes',
+            ['usuario'],
+            postgresql_where=sa.text('deletado_em IS NULL'),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
 
 
 def downgrade() -> None:
-    op.drop_index('idx_observacao_usuario', table_name='observacoes')
-    op.drop_index('idx_observacao_processo', table_name='observacoes')
+    with op.get_context().autocommit_block():
+        op.drop_index('idx_observacao_usuario', table_name='observacoes', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('idx_observacao_processo', table_name='observacoes', postgresql_concurrently=True, if_exists=True)
     op.drop_table('observacoes')
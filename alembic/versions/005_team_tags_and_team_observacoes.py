@@ -18,7 +18,7 @@ branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
 
-def upgrade() -> None:
+def _create_tables() -> None:
     # --- team_tags ---
     op.create_table(
         'team_tags',
@@ -34,20 +34,6 @@ def upgrade() -> None:
         comment='Tags de equipe para rotular processos no kanban'
     )
 
-    op.create_index(
-        'uq_team_tag_equipe_nome',
-        'team_tags',
-        ['equipe_id', 'nome'],
-        unique=True,
-        postgresql_where=sa.text('deletado_em IS NULL')
-    )
-    op.create_index(
-        'idx_team_tag_equipe',
-        'team_tags',
-        ['equipe_id'],
-        postgresql_where=sa.text('deletado_em IS NULL')
-    )
-
     # --- processo_team_tags ---
     op.create_table(
         'processo_team_tags',
@@ -61,41 +47,75 @@ def upgrade() -> None:
         comment='Associacao entre processos e tags de equipe'
     )
 
+    # --- observacoes: add equipe_id ---
+    op.add_column(
+        'observacoes',
+        sa.Column('equipe_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('equipes.id', ondelete='SET NULL'), nullable=True),
+    )
+
+
+def _create_indexes() -> None:
+    op.create_index(
+        'uq_team_tag_equipe_nome',
+        'team_tags',
+        ['equipe_id', 'nome'],
+        unique=True,
+        postgresql_where=sa.text('deletado_em IS NULL'),
+        postgresql_concurrently=True,
+        if_not_exists=True,
+    )
+    op.create_index(
+        'idx_team_tag_equipe',
+        'team_tags',
+        ['equipe_id'],
+        postgresql_where=sa.text('deletado_em IS NULL'),
+        postgresql_concurrently=True,
+        if_not_exists=True,
+    )
     op.create_index(
         'uq_processo_team_tag',
         'processo_team_tags',
         ['team_tag_id', 'numero_processo'],
         unique=True,
-        postgresql_where=sa.text('deletado_em IS NULL')
+        postgresql_where=sa.text('deletado_em IS NULL'),
+        postgresql_concurrently=True,
+        if_not_exists=True,
     )
     op.create_index(
         'idx_processo_team_tag_numero',
         'processo_team_tags',
         ['numero_processo'],
-        postgresql_where=sa.text('deletado_em IS NULL')
-    )
-
-    # --- observacoes: add equipe_id ---
-    op.add_column(
-        'observacoes',
-        sa.Column('equipe_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('equipes.id', ondelete='SET NULL'), nullable=True),
+        postgresql_where=sa.text('deletado_em IS NULL'),
+        postgresql_concurrently=True,
+        if_not_exists=True,
     )
     op.create_index(
         'idx_observacao_equipe',
         'observacoes',
         ['equipe_id'],
-        postgresql_where=sa.text('deletado_em IS NULL AND equipe_id IS NOT NULL')
+        postgresql_where=sa.text('deletado_em IS NULL AND equipe_id IS NOT NULL'),
+        postgresql_concurrently=True,
+        if_not_exists=True,
     )
 
 
+def upgrade() -> None:
+    # Todas as tabelas primeiro, na transação da migration; os índices vêm
+    # depois, num único bloco: CREATE INDEX CONCURRENTLY não pode rodar dentro
+    # de transação, e autocommit_block() faz COMMIT do DDL anterior.
+    _create_tables()
+    with op.get_context().autocommit_block():
+        _create_indexes()
+
+
 def downgrade() -> None:
-    op.drop_index('idx_observacao_equipe', table_name='observacoes')
-    op.drop_column('observacoes', 'equipe_id')
+    with op.get_context().autocommit_block():
+        op.drop_index('idx_observacao_equipe', table_name='observacoes', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('idx_processo_team_tag_numero', table_name='processo_team_tags', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('uq_processo_team_tag', table_name='processo_team_tags', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('idx_team_tag_equipe', table_name='team_tags', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('uq_team_tag_equipe_nome', table_name='team_tags', postgresql_concurrently=True, if_exists=True)
 
-    op.drop_index('idx_processo_team_tag_numero', table_name='processo_team_tags')
-    op.drop_index('uq_processo_team_tag', table_name='processo_team_tags')
+    op.drop_column('observacoes', 'equipe_id')
     op.drop_table('processo_team_tags')
-
-    op.drop_index('idx_team_tag_equipe', table_name='team_tags')
-    op.drop_index('uq_team_tag_equipe_nome', table_name='team_tags')
     op.drop_table('team_tags')
@@ -31,15 +31,20 @@ def upgrade() -> None:
         comment='Entendimentos de processos gerados por IA'
     )
 
-    op.create_index(
-        'idx_entendimento_processo_unique',
-        'processo_entendimentos',
-        ['numero_processo'],
-        unique=True,
-        postgresql_where=sa.text('deletado_em IS NULL'),
-    )
+    # CREATE INDEX CONCURRENTLY não pode rodar dentro de transação
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_entendimento_processo_unique',
+            'processo_entendimentos',
+            ['numero_processo'],
+            unique=True,
+            postgresql_where=sa.text('deletado_em IS NULL'),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
 
 
 def downgrade() -> None:
-    op.drop_index('idx_entendimento_processo_unique', table_name='processo_entendimentos')
+    with op.get_context().autocommit_block():
+        op.drop_index('idx_entendimento_processo_unique', table_name='processo_entendimentos', postgresql_concurrently=True, if_exists=True)
     op.drop_table('processo_entendimentos')
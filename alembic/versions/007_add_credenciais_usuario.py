@@ -33,15 +33,20 @@ def upgrade() -> None:
         comment='Credenciais SEI criptografadas por usuário'
     )
 
-    op.create_index(
-        'idx_credencial_id_pessoa_unique',
-        'credenciais_usuario',
-        ['id_pessoa'],
-        unique=True,
-        postgresql_where=sa.text('deletado_em IS NULL'),
-    )
+    # CREATE INDEX CONCURRENTLY não pode rodar dentro de transação
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_credencial_id_pessoa_unique',
+            'credenciais_usuario',
+            ['id_pessoa'],
+            unique=True,
+            postgresql_where=sa.text('deletado_em IS NULL'),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
 
 
 def downgrade() -> None:
-    op.drop_index('idx_credencial_id_pessoa_unique', table_name='credenciais_usuario')
+    with op.get_context().autocommit_block():
+        op.drop_index('idx_credencial_id_pessoa_unique', table_name='credenciais_usuario', postgresql_concurrently=True, if_exists=True)
     op.drop_table('credenciais_usuario')
@@ -43,14 +43,19 @@ def upgrade() -> None:
     )
 
     # 3. Índice para buscas por escopo + processo
-    op.create_index(
-        'idx_observacao_escopo',
-        'observacoes',
-        ['numero_processo', 'escopo'],
-        postgresql_where=sa.text("deletado_em IS NULL"),
-    )
+    #    (CONCURRENTLY não bloqueia escritas, mas exige rodar fora de transação)
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_observacao_escopo',
+            'observacoes',
+            ['numero_processo', 'escopo'],
+            postgresql_where=sa.text("deletado_em IS NULL"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
 
 
 def downgrade() -> None:
-    op.drop_index('idx_observacao_escopo', table_name='observacoes')
+    with op.get_context().autocommit_block():
+        op.drop_index('idx_observacao_escopo', table_name='observacoes', postgresql_concurrently=True, if_exists=True)
     op.drop_column('observacoes', 'escopo')
@@ -0,0 +1,67 @@
+"""use time-ordered uuidv7() as primary key default
+
+Revision ID: 015_uuidv7_defaults
+Revises: b7c8d9e0f1a2
+Create Date: 2026-10-16
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '015_uuidv7_defaults'
+down_revision: Union[str, None] = 'b7c8d9e0f1a2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Tabelas cujo id passa a ser gerado por uuidv7()
+TABLES = (
+    'equipes',
+    'equipe_membros',
+    'tags',
+    'processos_salvos',
+    'compartilhamentos',
+    'observacoes',
+    'team_tags',
+    'processo_team_tags',
+    'processo_entendimentos',
+    'credenciais_usuario',
+)
+
+
+def upgrade() -> None:
+    # UUIDv7: 48 bits de timestamp em ms + bits aleatórios. Inserts ficam
+    # sequenciais no B-tree da PK (menos page splits que gen_random_uuid()).
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION uuidv7() RETURNS uuid AS $$
+            SELECT encode(
+                set_bit(
+                    set_bit(
+                        overlay(
+                            uuid_send(gen_random_uuid())
+                            PLACING substring(int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint) FROM 3)
+                            FROM 1 FOR 6
+                        ),
+                        52, 1
+                    ),
+                    53, 1
+                ),
+                'hex'
+            )::uuid;
+        $$ LANGUAGE sql VOLATILE
+        """
+    )
+
+    for table in TABLES:
+        op.alter_column(table, 'id', server_default=sa.text("uuidv7()"))
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.alter_column(table, 'id', server_default=sa.text("gen_random_uuid()"))
+
+    op.execute("DROP FUNCTION IF EXISTS uuidv7()")
+
@@ -0,0 +1,46 @@
+"""drop single-column indexes covered by composite uniques
+
+Revision ID: 016_drop_redundant_indexes
+Revises: 015_uuidv7_defaults
+Create Date: 2026-10-16
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '016_drop_redundant_indexes'
+down_revision: Union[str, None] = '015_uuidv7_defaults'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (índice redundante, tabela, coluna) — a coluna é o prefixo do índice único:
+#   idx_tag_usuario        ⊂ uq_tag_usuario_nome (usuario, nome)
+#   idx_membro_equipe      ⊂ uq_equipe_membro_usuario (equipe_id, usuario)
+#   idx_processo_salvo_tag ⊂ uq_processo_salvo_tag_numero (tag_id, numero_processo)
+REDUNDANT_INDEXES = (
+    ('idx_tag_usuario', 'tags', 'usuario'),
+    ('idx_membro_equipe', 'equipe_membros', 'equipe_id'),
+    ('idx_processo_salvo_tag', 'processos_salvos', 'tag_id'),
+)
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in REDUNDANT_INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, column in REDUNDANT_INDEXES:
+            op.create_index(
+                name,
+                table,
+                [column],
+                postgresql_where=sa.text('deletado_em IS NULL'),
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
@@ -0,0 +1,46 @@
+"""narrow compartilhamento destino indexes to non-null destinations
+
+Revision ID: 017_compartilhamento_partial_destino
+Revises: 016_drop_redundant_indexes
+Create Date: 2026-10-16
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '017_compartilhamento_partial_destino'
+down_revision: Union[str, None] = '016_drop_redundant_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# ck_compartilhamento_destino_exclusivo garante que só um destino é preenchido,
+# então cada índice só precisa das linhas em que a sua coluna não é NULL.
+DESTINO_INDEXES = (
+    ('idx_compartilhamento_usuario_destino', 'usuario_destino'),
+    ('idx_compartilhamento_equipe_destino', 'equipe_destino_id'),
+)
+
+
+def _recreate(where: str) -> None:
+    with op.get_context().autocommit_block():
+        for name, column in DESTINO_INDEXES:
+            op.drop_index(name, table_name='compartilhamentos', postgresql_concurrently=True, if_exists=True)
+            op.create_index(
+                name,
+                'compartilhamentos',
+                [column],
+                postgresql_where=sa.text(where.format(column=column)),
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def upgrade() -> None:
+    _recreate("deletado_em IS NULL AND {column} IS NOT NULL")
+
+
+def downgrade() -> None:
+    _recreate("deletado_em IS NULL")
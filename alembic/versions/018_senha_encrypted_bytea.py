@@ -0,0 +1,41 @@
+"""store credenciais_usuario.senha_encrypted as BYTEA
+
+Revision ID: 018_senha_encrypted_bytea
+Revises: 017_compartilhamento_partial_destino
+Create Date: 2026-10-16
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '018_senha_encrypted_bytea'
+down_revision: Union[str, None] = '017_compartilhamento_partial_destino'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # O token Fernet é base64 url-safe; decode() do Postgres só aceita o
+    # alfabeto padrão, por isso o translate('-_', '+/') antes de decodificar.
+    op.add_column('credenciais_usuario', sa.Column('senha_encrypted_bin', sa.LargeBinary(), nullable=True))
+    op.execute(
+        "UPDATE credenciais_usuario "
+        "SET senha_encrypted_bin = decode(translate(senha_encrypted, '-_', '+/'), 'base64')"
+    )
+    op.alter_column('credenciais_usuario', 'senha_encrypted_bin', nullable=False)
+    op.drop_column('credenciais_usuario', 'senha_encrypted')
+    op.alter_column('credenciais_usuario', 'senha_encrypted_bin', new_column_name='senha_encrypted')
+
+
+def downgrade() -> None:
+    op.add_column('credenciais_usuario', sa.Column('senha_encrypted_txt', sa.Text(), nullable=True))
+    op.execute(
+        "UPDATE credenciais_usuario "
+        "SET senha_encrypted_txt = translate(encode(senha_encrypted, 'base64'), E'+/\\n', '-_')"
+    )
+    op.alter_column('credenciais_usuario', 'senha_encrypted_txt', nullable=False)
+    op.drop_column('credenciais_usuario', 'senha_encrypted')
+    op.alter_column('credenciais_usuario', 'senha_encrypted_txt', new_column_name='senha_encrypted')
@@ -0,0 +1,49 @@
+"""add BRIN indexes on criado_em for append-only tables
+
+Revision ID: 019_brin_criado_em
+Revises: 018_senha_encrypted_bytea
+Create Date: 2026-10-16
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '019_brin_criado_em'
+down_revision: Union[str, None] = '018_senha_encrypted_bytea'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Tabelas só de inserção: criado_em acompanha a ordem física das linhas, então
+# um BRIN (poucos KB) basta para filtros por intervalo de tempo. Antes de depender
+# dele, conferir pg_stats.correlation de criado_em (próxima de 1).
+# historico_pesquisas fica de fora: já tem idx_historico_criado_em (btree).
+BRIN_TABLES = (
+    'observacoes',
+    'processos_salvos',
+    'processo_team_tags',
+    'processo_entendimentos',
+)
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table in BRIN_TABLES:
+            op.create_index(
+                f'brin_{table}_criado_em',
+                table,
+                ['criado_em'],
+                postgresql_using='brin',
+                postgresql_with={'pages_per_range': 32},
+                postgresql_where=sa.text('deletado_em IS NULL'),
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table in BRIN_TABLES:
+            op.drop_index(f'brin_{table}_criado_em', table_name=table, postgresql_concurrently=True, if_exists=True)
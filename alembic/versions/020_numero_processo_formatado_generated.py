@@ -0,0 +1,50 @@
+"""derive numero_processo_formatado with a generated column
+
+Revision ID: 020_numero_formatado_generated
+Revises: 019_brin_criado_em
+Create Date: 2026-10-16
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '020_numero_formatado_generated'
+down_revision: Union[str, None] = '019_brin_criado_em'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ('historico_pesquisas', 'processos_salvos')
+
+# Mesma receita do backfill da migration 002: só números de 17 dígitos são formatados
+FORMATADO_EXPR = (
+    "CASE WHEN numero_processo ~ '^[0-9]{17}$' THEN "
+    "substring(numero_processo from 1 for 5) || '.' || "
+    "substring(numero_processo from 6 for 6) || '/' || "
+    "substring(numero_processo from 12 for 4) || '-' || "
+    "substring(numero_processo from 16 for 2) END"
+)
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.drop_column(table, 'numero_processo_formatado')
+        op.add_column(
+            table,
+            sa.Column(
+                'numero_processo_formatado',
+                sa.String(50),
+                sa.Computed(FORMATADO_EXPR, persisted=True),
+                nullable=True,
+            ),
+        )
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.add_column(table, sa.Column('numero_processo_formatado_tmp', sa.String(50), nullable=True))
+        op.execute(f"UPDATE {table} SET numero_processo_formatado_tmp = numero_processo_formatado")
+        op.drop_column(table, 'numero_processo_formatado')
+        op.alter_column(table, 'numero_processo_formatado_tmp', new_column_name='numero_processo_formatado')
@@ -0,0 +1,126 @@
+"""enforce digits-only numero_processo with CHECK constraints
+
+Revision ID: 021_numero_processo_digits
+Revises: 020_numero_formatado_generated
+Create Date: 2026-10-16
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '021_numero_processo_digits'
+down_revision: Union[str, None] = '020_numero_formatado_generated'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = (
+    'historico_pesquisas',
+    'processos_salvos',
+    'processo_team_tags',
+    'observacoes',
+    'processo_entendimentos',
+)
+
+# Índices únicos parciais (deletado_em IS NULL) que incluem numero_processo:
+# tabela -> colunas que formam a chave junto com o número
+#   uq_processo_salvo_tag_numero     (tag_id, numero_processo)
+#   uq_processo_team_tag             (team_tag_id, numero_processo)
+#   idx_entendimento_processo_unique (numero_processo)
+UNIQUE_KEYS = {
+    'processos_salvos': ('tag_id',),
+    'processo_team_tags': ('team_tag_id',),
+    'processo_entendimentos': (),
+}
+
+# Linhas atualizadas por transação — mantém locks e WAL limitados por lote
+BATCH_SIZE = 5000
+
+_NUMERO_NORMALIZADO = "regexp_replace(numero_processo, '[^0-9]', '', 'g')"
+
+
+def _constraint_name(table: str) -> str:
+    return f'ck_{table}_numero_processo_digits'
+
+
+def _soft_delete_colisoes(conn, table: str, key_columns: tuple[str, ...]) -> None:
+    """
+    O kanban gravava o número formatado, então pode existir uma linha ativa
+    formatada e outra só com dígitos para o mesmo processo; normalizar as duas
+    violaria o índice único. Mantém a linha já normalizada (a que a API lê) ou,
+    na falta dela, a mais recente, e faz soft delete das demais.
+    """
+    particao = ", ".join((*key_columns, _NUMERO_NORMALIZADO))
+    conn.execute(
+        sa.text(
+            f"UPDATE {table} SET deletado_em = now() "
+            "WHERE id IN ("
+            "  SELECT id FROM ("
+            "    SELECT id, row_number() OVER ("
+            f"      PARTITION BY {particao} "
+            "      ORDER BY numero_processo ~ '[^0-9]', criado_em DESC, id DESC"
+            "    ) AS posicao"
+            f"    FROM {table} "
+            "    WHERE deletado_em IS NULL "
+            f"      AND {_NUMERO_NORMALIZADO} IN ("
+            f"        SELECT {_NUMERO_NORMALIZADO} FROM {table} "
+            "        WHERE deletado_em IS NULL AND numero_processo ~ '[^0-9]'"
+            "      )"
+            "  ) duplicadas "
+            "  WHERE posicao > 1"
+            ")"
+        )
+    )
+
+
+def _normalize_in_batches(conn, table: str) -> None:
+    """Remove pontuação que tenha escapado da normalização feita pela API."""
+    while True:
+        result = conn.execute(
+            sa.text(
+                f"UPDATE {table} "
+                f"SET numero_processo = {_NUMERO_NORMALIZADO} "
+                "WHERE ctid IN ("
+                f"  SELECT ctid FROM {table} "
+                "  WHERE numero_processo ~ '[^0-9]' "
+                "  LIMIT :batch_size"
+                ")"
+            ),
+            {"batch_size": BATCH_SIZE},
+        )
+        if result.rowcount == 0:
+            break
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+
+    # NOT VALID só segura o ACCESS EXCLUSIVE pelo instante do ALTER e já vale
+    # para novas linhas; o VALIDATE, em outra transação, varre a tabela com
+    # SHARE UPDATE EXCLUSIVE, sem bloquear leituras nem escritas.
+    # Cada passo é idempotente: o autocommit_block não desfaz o que já rodou,
+    # então uma execução interrompida precisa poder ser repetida.
+    with op.get_context().autocommit_block():
+        for table in TABLES:
+            if table in UNIQUE_KEYS:
+                _soft_delete_colisoes(conn, table, UNIQUE_KEYS[table])
+            _normalize_in_batches(conn, table)
+            op.execute(
+                "DO $$ BEGIN "
+                "IF NOT EXISTS ("
+                "SELECT 1 FROM pg_constraint "
+                f"WHERE conname = '{_constraint_name(table)}' AND conrelid = '{table}'::regclass"
+                ") THEN "
+                f"ALTER TABLE {table} ADD CONSTRAINT {_constraint_name(table)} "
+                "CHECK (numero_processo ~ '^[0-9]+$') NOT VALID; "
+                "END IF; "
+                "END $$"
+            )
+            op.execute(f"ALTER TABLE {table} VALIDATE CONSTRAINT {_constraint_name(table)}")
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.execute(f"ALTER TABLE {table} DROP CONSTRAINT IF EXISTS {_constraint_name(table)}")
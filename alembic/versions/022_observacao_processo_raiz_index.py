@@ -0,0 +1,45 @@
+"""index root observacoes per processo in listing order
+
+Revision ID: 022_observacao_processo_raiz
+Revises: 021_numero_processo_digits
+Create Date: 2026-10-16
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '022_observacao_processo_raiz'
+down_revision: Union[str, None] = '021_numero_processo_digits'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        # Listagem por processo: só observações raiz, ordenadas por criado_em
+        op.create_index(
+            'idx_observacao_processo_raiz',
+            'observacoes',
+            ['numero_processo', 'criado_em'],
+            postgresql_where=sa.text('deletado_em IS NULL AND parent_id IS NULL'),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        # Prefixo de idx_observacao_escopo (numero_processo, escopo)
+        op.drop_index('idx_observacao_processo', table_name='observacoes', postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_observacao_processo',
+            'observacoes',
+            ['numero_processo'],
+            postgresql_where=sa.text('deletado_em IS NULL'),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index('idx_observacao_processo_raiz', table_name='observacoes', postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,37 @@
+"""make link-table foreign keys DEFERRABLE INITIALLY IMMEDIATE
+
+Revision ID: 023_deferrable_foreign_keys
+Revises: 022_observacao_processo_raiz
+Create Date: 2026-10-16
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '023_deferrable_foreign_keys'
+down_revision: Union[str, None] = '022_observacao_processo_raiz'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Nomes padrão do Postgres (<tabela>_<coluna>_fkey): as FKs de 003/005 não têm nome explícito.
+# INITIALLY IMMEDIATE mantém o comportamento atual; cargas em lote podem usar
+# SET CONSTRAINTS ALL DEFERRED e checar tudo no COMMIT.
+FOREIGN_KEYS = (
+    ('equipe_membros', 'equipe_membros_equipe_id_fkey'),
+    ('processos_salvos', 'processos_salvos_tag_id_fkey'),
+    ('processo_team_tags', 'processo_team_tags_team_tag_id_fkey'),
+    ('observacoes', 'observacoes_equipe_id_fkey'),
+)
+
+
+def upgrade() -> None:
+    # ALTER CONSTRAINT só troca o modo de checagem: não revalida as linhas existentes
+    for table, constraint in FOREIGN_KEYS:
+        op.execute(f"ALTER TABLE {table} ALTER CONSTRAINT {constraint} DEFERRABLE INITIALLY IMMEDIATE")
+
+
+def downgrade() -> None:
+    for table, constraint in FOREIGN_KEYS:
+        op.execute(f"ALTER TABLE {table} ALTER CONSTRAINT {constraint} NOT DEFERRABLE")
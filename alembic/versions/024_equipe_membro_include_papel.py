@@ -0,0 +1,47 @@
+"""cover papel in the active equipe_membros unique index
+
+Revision ID: 024_equipe_membro_include_papel
+Revises: 023_deferrable_foreign_keys
+Create Date: 2026-10-16
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '024_equipe_membro_include_papel'
+down_revision: Union[str, None] = '023_deferrable_foreign_keys'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _recriar_uq_equipe_membro_usuario(include: list[str] | None) -> None:
+    """
+    Recria uq_equipe_membro_usuario sem bloquear escritas: cria o novo índice
+    com nome temporário, remove o antigo e renomeia (CONCURRENTLY não suporta
+    substituição in-place).
+    """
+    kwargs = {'postgresql_include': include} if include else {}
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'uq_equipe_membro_usuario_new',
+            'equipe_membros',
+            ['equipe_id', 'usuario'],
+            unique=True,
+            postgresql_where=sa.text('deletado_em IS NULL'),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+            **kwargs,
+        )
+        op.drop_index('uq_equipe_membro_usuario', table_name='equipe_membros', postgresql_concurrently=True, if_exists=True)
+        op.execute('ALTER INDEX uq_equipe_membro_usuario_new RENAME TO uq_equipe_membro_usuario')
+
+
+def upgrade() -> None:
+    _recriar_uq_equipe_membro_usuario(['papel'])
+
+
+def downgrade() -> None:
+    _recriar_uq_equipe_membro_usuario(None)
@@ -0,0 +1,35 @@
+"""index processos_salvos by tag in listing order
+
+Revision ID: 025_processo_salvo_tag_criado
+Revises: 024_equipe_membro_include_papel
+Create Date: 2026-10-16
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '025_processo_salvo_tag_criado'
+down_revision: Union[str, None] = '024_equipe_membro_include_papel'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        # Listagem de um grupo: WHERE tag_id = ? ORDER BY criado_em DESC
+        op.create_index(
+            'idx_processo_salvo_tag_criado',
+            'processos_salvos',
+            ['tag_id', sa.text('criado_em DESC')],
+            postgresql_where=sa.text('deletado_em IS NULL'),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('idx_processo_salvo_tag_criado', table_name='processos_salvos', postgresql_concurrently=True, if_exists=True)
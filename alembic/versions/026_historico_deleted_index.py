@@ -0,0 +1,35 @@
+"""index soft-deleted historico_pesquisas per usuario
+
+Revision ID: 026_historico_deleted_index
+Revises: 025_processo_salvo_tag_criado
+Create Date: 2026-10-16
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '026_historico_deleted_index'
+down_revision: Union[str, None] = '025_processo_salvo_tag_criado'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        # Complemento dos índices "deletado_em IS NULL": usado na restauração
+        op.create_index(
+            'idx_historico_usuario_deletado',
+            'historico_pesquisas',
+            ['usuario', 'deletado_em'],
+            postgresql_where=sa.text('deletado_em IS NOT NULL'),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('idx_historico_usuario_deletado', table_name='historico_pesquisas', postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,44 @@
+"""use a hash index for historico_pesquisas.numero_processo equality
+
+Revision ID: 027_historico_numero_hash
+Revises: 026_historico_deleted_index
+Create Date: 2026-10-16
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '027_historico_numero_hash'
+down_revision: Union[str, None] = '026_historico_deleted_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_historico_numero_processo_hash',
+            'historico_pesquisas',
+            ['numero_processo'],
+            postgresql_using='hash',
+            postgresql_where=sa.text('deletado_em IS NULL'),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index('idx_historico_numero_processo', table_name='historico_pesquisas', postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_historico_numero_processo',
+            'historico_pesquisas',
+            ['numero_processo'],
+            postgresql_where=sa.text('deletado_em IS NULL'),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index('idx_historico_numero_processo_hash', table_name='historico_pesquisas', postgresql_concurrently=True, if_exists=True)
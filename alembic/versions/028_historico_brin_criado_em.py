@@ -0,0 +1,48 @@
+"""replace idx_historico_criado_em with a BRIN index
+
+Revision ID: 028_historico_brin_criado_em
+Revises: 027_historico_numero_hash
+Create Date: 2026-10-16
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '028_historico_brin_criado_em'
+down_revision: Union[str, None] = '027_historico_numero_hash'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Sozinho, criado_em só é filtrado por intervalo (analytics: criado_em >= desde);
+# "WHERE usuario = ? ORDER BY criado_em DESC" continua em idx_historico_usuario_criado.
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'brin_historico_pesquisas_criado_em',
+            'historico_pesquisas',
+            ['criado_em'],
+            postgresql_using='brin',
+            postgresql_with={'pages_per_range': 32},
+            postgresql_where=sa.text('deletado_em IS NULL'),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index('idx_historico_criado_em', table_name='historico_pesquisas', postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_historico_criado_em',
+            'historico_pesquisas',
+            [sa.text('criado_em DESC')],
+            postgresql_where=sa.text('deletado_em IS NULL'),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index('brin_historico_pesquisas_criado_em', table_name='historico_pesquisas', postgresql_concurrently=True, if_exists=True)
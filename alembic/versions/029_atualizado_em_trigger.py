@@ -0,0 +1,65 @@
+"""maintain atualizado_em with a BEFORE UPDATE trigger
+
+Revision ID: 029_atualizado_em_trigger
+Revises: 028_historico_brin_criado_em
+Create Date: 2026-10-16
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '029_atualizado_em_trigger'
+down_revision: Union[str, None] = '028_historico_brin_criado_em'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Tabelas com coluna atualizado_em (models com server_onupdate=FetchedValue())
+TABLES = (
+    'configuracao_horas_andamento',
+    'credenciais_usuario',
+    'equipes',
+    'fluxos',
+    'fluxo_edges',
+    'fluxo_nodes',
+    'fluxo_processos',
+    'historico_pesquisas',
+    'observacoes',
+    'papeis',
+    'processo_entendimentos',
+    'processo_situacoes',
+    'tags',
+    'team_tags',
+    'usuario_papel',
+)
+
+
+def upgrade() -> None:
+    # O banco passa a preencher atualizado_em em todo UPDATE, inclusive nos
+    # UPDATE em lote (soft delete em massa), sem o valor trafegar do cliente.
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION set_atualizado_em() RETURNS trigger AS $$
+        BEGIN
+            NEW.atualizado_em = now();
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+
+    for table in TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_atualizado_em ON {table}")
+        op.execute(
+            f"CREATE TRIGGER trg_{table}_atualizado_em "
+            f"BEFORE UPDATE ON {table} "
+            f"FOR EACH ROW EXECUTE FUNCTION set_atualizado_em()"
+        )
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_atualizado_em ON {table}")
+
+    op.execute("DROP FUNCTION IF EXISTS set_atualizado_em()")
@@ -0,0 +1,45 @@
+"""drop single-column indexes covered by composite indexes
+
+Revision ID: 030_drop_prefix_indexes
+Revises: 029_atualizado_em_trigger
+Create Date: 2026-10-16
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '030_drop_prefix_indexes'
+down_revision: Union[str, None] = '029_atualizado_em_trigger'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (índice redundante, tabela, coluna, predicado) — a coluna é o prefixo de um
+# índice composto com o mesmo predicado:
+#   idx_historico_usuario ⊂ idx_historico_usuario_criado (usuario, criado_em DESC)
+#   idx_tags_equipe_id    ⊂ uq_tags_equipe_nome (equipe_id, nome)
+REDUNDANT_INDEXES = (
+    ('idx_historico_usuario', 'historico_pesquisas', 'usuario', 'deletado_em IS NULL'),
+    ('idx_tags_equipe_id', 'tags', 'equipe_id', 'deletado_em IS NULL AND equipe_id IS NOT NULL'),
+)
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in REDUNDANT_INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, column, where in REDUNDANT_INDEXES:
+            op.create_index(
+                name,
+                table,
+                [column],
+                postgresql_where=sa.text(where),
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
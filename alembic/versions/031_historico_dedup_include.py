@@ -0,0 +1,56 @@
+"""cover criado_em and id in the historico dedup index
+
+Revision ID: 031_historico_dedup_include
+Revises: 030_drop_prefix_indexes
+Create Date: 2026-10-16
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '031_historico_dedup_include'
+down_revision: Union[str, None] = '030_drop_prefix_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _recriar_idx_historico_usuario_processo_unidade(include: list[str] | None) -> None:
+    """
+    Recria idx_historico_usuario_processo_unidade sem bloquear escritas: cria o
+    novo índice com nome temporário, remove o antigo e renomeia.
+    """
+    kwargs = {'postgresql_include': include} if include else {}
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_historico_usuario_processo_unidade_new',
+            'historico_pesquisas',
+            ['usuario', 'numero_processo', 'id_unidade'],
+            postgresql_where=sa.text('deletado_em IS NULL'),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+            **kwargs,
+        )
+        op.drop_index(
+            'idx_historico_usuario_processo_unidade',
+            table_name='historico_pesquisas',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.execute(
+            'ALTER INDEX idx_historico_usuario_processo_unidade_new '
+            'RENAME TO idx_historico_usuario_processo_unidade'
+        )
+        # Atualiza o visibility map e pg_stats para o planner usar o Index Only Scan
+        op.execute('VACUUM ANALYZE historico_pesquisas')
+
+
+def upgrade() -> None:
+    # INCLUDE (criado_em, id): a leitura de dedup vira Index Only Scan
+    _recriar_idx_historico_usuario_processo_unidade(['criado_em', 'id'])
+
+
+def downgrade() -> None:
+    _recriar_idx_historico_usuario_processo_unidade(None)
@@ -1,14 +1,139 @@
+import asyncio
+import time
+import zlib
+from collections import OrderedDict
+from fnmatch import fnmatchcase
 import redis.asyncio as aioredis
 from redis.exceptions import ConnectionError, TimeoutError
 import orjson
 import logging
-from typing import Optional, Any
+from typing import Optional, Any, Awaitable, Callable
 from .config import settings
 from .normalization import normalizar_numero_processo
 from .telemetry import cache_hit_counter, cache_miss_counter, cache_set_failure_counter
 
 logger = logging.getLogger(__name__)
 
+# Intervalo entre tentativas de reconexão quando o Redis cai
+RECONNECT_INTERVAL_SECONDS = 5
+
+# Número de UNLINKs acumulados no pipeline antes de cada execute() em clear_pattern
+CLEAR_PATTERN_BATCH_SIZE = 500
+
+# Cache local (L1) em processo, na frente do Redis. Só vale para prefixos cujo
+# valor não muda depois de gerado (resumos de documento); remoções (reset pelo
+# admin) são propagadas aos L1 dos outros workers pelo canal de invalidação.
+LOCAL_CACHE_PREFIXES = ("documento",)
+LOCAL_CACHE_MAXSIZE = 4096
+LOCAL_CACHE_TTL_SECONDS = 300
+
+# Canal pub/sub de invalidação do L1: mensagens "k:<chave>" ou "p:<padrão>"
+L1_INVALIDATION_CHANNEL = "cache:l1:invalidate"
+
+# Fila de escrita de set(): SETEX enfileirados e gravados em pipeline por uma task
+WRITE_QUEUE_MAXSIZE = 10_000
+WRITE_BATCH_SIZE = 128
+# Quanto uma remoção espera os SETEX já enfileirados antes de enviar o DEL
+WRITE_FLUSH_TIMEOUT_SECONDS = 5
+
+# Lock de get_or_set: a factory típica é uma chamada ao LLM (até OPENAI_TIMEOUT),
+# então expiração e espera ficam acima dela. O dono renova o lock enquanto a
+# factory roda (download do SEI + LLM podem passar disso); se o worker morrer,
+# o lock expira sozinho.
+GET_OR_SET_LOCK_TIMEOUT_SECONDS = settings.OPENAI_TIMEOUT + 60
+GET_OR_SET_LOCK_WAIT_SECONDS = settings.OPENAI_TIMEOUT + 60
+
+
+# Prefixo de 1 byte com o tipo do valor armazenado. Escalares (str, int, bool)
+# não passam pelo orjson. Nenhuma das tags é um primeiro byte válido de JSON,
+# então valores antigos, gravados sem prefixo, continuam sendo lidos como JSON.
+_TAG_JSON = b"J"
+_TAG_STR = b"S"
+_TAG_INT = b"I"
+_TAG_BOOL = b"B"
+# Payload grande (resumos, conteúdo de documentos): zlib sobre o valor já com prefixo
+_TAG_ZLIB = b"Z"
+COMPRESS_MIN_BYTES = 16 * 1024
+
+
+def _serializar(value: Any) -> bytes:
+    """Serializa um valor para o Redis com prefixo de tipo"""
+    if isinstance(value, bool):
+        return _TAG_BOOL + (b"1" if value else b"0")
+    if isinstance(value, int) and -(1 << 63) <= value < (1 << 63):
+        return _TAG_INT + value.to_bytes(8, "little", signed=True)
+    if isinstance(value, str):
+        payload = _TAG_STR + value.encode()
+    else:
+        payload = _TAG_JSON + orjson.dumps(value)
+    if len(payload) >= COMPRESS_MIN_BYTES:
+        # Nível 1: texto comprime bem mesmo no nível mais rápido
+        return _TAG_ZLIB + zlib.compress(payload, 1)
+    return payload
+
+
+def _desserializar(raw: bytes) -> Any:
+    """Inverte _serializar a partir do primeiro byte"""
+    tag = raw[:1]
+    if tag == _TAG_JSON:
+        return orjson.loads(raw[1:])
+    if tag == _TAG_STR:
+        return raw[1:].decode()
+    if tag == _TAG_INT:
+        return int.from_bytes(raw[1:], "little", signed=True)
+    if tag == _TAG_BOOL:
+        return raw[1:] == b"1"
+    if tag == _TAG_ZLIB:
+        return _desserializar(zlib.decompress(raw[1:]))
+    return orjson.loads(raw)
+
+
+class _LocalTTLCache:
+    """
+    LRU limitado com expiração por entrada, guardando o valor serializado (bytes)
+    para que chamadores não compartilhem objetos mutáveis entre requisições
+    """
+    def __init__(self, maxsize: int, ttl: int):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[bytes]:
+        item = self._data.get(key)
+        if item is None:
+            self.misses += 1
+            return None
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: str, value: bytes, ttl: Optional[int] = None):
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def delete(self, key: str):
+        self._data.pop(key, None)
+
+    def delete_pattern(self, pattern: str):
+        for key in [k for k in self._data if fnmatchcase(k, pattern)]:
+            del self._data[key]
+
+    def clear(self):
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
 
 class RedisCache:
     """
@@ -16,66 +141,245 @@ class RedisCache:
     """
     def __init__(self):
         self.redis_client = None
+        self._pool = None
         self._connected = False
+        self._reconnect_task: Optional[asyncio.Task] = None
+        self._local = _LocalTTLCache(LOCAL_CACHE_MAXSIZE, LOCAL_CACHE_TTL_SECONDS)
+        # Itens (chave, valor, ttl); chave None marca uma barreira (valor é um Future)
+        self._write_q: asyncio.Queue[tuple[Optional[str], Any, int]] = asyncio.Queue(maxsize=WRITE_QUEUE_MAXSIZE)
+        self._writer_task: Optional[asyncio.Task] = None
+        self._invalidation_task: Optional[asyncio.Task] = None
+
+    @staticmethod
+    def _usa_cache_local(key: str) -> bool:
+        return key.split(":", 1)[0] in LOCAL_CACHE_PREFIXES
+
+    def stats(self) -> dict:
+        """
+        Estatísticas do cache local (L1)
 
-    async def _reconnect(self):
-        """Força reconexão fechando o cliente antigo"""
+        Returns:
+            Dicionário com acertos, falhas e tamanho atual do L1
+        """
+        return {
+            "local_hits": self._local.hits,
+            "local_misses": self._local.misses,
+            "local_size": len(self._local),
+            "local_maxsize": self._local.maxsize,
+        }
+
+    async def _disconnect(self):
+        """Fecha o cliente e o pool atuais, ignorando erros"""
         if self.redis_client:
             try:
                 await self.redis_client.close()
             except Exception:
                 pass
+        if self._pool:
+            try:
+                await self._pool.disconnect()
+            except Exception:
+                pass
         self.redis_client = None
+        self._pool = None
         self._connected = False
-        await self.connect()
 
-    async def connect(self):
-        """Conecta ao Redis com tratamento de erros"""
-        if self._connected:
-            return
+    async def _reconnect(self):
+        """Força reconexão fechando o cliente antigo"""
+        await self._disconnect()
+        await self._open()
 
+    async def _open(self) -> bool:
+        """Cria o pool de conexões e valida com um PING"""
         try:
-            # Prepara URL de conexão
-            if settings.REDIS_PASSWORD:
-                redis_url = f"redis://{settings.REDIS_USERNAME}:{settings.REDIS_PASSWORD}@{settings.REDIS_HOST}:{settings.REDIS_PORT}/{settings.REDIS_DB}"
-            else:
-                redis_url = f"redis://{settings.REDIS_HOST}:{settings.REDIS_PORT}/{settings.REDIS_DB}"
-
-            self.redis_client = aioredis.from_url(
-                redis_url,
-                encoding="utf-8",
-                decode_responses=True,
+            # Pool com tamanho fixo: sob carga, requisições esperam até 2s por
+            # uma conexão livre em vez de abrir conexões sem limite.
+            # Valores trafegam como bytes (ver _serializar/_desserializar),
+            # sem decode/encode UTF-8 intermediário no cliente
+            self._pool = aioredis.BlockingConnectionPool.from_url(
+                settings.REDIS_URL,
+                max_connections=settings.REDIS_POOL_SIZE,
+                timeout=2,
+                decode_responses=False,
                 socket_connect_timeout=5,
                 socket_timeout=180,
-                max_connections=20,
+                socket_keepalive=True,
                 health_check_interval=30,
                 retry_on_error=[ConnectionError, TimeoutError],
             )
+            self.redis_client = aioredis.Redis(connection_pool=self._pool)
 
             # Testa a conexão
             await self.redis_client.ping()
             self._connected = True
             logger.info("Conexão com Redis estabelecida com sucesso")
+            if self._invalidation_task is None or self._invalidation_task.done():
+                self._invalidation_task = asyncio.create_task(self._invalidation_loop())
+            return True
         except Exception as e:
-            logger.warning(f"Não foi possível conectar ao Redis: {str(e)}")
-            self.redis_client = None
-            self._connected = False
+            logger.warning("Não foi possível conectar ao Redis: %s", e)
+            await self._disconnect()
+            return False
+
+    async def _reconnect_loop(self):
+        """Tenta reconectar em background até o Redis voltar"""
+        while not self._connected:
+            await asyncio.sleep(RECONNECT_INTERVAL_SECONDS)
+            await self._disconnect()
+            await self._open()
+
+    async def _invalidation_loop(self):
+        """
+        Aplica no L1 deste worker as remoções feitas por qualquer worker
+
+        Ocupa uma conexão do pool enquanto o Redis estiver disponível. O L1 é
+        esvaziado ao (re)inscrever e ao perder a inscrição, pois mensagens
+        publicadas nesse intervalo não chegam.
+        """
+        while True:
+            client = self.redis_client
+            if client is None:
+                await asyncio.sleep(RECONNECT_INTERVAL_SECONDS)
+                continue
+            pubsub = client.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(L1_INVALIDATION_CHANNEL)
+                self._local.clear()
+                while True:
+                    # Timeout curto (abaixo do socket_timeout) mantém o health check ativo
+                    message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=30)
+                    if message is None:
+                        continue
+                    tipo, _, alvo = message["data"].decode().partition(":")
+                    if tipo == "k":
+                        self._local.delete(alvo)
+                    else:
+                        self._local.delete_pattern(alvo)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._local.clear()
+                logger.warning("Inscrição de invalidação do L1 perdida: %s", e)
+                await asyncio.sleep(RECONNECT_INTERVAL_SECONDS)
+            finally:
+                self._local.clear()
+                try:
+                    await pubsub.reset()
+                except Exception:
+                    pass
+
+    async def _publicar_invalidacao(self, mensagem: str):
+        """Propaga a remoção ("k:<chave>" ou "p:<padrão>") aos L1 dos outros workers"""
+        try:
+            await self.redis_client.publish(L1_INVALIDATION_CHANNEL, mensagem)
+        except Exception as e:
+            logger.warning("Erro ao publicar invalidação do L1 (%s): %s", mensagem, e)
+
+    def _mark_unavailable(self):
+        """Marca o Redis como indisponível e agenda a reconexão em background"""
+        self._connected = False
+        if self._reconnect_task is None or self._reconnect_task.done():
+            self._reconnect_task = asyncio.create_task(self._reconnect_loop())
+
+    async def connect(self):
+        """Conecta ao Redis com tratamento de erros"""
+        if self._connected:
+            return
+
+        # Reconexão já em andamento: não bloqueia a requisição esperando o timeout
+        if self._reconnect_task is not None and not self._reconnect_task.done():
+            return
+
+        if not await self._open():
+            self._mark_unavailable()
 
     async def close(self):
         """Fecha a conexão com o Redis"""
-        if self.redis_client:
-            await self.redis_client.close()
-            self._connected = False
+        if self._writer_task is not None:
+            # Dá uma chance para as escritas pendentes antes de derrubar o pool
+            try:
+                await asyncio.wait_for(self._write_q.join(), timeout=5)
+            except asyncio.TimeoutError:
+                logger.warning("Encerrando com %d escritas de cache pendentes", self._write_q.qsize())
+            self._writer_task.cancel()
+            self._writer_task = None
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+            self._reconnect_task = None
+        if self._invalidation_task is not None:
+            self._invalidation_task.cancel()
+            self._invalidation_task = None
+        await self._disconnect()
+
+    async def _write_loop(self):
+        """Drena a fila de escrita, gravando até WRITE_BATCH_SIZE SETEX por round-trip"""
+        while True:
+            batch = [await self._write_q.get()]
+            while len(batch) < WRITE_BATCH_SIZE and not self._write_q.empty():
+                batch.append(self._write_q.get_nowait())
+            writes = [item for item in batch if item[0] is not None]
+            try:
+                if not writes:
+                    continue
+                if self.redis_client is None:
+                    for key, _, _ in writes:
+                        cache_set_failure_counter.add(1, {"cache.key_prefix": key.split(":")[0], "cache.failure_reason": "unavailable"})
+                    continue
+                pipe = self.redis_client.pipeline(transaction=False)
+                for key, value, ttl in writes:
+                    pipe.setex(key, ttl, value)
+                await pipe.execute()
+                logger.debug("[CACHE SET] %d chaves gravadas em lote", len(writes))
+            except Exception as e:
+                logger.warning("Erro ao gravar lote de %d chaves no cache: %s", len(writes), e)
+                self._mark_unavailable()
+                for key, _, _ in writes:
+                    cache_set_failure_counter.add(1, {"cache.key_prefix": key.split(":")[0], "cache.failure_reason": "error"})
+            finally:
+                for key, value, _ in batch:
+                    if key is None and not value.done():
+                        value.set_result(None)
+                    self._write_q.task_done()
+
+    async def _aguardar_escritas_pendentes(self):
+        """
+        Espera os SETEX enfileirados antes desta chamada chegarem ao Redis
+
+        Usado antes de remoções: sem isso um set() anterior ainda na fila seria
+        gravado depois do DEL e devolveria o valor removido.
+        """
+        if self._writer_task is None or self._writer_task.done():
+            if self._write_q.empty():
+                return
+            self._writer_task = asyncio.create_task(self._write_loop())
+        barreira = asyncio.get_running_loop().create_future()
+        try:
+            await asyncio.wait_for(self._write_q.put((None, barreira, 0)), timeout=WRITE_FLUSH_TIMEOUT_SECONDS)
+            await asyncio.wait_for(barreira, timeout=WRITE_FLUSH_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            logger.warning("Timeout aguardando %d escritas de cache pendentes", self._write_q.qsize())
 
     async def is_available(self) -> bool:
-        """Verifica se o Redis está disponível"""
-        if self.redis_client is None:
-            return False
+        """
+        Verifica se o Redis está disponível
+
+        Usa o estado mantido pelas operações (sem PING a cada chamada): erros
+        marcam o cache como indisponível e a reconexão ocorre em background.
+        """
+        return self._connected and self.redis_client is not None
+
+    def _desserializar_valor(self, key: str, value: bytes) -> Any:
+        """
+        Desserializa um valor lido do cache. Valor corrompido ou com tag
+        desconhecida é registrado e tratado como miss (e sai do L1), sem marcar
+        o Redis como indisponível.
+        """
         try:
-            await self.redis_client.ping()
-            return True
-        except Exception:
-            return False
+            return _desserializar(value)
+        except Exception as e:
+            logger.warning("Erro ao desserializar cache para chave %s: %s", key, e)
+            self._local.delete(key)
+            return None
 
     async def get(self, key: str) -> Optional[Any]:
         """
@@ -87,6 +391,13 @@ class RedisCache:
         Returns:
             Valor do cache ou None se não encontrado ou em caso de erro
         """
+        usa_local = self._usa_cache_local(key)
+        if usa_local:
+            value = self._local.get(key)
+            if value is not None:
+                logger.debug("[CACHE HIT L1] Chave: %s", key)
+                return self._desserializar_valor(key, value)
+
         if not self._connected:
             await self.connect()
 
@@ -97,34 +408,84 @@ class RedisCache:
             key_prefix = key.split(":")[0]
             value = await self.redis_client.get(key)
             if value:
-                cache_hit_counter.add(1, {"cache.key_prefix": key_prefix})
-                logger.info(f"[CACHE HIT] Chave: {key}")
-                return orjson.loads(value)
+                resultado = self._desserializar_valor(key, value)
+                if resultado is not None:
+                    cache_hit_counter.add(1, {"cache.key_prefix": key_prefix})
+                    logger.debug("[CACHE HIT] Chave: %s", key)
+                    if usa_local:
+                        self._local.set(key, value)
+                    return resultado
             cache_miss_counter.add(1, {"cache.key_prefix": key_prefix})
-            logger.info(f"[CACHE MISS] Chave: {key}")
+            logger.debug("[CACHE MISS] Chave: %s", key)
             return None
         except (ConnectionError, TimeoutError, OSError) as e:
-            logger.warning(f"Erro de conexão ao obter cache para chave {key}: {str(e)}. Reconectando...")
+            logger.warning("Erro de conexão ao obter cache para chave %s: %s. Reconectando...", key, e)
             try:
                 await self._reconnect()
                 if self.redis_client is None:
                     return None
                 value = await self.redis_client.get(key)
                 if value:
-                    logger.debug(f"[CACHE HIT após reconexão] Chave: {key}")
-                    return orjson.loads(value)
+                    logger.debug("[CACHE HIT após reconexão] Chave: %s", key)
+                    return self._desserializar_valor(key, value)
                 return None
             except Exception:
-                self._connected = False
+                self._mark_unavailable()
                 return None
         except Exception as e:
-            logger.warning(f"Erro ao obter cache para chave {key}: {str(e)}")
-            self._connected = False
+            logger.warning("Erro ao obter cache para chave %s: %s", key, e, exc_info=True)
+            self._mark_unavailable()
             return None
 
     async def set(self, key: str, value: Any, ttl: int = 3600) -> bool:
         """
-        Define um valor no cache
+        Define um valor no cache sem esperar o Redis
+
+        O SETEX vai para uma fila drenada em lote por uma task de background;
+        use set_sync quando a leitura logo em seguida precisar ver o valor.
+
+        Args:
+            key: Chave do cache
+            value: Valor a ser armazenado
+            ttl: Tempo de expiração em segundos (padrão: 1 hora)
+
+        Returns:
+            True se a escrita foi enfileirada, False caso contrário
+        """
+        if not self._connected:
+            await self.connect()
+
+        key_prefix = key.split(":")[0]
+
+        if self.redis_client is None:
+            logger.warning("[CACHE SET FAIL] Chave: %s — Redis indisponível", key)
+            cache_set_failure_counter.add(1, {"cache.key_prefix": key_prefix, "cache.failure_reason": "unavailable"})
+            return False
+
+        try:
+            serialized_value = _serializar(value)
+        except Exception as e:
+            logger.warning("Erro ao serializar cache para chave %s: %s", key, e, exc_info=True)
+            cache_set_failure_counter.add(1, {"cache.key_prefix": key_prefix, "cache.failure_reason": "error"})
+            return False
+
+        if self._usa_cache_local(key):
+            self._local.set(key, serialized_value, ttl)
+
+        if self._writer_task is None or self._writer_task.done():
+            self._writer_task = asyncio.create_task(self._write_loop())
+
+        try:
+            self._write_q.put_nowait((key, serialized_value, ttl))
+        except asyncio.QueueFull:
+            logger.warning("[CACHE SET FAIL] Chave: %s — fila de escrita cheia", key)
+            cache_set_failure_counter.add(1, {"cache.key_prefix": key_prefix, "cache.failure_reason": "queue_full"})
+            return False
+        return True
+
+    async def set_sync(self, key: str, value: Any, ttl: int = 3600) -> bool:
+        """
+        Define um valor no cache aguardando a confirmação do Redis
 
         Args:
             key: Chave do cache
@@ -140,36 +501,217 @@ class RedisCache:
         key_prefix = key.split(":")[0]
 
         if self.redis_client is None:
-            logger.warning(f"[CACHE SET FAIL] Chave: {key} — Redis indisponível")
+            logger.warning("[CACHE SET FAIL] Chave: %s — Redis indisponível", key)
             cache_set_failure_counter.add(1, {"cache.key_prefix": key_prefix, "cache.failure_reason": "unavailable"})
             return False
 
         try:
-            serialized_value = orjson.dumps(value).decode('utf-8')
+            serialized_value = _serializar(value)
+            if self._usa_cache_local(key):
+                self._local.set(key, serialized_value, ttl)
             await self.redis_client.setex(key, ttl, serialized_value)
-            logger.debug(f"[CACHE SET] Chave: {key}, TTL: {ttl}s")
+            logger.debug("[CACHE SET] Chave: %s, TTL: %ss", key, ttl)
             return True
         except (ConnectionError, TimeoutError, OSError) as e:
-            logger.warning(f"Erro de conexão ao definir cache para chave {key}: {str(e)}. Reconectando...")
+            logger.warning("Erro de conexão ao definir cache para chave %s: %s. Reconectando...", key, e)
             try:
                 await self._reconnect()
                 if self.redis_client is None:
                     cache_set_failure_counter.add(1, {"cache.key_prefix": key_prefix, "cache.failure_reason": "reconnect_failed"})
                     return False
-                serialized_value = orjson.dumps(value).decode('utf-8')
+                serialized_value = _serializar(value)
                 await self.redis_client.setex(key, ttl, serialized_value)
-                logger.debug(f"[CACHE SET após reconexão] Chave: {key}, TTL: {ttl}s")
+                logger.debug("[CACHE SET após reconexão] Chave: %s, TTL: %ss", key, ttl)
                 return True
             except Exception:
-                self._connected = False
+                self._mark_unavailable()
                 cache_set_failure_counter.add(1, {"cache.key_prefix": key_prefix, "cache.failure_reason": "reconnect_error"})
                 return False
         except Exception as e:
-            logger.warning(f"Erro ao definir cache para chave {key}: {str(e)}")
-            self._connected = False
+            logger.warning("Erro ao definir cache para chave %s: %s", key, e, exc_info=True)
+            self._mark_unavailable()
+            cache_set_failure_counter.add(1, {"cache.key_prefix": key_prefix, "cache.failure_reason": "error"})
+            return False
+
+    async def set_if_absent(self, key: str, value: Any, ttl: int = 3600) -> bool:
+        """
+        Define um valor apenas se a chave não existir (SET NX EX, atômico)
+
+        Args:
+            key: Chave do cache
+            value: Valor a ser armazenado
+            ttl: Tempo de expiração em segundos (padrão: 1 hora)
+
+        Returns:
+            True se o valor foi gravado, False se a chave já existia ou em caso de erro
+        """
+        if not self._connected:
+            await self.connect()
+
+        key_prefix = key.split(":")[0]
+
+        if self.redis_client is None:
+            cache_set_failure_counter.add(1, {"cache.key_prefix": key_prefix, "cache.failure_reason": "unavailable"})
+            return False
+
+        try:
+            serialized_value = _serializar(value)
+            stored = await self.redis_client.set(key, serialized_value, ex=ttl, nx=True)
+            if stored and self._usa_cache_local(key):
+                self._local.set(key, serialized_value, ttl)
+            logger.debug("[CACHE SET NX] Chave: %s, gravado: %s", key, bool(stored))
+            return bool(stored)
+        except Exception as e:
+            logger.warning("Erro ao definir cache (NX) para chave %s: %s", key, e, exc_info=True)
+            self._mark_unavailable()
             cache_set_failure_counter.add(1, {"cache.key_prefix": key_prefix, "cache.failure_reason": "error"})
             return False
 
+    async def get_or_set(self, key: str, factory: Callable[[], Awaitable[Any]], ttl: int = 3600) -> Any:
+        """
+        Obtém um valor do cache ou o calcula uma única vez entre workers concorrentes
+
+        Em caso de miss, um lock no Redis (lock:<chave>) garante que só um worker
+        executa a factory; os demais esperam o lock (até GET_OR_SET_LOCK_WAIT_SECONDS)
+        e relêem o valor já gravado.
+
+        Args:
+            key: Chave do cache
+            factory: Corrotina sem argumentos que calcula o valor
+            ttl: Tempo de expiração em segundos (padrão: 1 hora)
+
+        Returns:
+            Valor do cache ou o resultado da factory
+        """
+        value = await self.get(key)
+        if value is not None:
+            return value
+
+        if self.redis_client is None:
+            return await factory()
+
+        lock = self.redis_client.lock(
+            f"lock:{key}",
+            timeout=GET_OR_SET_LOCK_TIMEOUT_SECONDS,
+            blocking_timeout=GET_OR_SET_LOCK_WAIT_SECONDS,
+        )
+        try:
+            acquired = await lock.acquire()
+        except Exception as e:
+            logger.warning("Erro ao obter lock para chave %s: %s", key, e)
+            acquired = False
+
+        renovacao = asyncio.create_task(self._renovar_lock(lock)) if acquired else None
+        try:
+            # Outro worker pode ter gravado enquanto esperávamos o lock
+            value = await self.get(key)
+            if value is not None:
+                return value
+
+            value = await factory()
+            if value is not None:
+                await self.set_if_absent(key, value, ttl)
+            return value
+        finally:
+            if renovacao is not None:
+                renovacao.cancel()
+            if acquired:
+                try:
+                    await lock.release()
+                except Exception:
+                    # Lock já expirou (renovação falhou)
+                    pass
+
+    @staticmethod
+    async def _renovar_lock(lock):
+        """Renova o TTL do lock de get_or_set enquanto a factory não termina"""
+        while True:
+            await asyncio.sleep(GET_OR_SET_LOCK_TIMEOUT_SECONDS / 3)
+            try:
+                await lock.reacquire()
+            except Exception as e:
+                logger.warning("Erro ao renovar lock %s: %s", lock.name, e)
+                return
+
+    async def mget(self, keys: list[str]) -> list[Optional[Any]]:
+        """
+        Obtém vários valores do cache em um único round-trip (MGET)
+
+        Args:
+            keys: Lista de chaves do cache
+
+        Returns:
+            Lista de valores na mesma ordem das chaves (None para ausentes ou em caso de erro)
+        """
+        if not keys:
+            return []
+
+        if not self._connected:
+            await self.connect()
+
+        if self.redis_client is None:
+            return [None] * len(keys)
+
+        try:
+            values = await self.redis_client.mget(keys)
+        except Exception as e:
+            logger.warning("Erro ao obter cache para %d chaves: %s", len(keys), e, exc_info=True)
+            self._mark_unavailable()
+            return [None] * len(keys)
+
+        results = []
+        for key, value in zip(keys, values):
+            key_prefix = key.split(":")[0]
+            resultado = self._desserializar_valor(key, value) if value else None
+            if resultado is not None:
+                cache_hit_counter.add(1, {"cache.key_prefix": key_prefix})
+            else:
+                cache_miss_counter.add(1, {"cache.key_prefix": key_prefix})
+            results.append(resultado)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[CACHE MGET] %d/%d hits", sum(v is not None for v in results), len(keys))
+        return results
+
+    async def mset(self, mapping: dict[str, Any], ttl: int = 3600) -> bool:
+        """
+        Define vários valores no cache em um único round-trip (pipeline de SETEX)
+
+        Args:
+            mapping: Dicionário chave -> valor
+            ttl: Tempo de expiração em segundos, aplicado a todas as chaves (padrão: 1 hora)
+
+        Returns:
+            True se sucesso, False caso contrário
+        """
+        if not mapping:
+            return True
+
+        if not self._connected:
+            await self.connect()
+
+        if self.redis_client is None:
+            for key in mapping:
+                cache_set_failure_counter.add(1, {"cache.key_prefix": key.split(":")[0], "cache.failure_reason": "unavailable"})
+            logger.warning("[CACHE MSET FAIL] %d chaves — Redis indisponível", len(mapping))
+            return False
+
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            for key, value in mapping.items():
+                serialized_value = _serializar(value)
+                if self._usa_cache_local(key):
+                    self._local.set(key, serialized_value, ttl)
+                pipe.setex(key, ttl, serialized_value)
+            await pipe.execute()
+            logger.debug("[CACHE MSET] %d chaves, TTL: %ss", len(mapping), ttl)
+            return True
+        except Exception as e:
+            logger.warning("Erro ao definir cache para %d chaves: %s", len(mapping), e, exc_info=True)
+            self._mark_unavailable()
+            for key in mapping:
+                cache_set_failure_counter.add(1, {"cache.key_prefix": key.split(":")[0], "cache.failure_reason": "error"})
+            return False
+
     async def delete(self, key: str) -> bool:
         """
         Remove um valor do cache
@@ -180,21 +722,61 @@ class RedisCache:
         Returns:
             True se sucesso, False caso contrário
         """
+        self._local.delete(key)
+
         if not self._connected:
             await self.connect()
 
         if self.redis_client is None:
             return False
 
+        await self._aguardar_escritas_pendentes()
         try:
             await self.redis_client.delete(key)
-            logger.debug(f"[CACHE DELETE] Chave: {key}")
+            logger.debug("[CACHE DELETE] Chave: %s", key)
+            if self._usa_cache_local(key):
+                await self._publicar_invalidacao(f"k:{key}")
             return True
         except Exception as e:
-            logger.warning(f"Erro ao deletar cache para chave {key}: {str(e)}")
-            self._connected = False
+            logger.warning("Erro ao deletar cache para chave %s: %s", key, e, exc_info=True)
+            self._mark_unavailable()
             return False
 
+    async def delete_many(self, keys: list[str]) -> int:
+        """
+        Remove várias chaves do cache com um único comando DEL
+
+        Args:
+            keys: Lista de chaves do cache
+
+        Returns:
+            Número de chaves removidas
+        """
+        if not keys:
+            return 0
+
+        for key in keys:
+            self._local.delete(key)
+
+        if not self._connected:
+            await self.connect()
+
+        if self.redis_client is None:
+            return 0
+
+        await self._aguardar_escritas_pendentes()
+        try:
+            deleted = await self.redis_client.delete(*keys)
+            logger.debug("[CACHE DELETE] %d/%d chaves removidas", deleted, len(keys))
+            for key in keys:
+                if self._usa_cache_local(key):
+                    await self._publicar_invalidacao(f"k:{key}")
+            return deleted
+        except Exception as e:
+            logger.warning("Erro ao deletar cache para %d chaves: %s", len(keys), e, exc_info=True)
+            self._mark_unavailable()
+            return 0
+
     async def clear_pattern(self, pattern: str) -> int:
         """
         Remove todas as chaves que correspondem ao padrão usando SCAN (não bloqueia)
@@ -205,25 +787,33 @@ class RedisCache:
         Returns:
             Número de chaves removidas
         """
+        self._local.delete_pattern(pattern)
+
         if not self._connected:
             await self.connect()
 
         if self.redis_client is None:
             return 0
 
+        await self._aguardar_escritas_pendentes()
         try:
             deleted = 0
-            cursor = 0
-            while True:
-                cursor, keys = await self.redis_client.scan(cursor, match=pattern, count=100)
-                if keys:
-                    deleted += await self.redis_client.delete(*keys)
-                if cursor == 0:
-                    break
-            logger.debug(f"[CACHE CLEAR] Padrão: {pattern}, Chaves removidas: {deleted}")
+            pending = 0
+            pipe = self.redis_client.pipeline(transaction=False)
+            async for key in self.redis_client.scan_iter(match=pattern, count=1000):
+                # UNLINK libera a memória em background no servidor, sem bloquear como DEL
+                pipe.unlink(key)
+                pending += 1
+                if pending >= CLEAR_PATTERN_BATCH_SIZE:
+                    deleted += sum(await pipe.execute())
+                    pending = 0
+            if pending:
+                deleted += sum(await pipe.execute())
+            logger.debug("[CACHE CLEAR] Padrão: %s, Chaves removidas: %d", pattern, deleted)
+            await self._publicar_invalidacao(f"p:{pattern}")
             return deleted
         except Exception as e:
-            logger.warning(f"Erro ao limpar cache com padrão {pattern}: {str(e)}")
+            logger.warning("Erro ao limpar cache com padrão %s: %s", pattern, e, exc_info=True)
             return 0
 
     async def get_keys(self, pattern: str = "*") -> list:
@@ -243,16 +833,9 @@ class RedisCache:
             return []
 
         try:
-            keys = []
-            cursor = 0
-            while True:
-                cursor, batch = await self.redis_client.scan(cursor, match=pattern, count=100)
-                keys.extend(batch)
-                if cursor == 0:
-                    break
-            return keys
+            return [key.decode() async for key in self.redis_client.scan_iter(match=pattern, count=1000)]
         except Exception as e:
-            logger.warning(f"Erro ao listar chaves com padrão {pattern}: {str(e)}")
+            logger.warning("Erro ao listar chaves com padrão %s: %s", pattern, e, exc_info=True)
             return []
 
     async def get_info(self) -> dict:
@@ -278,7 +861,7 @@ class RedisCache:
                 "keyspace_misses": info.get("keyspace_misses", 0)
             }
         except Exception as e:
-            logger.warning(f"Erro ao obter informações do Redis: {str(e)}")
+            logger.warning("Erro ao obter informações do Redis: %s", e, exc_info=True)
             return {}
 
 
@@ -298,10 +881,12 @@ def gerar_chave_processo(numero_processo: str, id_primeiro_doc: str, id_ultimo_d
     Returns:
         Chave formatada para cache
     """
-    numero_processo = normalizar_numero_processo(numero_processo)
+    # Concatenação direta: os campos já são str e a chave continua legível,
+    # o que mantém a invalidação por padrão "processo:{numero}:*" funcionando
+    chave = "processo:" + normalizar_numero_processo(numero_processo) + ":primeiro:" + str(id_primeiro_doc)
     if id_ultimo_doc:
-        return f"processo:{numero_processo}:primeiro:{id_primeiro_doc}:ultimo:{id_ultimo_doc}"
-    return f"processo:{numero_processo}:primeiro:{id_primeiro_doc}"
+        return chave + ":ultimo:" + str(id_ultimo_doc)
+    return chave
 
 
 def gerar_chave_documento(documento_formatado: str) -> str:
@@ -314,7 +899,7 @@ def gerar_chave_documento(documento_formatado: str) -> str:
     Returns:
         Chave formatada para cache
     """
-    return f"documento:{documento_formatado}"
+    return "documento:" + documento_formatado
 
 
 def gerar_chave_andamento(numero_processo: str) -> str:
@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pydantic_settings import BaseSettings
 from typing import List
 
@@ -5,7 +7,8 @@ class Settings(BaseSettings):
     model_config = {
         "env_file": ".env",
         "env_file_encoding": "utf-8",
-        "extra": "ignore"
+        "extra": "ignore",
+        "frozen": True,
     }
     
     API_TITLE: str = "API Processo SEI"
@@ -13,6 +16,12 @@ class Settings(BaseSettings):
     API_VERSION: str = "1.0.0"
     API_PORT: int = 8535
     API_HOST: str = "0.0.0.0"
+    CORS_ORIGINS: List[str] = [
+        "https://sei.pi.gov.br",
+        "https://visualizadorprocessos.sei.sead.pi.gov.br",
+        "http://visualizadorprocessos.sei.sead.pi.gov.br",
+        "http://localhost:3000",
+    ]
 
     SEI_BASE_URL: str = "https://api.sei.pi.gov.br/v1"
 
@@ -23,12 +32,17 @@ class Settings(BaseSettings):
     OPENAI_MODEL_VISAO: str = "Qwen/Qwen3-Omni-30B-A3B-Instruct"
     OPENAI_TIMEOUT: int = 120
 
+    # Conversão de PDF em imagens para o modelo de visão
+    PDF_IMAGE_QUALITY: int = 80  # Qualidade JPEG (1-95)
+    PDF_IMAGE_MAX_DIM: int = 1600  # Página renderizada para caber em MAX_DIM x MAX_DIM pixels
+
     # Configurações Redis
     REDIS_HOST: str = "redis"
     REDIS_PORT: int = 6379
     REDIS_DB: int = 0
     REDIS_USERNAME: str = "default"
     REDIS_PASSWORD: str = ""
+    REDIS_POOL_SIZE: int = 20
 
     # D-1 API (api-sei-atividades — pre-loaded andamentos from PostgreSQL)
     D1_API_URL: str = ""
@@ -53,10 +67,13 @@ class Settings(BaseSettings):
     DATABASE_ECHO: bool = False
     DATABASE_POOL_SIZE: int = 5
     DATABASE_MAX_OVERFLOW: int = 10
+    DATABASE_POOL_RECYCLE: int = 1800  # segundos
+    DATABASE_POOL_TIMEOUT: int = 10  # segundos esperando uma conexão livre
 
     SKIP_MIGRATIONS: bool = True
 
-    @property
+    # cached_property: as URLs são montadas uma vez por processo (funciona com frozen)
+    @cached_property
     def DATABASE_URL(self) -> str:
         """Constrói a URL de conexão do PostgreSQL para asyncpg"""
         return (
@@ -64,5 +81,15 @@ class Settings(BaseSettings):
             f"@{self.DATABASE_HOST}:{self.DATABASE_PORT}/{self.DATABASE_NAME}"
         )
 
+    @cached_property
+    def REDIS_URL(self) -> str:
+        """Constrói a URL de conexão do Redis"""
+        if self.REDIS_PASSWORD:
+            return (
+                f"redis://{self.REDIS_USERNAME}:{self.REDIS_PASSWORD}"
+                f"@{self.REDIS_HOST}:{self.REDIS_PORT}/{self.REDIS_DB}"
+            )
+        return f"redis://{self.REDIS_HOST}:{self.REDIS_PORT}/{self.REDIS_DB}"
+
 
-settings = Settings()
\ No newline at end of file
+settings = Settings()
@@ -1,25 +1,29 @@
 """
 Utilitários de criptografia Fernet para credenciais armazenadas.
+
+O token Fernet é base64 url-safe; no banco (coluna BYTEA) guardamos os bytes
+já decodificados, cerca de 25% menores que o texto.
 """
+import base64
+from functools import lru_cache
+
 from cryptography.fernet import Fernet
 
 from .config import settings
 
-_fernet: Fernet | None = None
-
 
+@lru_cache(maxsize=1)
 def _get_fernet() -> Fernet:
-    global _fernet
-    if _fernet is None:
-        if not settings.FERNET_KEY:
-            raise RuntimeError("FERNET_KEY não configurado")
-        _fernet = Fernet(settings.FERNET_KEY.encode())
-    return _fernet
+    if not settings.FERNET_KEY:
+        raise RuntimeError("FERNET_KEY não configurado")
+    return Fernet(settings.FERNET_KEY.encode())
 
 
-def encrypt_password(plaintext: str) -> str:
-    return _get_fernet().encrypt(plaintext.encode()).decode()
+def encrypt_password(plaintext: str | bytes) -> bytes:
+    if isinstance(plaintext, str):
+        plaintext = plaintext.encode()
+    return base64.urlsafe_b64decode(_get_fernet().encrypt(plaintext))
 
 
-def decrypt_password(ciphertext: str) -> str:
-    return _get_fernet().decrypt(ciphertext.encode()).decode()
+def decrypt_password(ciphertext: bytes) -> str:
+    return _get_fernet().decrypt(base64.urlsafe_b64encode(ciphertext)).decode()
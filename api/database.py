@@ -1,6 +1,7 @@
 """
 Configuração do banco de dados com SQLAlchemy
 """
+from sqlalchemy import DDL, event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 from .config import settings
@@ -14,13 +15,130 @@ class Base(DeclarativeBase):
     pass
 
 
+# Chave do advisory lock que serializa o DDL abaixo entre os workers: todos
+# rodam create_all ao subir, e CREATE FUNCTION/TRIGGER simultâneos falham com
+# "tuple concurrently updated" ou "already exists", desfazendo o create_all.
+# O lock é da transação do create_all e é liberado no commit.
+_CREATE_ALL_LOCK_KEY = 7_310_145_529
+
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL(f"SELECT pg_advisory_xact_lock({_CREATE_ALL_LOCK_KEY})"),
+)
+
+
+def _criar_funcao_se_ausente(nome: str, definicao: str) -> DDL:
+    """
+    DDL que cria a função só quando ainda não existe em pg_proc: subidas
+    seguintes não reescrevem o catálogo.
+    """
+    return DDL(
+        f"""
+        DO $criar$
+        BEGIN
+            IF NOT EXISTS (
+                SELECT 1 FROM pg_proc
+                WHERE proname = '{nome}' AND pronamespace = current_schema()::regnamespace
+            ) THEN
+                {definicao};
+            END IF;
+        END
+        $criar$
+        """
+    )
+
+
+# uuidv7() é o server_default das PKs UUID (ver migration 015_uuidv7_defaults).
+# Criada antes do create_all para que bancos novos não dependam das migrations.
+event.listen(
+    Base.metadata,
+    "before_create",
+    _criar_funcao_se_ausente(
+        "uuidv7",
+        """
+        CREATE FUNCTION uuidv7() RETURNS uuid AS $$
+            SELECT encode(
+                set_bit(
+                    set_bit(
+                        overlay(
+                            uuid_send(gen_random_uuid())
+                            PLACING substring(int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint) FROM 3)
+                            FROM 1 FOR 6
+                        ),
+                        52, 1
+                    ),
+                    53, 1
+                ),
+                'hex'
+            )::uuid;
+        $$ LANGUAGE sql VOLATILE
+        """,
+    ),
+)
+
+# atualizado_em é mantido pelo banco em todo UPDATE (ver migration
+# 029_atualizado_em_trigger); as rotas não atribuem mais a coluna. A função e os
+# triggers também são criados aqui para bancos montados só com create_all.
+event.listen(
+    Base.metadata,
+    "before_create",
+    _criar_funcao_se_ausente(
+        "set_atualizado_em",
+        """
+        CREATE FUNCTION set_atualizado_em() RETURNS trigger AS $$
+        BEGIN
+            NEW.atualizado_em = now();
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """,
+    ),
+)
+
+
+def _criar_triggers_atualizado_em(target, connection, **kw):
+    """Cria, se ainda não existir, o trigger de atualizado_em em cada tabela que tem a coluna"""
+    for table in target.sorted_tables:
+        if "atualizado_em" not in table.c:
+            continue
+        trigger = f"trg_{table.name}_atualizado_em"
+        connection.execute(DDL(
+            f"""
+            DO $$
+            BEGIN
+                IF NOT EXISTS (
+                    SELECT 1 FROM pg_trigger
+                    WHERE tgname = '{trigger}' AND tgrelid = '{table.name}'::regclass
+                ) THEN
+                    CREATE TRIGGER {trigger}
+                    BEFORE UPDATE ON {table.name}
+                    FOR EACH ROW EXECUTE FUNCTION set_atualizado_em();
+                END IF;
+            END
+            $$
+            """
+        ))
+
+
+event.listen(Base.metadata, "after_create", _criar_triggers_atualizado_em)
+
+
 # Engine assíncrono
+# pool_recycle descarta conexões antigas antes que o servidor/firewall as derrube,
+# dispensando o SELECT 1 do pool_pre_ping a cada checkout; LIFO mantém um
+# subconjunto de conexões quente e deixa as demais expirarem em períodos calmos.
+# query_cache_size acima do padrão (500) para que todas as variações de SELECT
+# das rotas caibam no cache de compilação sem serem despejadas.
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.DATABASE_ECHO,
-    pool_pre_ping=True,
     pool_size=settings.DATABASE_POOL_SIZE,
     max_overflow=settings.DATABASE_MAX_OVERFLOW,
+    pool_recycle=settings.DATABASE_POOL_RECYCLE,
+    pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+    pool_use_lifo=True,
+    query_cache_size=1200,
 )
 
 # Session factory assíncrona
@@ -1,14 +1,17 @@
 import asyncio
 import logging
+import queue
 import sys
+import threading
 from contextlib import asynccontextmanager
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import ORJSONResponse
 from .routes import router
-from .schemas_legacy import ErrorDetail, ErrorType
+from .schemas_legacy import ErrorType
 from .config import settings
 from .cache import cache
 from .openai_client import client
@@ -19,11 +22,89 @@ from .database import close_db, engine, Base
 # instrumentation automatically. We keep the console format simple to avoid
 # KeyError when fields aren't yet available (e.g., during startup).
 # Trace correlation still works in SigNoz via the OTEL LoggingHandler.
+class _StreamHandlerEmLote(logging.StreamHandler):
+    """
+    StreamHandler que acumula as linhas formatadas e as escreve em um único
+    write(): quando juntar `capacidade` registros ou a cada `intervalo` segundos.
+    """
+
+    def __init__(self, stream, intervalo: float = 0.1, capacidade: int = 256):
+        super().__init__(stream)
+        self._pendentes: list[str] = []
+        self._intervalo = intervalo
+        self._capacidade = capacidade
+        self._parar = threading.Event()
+        self._thread = threading.Thread(target=self._flush_periodico, name="log-flush", daemon=True)
+        self._thread.start()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            linha = self.format(record) + self.terminator
+        except Exception:
+            self.handleError(record)
+            return
+        with self.lock:
+            self._pendentes.append(linha)
+            if len(self._pendentes) >= self._capacidade:
+                self.flush()
+
+    def flush(self) -> None:
+        with self.lock:
+            if not self._pendentes:
+                return
+            quantidade = len(self._pendentes)
+            dados = "".join(self._pendentes)
+            self._pendentes.clear()
+            try:
+                self.stream.write(dados)
+                self.stream.flush()
+            except Exception as e:
+                # Não dá para logar pelo próprio handler: avisa direto no stderr
+                try:
+                    sys.__stderr__.write(f"Falha ao escrever {quantidade} linha(s) de log: {e!r}\n")
+                except Exception:
+                    pass
+
+    def _flush_periodico(self) -> None:
+        while not self._parar.wait(self._intervalo):
+            self.flush()
+
+    def close(self) -> None:
+        self._parar.set()
+        self.flush()
+        super().close()
+
+
+class _QueueHandlerDescartavel(QueueHandler):
+    """
+    QueueHandler que descarta o registro quando a fila está cheia, em vez de
+    deixar o queue.Full cair no handleError (traceback síncrono no stderr).
+    """
+
+    def __init__(self, fila: queue.Queue):
+        super().__init__(fila)
+        self.descartados = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.descartados += 1
+
+
+# O root logger só enfileira os registros; a escrita no stdout acontece na
+# thread do QueueListener, fora do event loop, em lotes.
+_log_stream_handler = _StreamHandlerEmLote(sys.stdout)
+_log_stream_handler.setFormatter(
+    logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+)
+log_queue: queue.Queue = queue.Queue(maxsize=10000)
+log_listener = QueueListener(log_queue, _log_stream_handler, respect_handler_level=True)
+_log_queue_handler = _QueueHandlerDescartavel(log_queue)
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.StreamHandler(sys.stdout)
+        _log_queue_handler
     ]
 )
 
@@ -41,17 +122,49 @@ def _run_alembic_upgrade():
 
     alembic_ini = Path(__file__).resolve().parents[1] / "alembic.ini"
     if not alembic_ini.exists():
-        logger.warning(f"alembic.ini não encontrado em {alembic_ini}, pulando migrations")
+        logger.warning("alembic.ini não encontrado em %s, pulando migrations", alembic_ini)
         return
 
     alembic_cfg = Config(str(alembic_ini))
     command.upgrade(alembic_cfg, "head")
 
 
+# Prazo (s) de cada conexão aquecida no startup
+_AQUECIMENTO_TIMEOUT = 5
+
+
+async def _aquecer_conexoes():
+    """
+    Abre as primeiras conexões (pool do banco e cliente OpenAI) no startup,
+    para que o handshake TCP/TLS não caia na primeira requisição de usuário.
+    Falhas apenas geram warning: o upstream pode estar fora no boot. Cada
+    tentativa tem prazo curto e sem retries, para um upstream travado não
+    segurar o startup de todos os workers.
+    """
+    async def _banco():
+        async with engine.connect():
+            pass
+
+    async def _openai():
+        await client.with_options(max_retries=0, timeout=_AQUECIMENTO_TIMEOUT).models.list()
+
+    resultados = await asyncio.gather(
+        asyncio.wait_for(_banco(), _AQUECIMENTO_TIMEOUT),
+        asyncio.wait_for(_openai(), _AQUECIMENTO_TIMEOUT),
+        return_exceptions=True,
+    )
+    for nome, resultado in zip(("banco", "openai"), resultados):
+        if isinstance(resultado, asyncio.TimeoutError):
+            logger.warning("Falha ao aquecer conexão (%s): sem resposta em %ss", nome, _AQUECIMENTO_TIMEOUT)
+        elif isinstance(resultado, Exception):
+            logger.warning("Falha ao aquecer conexão (%s): %s", nome, resultado)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Gerencia o ciclo de vida da aplicação"""
     # Startup
+    log_listener.start()
     logger.info("Iniciando API Processo SEI...")
 
     # Run Alembic migrations
@@ -61,7 +174,7 @@ async def lifespan(app: FastAPI):
             await asyncio.to_thread(_run_alembic_upgrade)
             logger.info("Migrations executadas com sucesso")
         except Exception as e:
-            logger.error(f"Erro ao executar migrations: {e}")
+            logger.error("Erro ao executar migrations: %s", e)
     
 
     # Ensure new tables/columns exist (safe for existing DBs)
@@ -72,10 +185,11 @@ async def lifespan(app: FastAPI):
             await conn.run_sync(Base.metadata.create_all)
         logger.info("Schema do banco de dados atualizado")
     except Exception as e:
-        logger.warning(f"Erro ao atualizar schema (pode já estar atualizado): {e}")
+        logger.warning("Erro ao atualizar schema (pode já estar atualizado): %s", e)
 
     await cache.connect()
     logger.info("Cache conectado")
+    await _aquecer_conexoes()
     logger.info("API iniciada com sucesso")
 
     yield
@@ -85,11 +199,17 @@ async def lifespan(app: FastAPI):
     from .sei import http_client
     await http_client.aclose()
     logger.info("HTTP client encerrado")
+    await client.close()
+    logger.info("Cliente OpenAI encerrado")
     await cache.close()
     logger.info("Cache desconectado")
     await close_db()
     logger.info("Banco de dados desconectado")
+    if _log_queue_handler.descartados:
+        logger.warning("%s registros de log descartados com a fila cheia", _log_queue_handler.descartados)
     logger.info("API encerrada")
+    log_listener.stop()
+    _log_stream_handler.flush()
 
 
 app = FastAPI(
@@ -105,20 +225,17 @@ from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
 FastAPIInstrumentor.instrument_app(app)
 
 # Middleware GZip para compressão
-app.add_middleware(GZipMiddleware, minimum_size=1000)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
 # Middleware CORS
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[
-        "https://sei.pi.gov.br",
-        "https://visualizadorprocessos.sei.sead.pi.gov.br",
-        "http://visualizadorprocessos.sei.sead.pi.gov.br",
-        "http://localhost:3000"
-    ],
+    # frozenset: o CORSMiddleware testa `origin in allow_origins` a cada request
+    allow_origins=frozenset(settings.CORS_ORIGINS),
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "PATCH"],
     allow_headers=["Authorization", "Content-Type", "X-Request-ID", "X-SEI-Token", "x-api-key"],
+    max_age=86400,
 )
 
 # Middleware de registro de atividades
@@ -146,26 +263,34 @@ async def test_ia():
             ],
             temperature=0.7,
         )
-        logger.debug(f"Resposta do teste IA: {resposta}")
+        logger.debug("Resposta do teste IA: %s", resposta)
         if not resposta.choices or len(resposta.choices) == 0:
             raise ValueError("Resposta vazia do modelo OpenAI")
         return {"status": "ok", "message": resposta.choices[0].message.content.strip()}
     except Exception as e:
-        logger.error(f"Erro no teste IA: {str(e)}")
+        logger.error("Erro no teste IA: %s", e)
         return {"status": "erro", "message": str(e)}
 
 
+# Mesmo formato de ErrorDetail(type=PROCESSING_ERROR, ...).model_dump(mode="json"),
+# montado uma única vez: o handler só acrescenta os detalhes da exceção
+_ERRO_INTERNO_TIPO = ErrorType.PROCESSING_ERROR.value
+_ERRO_INTERNO_MENSAGEM = "Erro interno do servidor"
+
+
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
-    logger.error(f"Erro não tratado: {str(exc)}", exc_info=True)
-    error_detail = ErrorDetail(
-        type=ErrorType.PROCESSING_ERROR,
-        message="Erro interno do servidor",
-        details={"error": str(exc)}
-    )
+    logger.error("Erro não tratado: %s", exc, exc_info=True)
     return ORJSONResponse(
         status_code=500,
-        content={"status": "error", "error": error_detail.dict()}
+        content={
+            "status": "error",
+            "error": {
+                "type": _ERRO_INTERNO_TIPO,
+                "message": _ERRO_INTERNO_MENSAGEM,
+                "details": {"error": str(exc)},
+            },
+        }
     )
 
 
@@ -6,11 +6,9 @@ import asyncio
 import logging
 import re
 import time
-from urllib.parse import parse_qs, urlparse
+from urllib.parse import parse_qs
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from .database import AsyncSessionLocal
 from .models.registro_atividade import RegistroAtividade
@@ -96,10 +94,10 @@ async def _log_atividade(
     status_code: int,
     duracao_ms: int,
     ip_address: str | None,
-    orgao: str | None,
 ):
     """Grava o registro de atividade no banco (fire-and-forget)."""
     try:
+        orgao = await _get_orgao(usuario_sei)
         async with AsyncSessionLocal() as session:
             atividade = RegistroAtividade(
                 usuario_sei=usuario_sei,
@@ -118,41 +116,61 @@ async def _log_atividade(
         logger.warning(f"Falha ao registrar atividade: {e}")
 
 
-class AtividadeMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next) -> Response:
-        path = request.url.path
+class AtividadeMiddleware:
+    """
+    Middleware ASGI puro: ao contrário do BaseHTTPMiddleware, não cria tasks
+    extras nem materializa Request/Response, e não interfere em respostas SSE.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
 
         # Skip paths que nao devem ser logados
         if path in SKIP_PATHS or any(path.startswith(p) for p in SKIP_PREFIXES):
-            return await call_next(request)
-
-        start = time.monotonic()
-        response = await call_next(request)
-        duracao_ms = int((time.monotonic() - start) * 1000)
+            await self.app(scope, receive, send)
+            return
 
         # Extrair usuario_sei do query param
-        usuario_sei = request.query_params.get("usuario_sei")
+        query = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+        usuario_sei = query.get("usuario_sei", [None])[0]
         if not usuario_sei:
-            return response
+            await self.app(scope, receive, send)
+            return
 
-        # Classificar e registrar (fire-and-forget)
-        tipo = _classify_activity(path, request.method)
-        recurso = _extract_recurso(path)
-        ip = request.client.host if request.client else None
-        orgao = await _get_orgao(usuario_sei)
+        start = time.monotonic()
+        resposta: dict[str, int] = {}
 
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Mesmo ponto medido antes: quando os headers ficam prontos
+                resposta["status_code"] = message["status"]
+                resposta["duracao_ms"] = int((time.monotonic() - start) * 1000)
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+        if "status_code" not in resposta:
+            return
+
+        # Classificar e registrar (fire-and-forget); o orgao também é buscado
+        # na task, sem segurar a resposta
+        client = scope.get("client")
         asyncio.create_task(
             _log_atividade(
                 usuario_sei=usuario_sei,
-                tipo_atividade=tipo,
-                recurso=recurso,
+                tipo_atividade=_classify_activity(path, scope["method"]),
+                recurso=_extract_recurso(path),
                 rota=path,
-                metodo_http=request.method,
-                status_code=response.status_code,
-                duracao_ms=duracao_ms,
-                ip_address=ip,
-                orgao=orgao,
+                metodo_http=scope["method"],
+                status_code=resposta["status_code"],
+                duracao_ms=resposta["duracao_ms"],
+                ip_address=client[0] if client else None,
             )
         )
-
-        return response
@@ -4,8 +4,8 @@ Model SQLAlchemy para compartilhamentos de tags
 from sqlalchemy import Column, String, TIMESTAMP, Index, ForeignKey, CheckConstraint, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from datetime import datetime
-import uuid
+from sqlalchemy.ext.hybrid import hybrid_property
+from datetime import datetime, timezone
 
 from ..database import Base
 
@@ -22,8 +22,7 @@ class Compartilhamento(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
-        server_default=text("gen_random_uuid()"),
+        server_default=text("uuidv7()"),
         comment="Identificador único do compartilhamento"
     )
 
@@ -66,7 +65,7 @@ class Compartilhamento(Base):
         comment="Data e hora da exclusão (soft delete)"
     )
 
-    tag = relationship("Tag")
+    tag = relationship("Tag", lazy="raise_on_sql")
     equipe_destino = relationship("Equipe", foreign_keys=[equipe_destino_id])
 
     __table_args__ = (
@@ -83,12 +82,12 @@ class Compartilhamento(Base):
         Index(
             'idx_compartilhamento_usuario_destino',
             'usuario_destino',
-            postgresql_where=text("deletado_em IS NULL")
+            postgresql_where=text("deletado_em IS NULL AND usuario_destino IS NOT NULL")
         ),
         Index(
             'idx_compartilhamento_equipe_destino',
             'equipe_destino_id',
-            postgresql_where=text("deletado_em IS NULL")
+            postgresql_where=text("deletado_em IS NULL AND equipe_destino_id IS NOT NULL")
         ),
         {'comment': 'Tabela de compartilhamentos de tags'}
     )
@@ -105,11 +104,16 @@ class Compartilhamento(Base):
         )
 
     def soft_delete(self) -> None:
-        self.deletado_em = datetime.utcnow()
+        self.deletado_em = datetime.now(timezone.utc)
 
     def restore(self) -> None:
         self.deletado_em = None
 
-    @property
+    @hybrid_property
     def is_deleted(self) -> bool:
         return self.deletado_em is not None
+
+    @is_deleted.inplace.expression
+    @classmethod
+    def _is_deleted_expression(cls):
+        return cls.deletado_em.is_not(None)
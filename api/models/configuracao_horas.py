@@ -1,9 +1,8 @@
 """
 Model SQLAlchemy para configuração de horas por tipo de andamento por órgão.
 """
-from sqlalchemy import Column, String, Float, TIMESTAMP, Index, text
+from sqlalchemy import Column, String, Float, TIMESTAMP, Index, text, FetchedValue
 from sqlalchemy.dialects.postgresql import UUID
-import uuid
 
 from ..database import Base
 
@@ -15,11 +14,11 @@ class ConfiguracaoHorasAndamento(Base):
     por ocorrência, permitindo converter contagem de produtividade em horas.
     """
     __tablename__ = "configuracao_horas_andamento"
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
         server_default=text("gen_random_uuid()"),
     )
     orgao = Column(String(100), nullable=False)
@@ -28,6 +27,7 @@ class ConfiguracaoHorasAndamento(Base):
     atualizado_em = Column(
         TIMESTAMP(timezone=True),
         server_default=text("CURRENT_TIMESTAMP"),
+        server_onupdate=FetchedValue(),
     )
     atualizado_por = Column(String(100), nullable=True)
 
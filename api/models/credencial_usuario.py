@@ -1,10 +1,10 @@
 """
 Model SQLAlchemy para credenciais SEI armazenadas por usuário
 """
-from sqlalchemy import Column, String, Text, BigInteger, TIMESTAMP, Index, text
+from sqlalchemy import Column, String, LargeBinary, BigInteger, TIMESTAMP, Index, text, FetchedValue
 from sqlalchemy.dialects.postgresql import UUID
-from datetime import datetime
-import uuid
+from sqlalchemy.ext.hybrid import hybrid_property
+from datetime import datetime, timezone
 
 from ..database import Base
 
@@ -15,18 +15,18 @@ class CredencialUsuario(Base):
     Implementa soft delete — apenas uma credencial ativa por id_pessoa.
     """
     __tablename__ = "credenciais_usuario"
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
-        server_default=text("gen_random_uuid()"),
+        server_default=text("uuidv7()"),
     )
 
     id_pessoa = Column(BigInteger, nullable=False)
     cpf = Column(String(20), nullable=True)  # CPF from JWE usuario field
     usuario_sei = Column(String(100), nullable=False)
-    senha_encrypted = Column(Text, nullable=False)
+    senha_encrypted = Column(LargeBinary, nullable=False)  # token Fernet sem base64
     orgao = Column(String(50), nullable=False)
 
     criado_em = Column(
@@ -38,6 +38,7 @@ class CredencialUsuario(Base):
         TIMESTAMP(timezone=True),
         nullable=False,
         server_default=text("CURRENT_TIMESTAMP"),
+        server_onupdate=FetchedValue(),
     )
     deletado_em = Column(TIMESTAMP(timezone=True), nullable=True)
 
@@ -52,8 +53,13 @@ class CredencialUsuario(Base):
     )
 
     def soft_delete(self) -> None:
-        self.deletado_em = datetime.utcnow()
+        self.deletado_em = datetime.now(timezone.utc)
 
-    @property
+    @hybrid_property
     def is_deleted(self) -> bool:
         return self.deletado_em is not None
+
+    @is_deleted.inplace.expression
+    @classmethod
+    def _is_deleted_expression(cls):
+        return cls.deletado_em.is_not(None)
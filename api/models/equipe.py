@@ -1,11 +1,11 @@
 """
 Model SQLAlchemy para equipes
 """
-from sqlalchemy import Column, String, Text, TIMESTAMP, Index, text
+from sqlalchemy import Column, String, Text, TIMESTAMP, Index, text, FetchedValue
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from datetime import datetime
-import uuid
+from sqlalchemy.ext.hybrid import hybrid_property
+from datetime import datetime, timezone
 
 from ..database import Base
 
@@ -17,12 +17,12 @@ class Equipe(Base):
     Implementa soft delete através do campo deletado_em
     """
     __tablename__ = "equipes"
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
-        server_default=text("gen_random_uuid()"),
+        server_default=text("uuidv7()"),
         comment="Identificador único da equipe"
     )
 
@@ -55,6 +55,7 @@ class Equipe(Base):
         TIMESTAMP(timezone=True),
         nullable=False,
         server_default=text("CURRENT_TIMESTAMP"),
+        server_onupdate=FetchedValue(),
         comment="Data e hora da última atualização"
     )
 
@@ -64,7 +65,8 @@ class Equipe(Base):
         comment="Data e hora da exclusão (soft delete)"
     )
 
-    membros = relationship("EquipeMembro", back_populates="equipe", lazy="selectin")
+    # raise_on_sql: carregar explicitamente com selectinload(Equipe.membros)
+    membros = relationship("EquipeMembro", back_populates="equipe", lazy="raise_on_sql")
 
     __table_args__ = (
         Index(
@@ -85,11 +87,16 @@ class Equipe(Base):
         )
 
     def soft_delete(self) -> None:
-        self.deletado_em = datetime.utcnow()
+        self.deletado_em = datetime.now(timezone.utc)
 
     def restore(self) -> None:
         self.deletado_em = None
 
-    @property
+    @hybrid_property
     def is_deleted(self) -> bool:
         return self.deletado_em is not None
+
+    @is_deleted.inplace.expression
+    @classmethod
+    def _is_deleted_expression(cls):
+        return cls.deletado_em.is_not(None)
@@ -4,8 +4,8 @@ Model SQLAlchemy para membros de equipe
 from sqlalchemy import Column, String, TIMESTAMP, Index, ForeignKey, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from datetime import datetime
-import uuid
+from sqlalchemy.ext.hybrid import hybrid_property
+from datetime import datetime, timezone
 
 from ..database import Base
 
@@ -21,14 +21,13 @@ class EquipeMembro(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
-        server_default=text("gen_random_uuid()"),
+        server_default=text("uuidv7()"),
         comment="Identificador único do membro"
     )
 
     equipe_id = Column(
         UUID(as_uuid=True),
-        ForeignKey("equipes.id", ondelete="CASCADE"),
+        ForeignKey("equipes.id", ondelete="CASCADE", deferrable=True, initially="IMMEDIATE"),
         nullable=False,
         comment="ID da equipe"
     )
@@ -59,18 +58,16 @@ class EquipeMembro(Base):
         comment="Data e hora da exclusão (soft delete)"
     )
 
-    equipe = relationship("Equipe", back_populates="membros")
+    # raise_on_sql: carregar explicitamente com selectinload(EquipeMembro.equipe)
+    equipe = relationship("Equipe", back_populates="membros", lazy="raise_on_sql")
 
     __table_args__ = (
         Index(
             'uq_equipe_membro_usuario',
             'equipe_id', 'usuario',
             unique=True,
-            postgresql_where=text("deletado_em IS NULL")
-        ),
-        Index(
-            'idx_membro_equipe',
-            'equipe_id',
+            # INCLUDE papel: checagens de membro/admin viram index-only scan
+            postgresql_include=['papel'],
             postgresql_where=text("deletado_em IS NULL")
         ),
         Index(
@@ -92,11 +89,16 @@ class EquipeMembro(Base):
         )
 
     def soft_delete(self) -> None:
-        self.deletado_em = datetime.utcnow()
+        self.deletado_em = datetime.now(timezone.utc)
 
     def restore(self) -> None:
         self.deletado_em = None
 
-    @property
+    @hybrid_property
     def is_deleted(self) -> bool:
         return self.deletado_em is not None
+
+    @is_deleted.inplace.expression
+    @classmethod
+    def _is_deleted_expression(cls):
+        return cls.deletado_em.is_not(None)
@@ -1,22 +1,22 @@
 """
 Model de Edge (conexao) de um Fluxo de Processo
 """
-from sqlalchemy import Column, String, Integer, Boolean, ForeignKey, TIMESTAMP, Index, text
+from sqlalchemy import Column, String, Integer, Boolean, ForeignKey, TIMESTAMP, Index, text, FetchedValue
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
-from datetime import datetime
-import uuid
+from sqlalchemy.ext.hybrid import hybrid_property
+from datetime import datetime, timezone
 
 from ..database import Base
 
 
 class FluxoEdge(Base):
     __tablename__ = "fluxo_edges"
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
         server_default=text("gen_random_uuid()"),
         comment="Identificador unico da edge",
     )
@@ -91,6 +91,7 @@ class FluxoEdge(Base):
         TIMESTAMP(timezone=True),
         nullable=False,
         server_default=text("CURRENT_TIMESTAMP"),
+        server_onupdate=FetchedValue(),
         comment="Data e hora da ultima atualizacao",
     )
 
@@ -120,14 +121,19 @@ class FluxoEdge(Base):
     )
 
     def soft_delete(self) -> None:
-        self.deletado_em = datetime.utcnow()
+        self.deletado_em = datetime.now(timezone.utc)
 
     def restore(self) -> None:
         self.deletado_em = None
 
-    @property
+    @hybrid_property
     def is_deleted(self) -> bool:
         return self.deletado_em is not None
 
+    @is_deleted.inplace.expression
+    @classmethod
+    def _is_deleted_expression(cls):
+        return cls.deletado_em.is_not(None)
+
     def __repr__(self) -> str:
         return f"<FluxoEdge(id={self.id}, edge_id='{self.edge_id}', {self.source_node_id}->{self.target_node_id})>"
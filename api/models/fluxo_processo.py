@@ -1,22 +1,22 @@
 """
 Model de vinculacao Processo-Fluxo (process-to-flow assignment)
 """
-from sqlalchemy import Column, String, Text, ForeignKey, TIMESTAMP, Index, text
+from sqlalchemy import Column, String, Text, ForeignKey, TIMESTAMP, Index, text, FetchedValue
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
-from datetime import datetime
-import uuid
+from sqlalchemy.ext.hybrid import hybrid_property
+from datetime import datetime, timezone
 
 from ..database import Base
 
 
 class FluxoProcesso(Base):
     __tablename__ = "fluxo_processos"
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
         server_default=text("gen_random_uuid()"),
         comment="Identificador unico da vinculacao",
     )
@@ -97,6 +97,7 @@ class FluxoProcesso(Base):
         TIMESTAMP(timezone=True),
         nullable=False,
         server_default=text("CURRENT_TIMESTAMP"),
+        server_onupdate=FetchedValue(),
         comment="Data e hora da ultima atualizacao",
     )
 
@@ -131,14 +132,19 @@ class FluxoProcesso(Base):
     )
 
     def soft_delete(self) -> None:
-        self.deletado_em = datetime.utcnow()
+        self.deletado_em = datetime.now(timezone.utc)
 
     def restore(self) -> None:
         self.deletado_em = None
 
-    @property
+    @hybrid_property
     def is_deleted(self) -> bool:
         return self.deletado_em is not None
 
+    @is_deleted.inplace.expression
+    @classmethod
+    def _is_deleted_expression(cls):
+        return cls.deletado_em.is_not(None)
+
     def __repr__(self) -> str:
         return f"<FluxoProcesso(id={self.id}, fluxo_id={self.fluxo_id}, processo='{self.numero_processo}')>"
@@ -1,13 +1,26 @@
 """
 Model SQLAlchemy para histórico de pesquisas de processos - PostgreSQL
 """
-from sqlalchemy import Column, String, Text, TIMESTAMP, Index, text
+from sqlalchemy import Column, String, Text, TIMESTAMP, Index, Computed, CheckConstraint, text, insert, update, FetchedValue
 from sqlalchemy.dialects.postgresql import UUID
-from datetime import datetime
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.hybrid import hybrid_property
+from datetime import datetime, timezone
+from operator import attrgetter
+from typing import Iterable
 import uuid
 
 from ..database import Base
 
+# Chaves de to_dict (iguais aos nomes das colunas), montadas uma única vez
+_TO_DICT_KEYS = (
+    'id', 'numero_processo', 'numero_processo_formatado', 'usuario', 'id_unidade',
+    'caixa_contexto', 'criado_em', 'atualizado_em', 'deletado_em',
+)
+
+# Lê todas as colunas de uma vez (uma chamada em C) em vez de nove acessos
+_CAMPOS_TO_DICT = attrgetter(*_TO_DICT_KEYS)
+
 
 class HistoricoPesquisa(Base):
     """
@@ -16,12 +29,12 @@ class HistoricoPesquisa(Base):
     Implementa soft delete através do campo deletado_em
     """
     __tablename__ = "historico_pesquisas"
+    __mapper_args__ = {"eager_defaults": True}
 
     # Campos
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
         server_default=text("gen_random_uuid()"),
         comment="Identificador único da pesquisa"
     )
@@ -34,6 +47,14 @@ class HistoricoPesquisa(Base):
 
     numero_processo_formatado = Column(
         String(50),
+        Computed(
+            "CASE WHEN numero_processo ~ '^[0-9]{17}$' THEN "
+            "substring(numero_processo from 1 for 5) || '.' || "
+            "substring(numero_processo from 6 for 6) || '/' || "
+            "substring(numero_processo from 12 for 4) || '-' || "
+            "substring(numero_processo from 16 for 2) END",
+            persisted=True,
+        ),
         nullable=True,
         comment="Número do processo formatado (ex: 12345.678901/2024-99)"
     )
@@ -67,6 +88,7 @@ class HistoricoPesquisa(Base):
         TIMESTAMP(timezone=True),
         nullable=False,
         server_default=text("CURRENT_TIMESTAMP"),
+        server_onupdate=FetchedValue(),
         comment="Data e hora da última atualização"
     )
 
@@ -78,21 +100,23 @@ class HistoricoPesquisa(Base):
 
     # Índices compostos para melhor performance no PostgreSQL
     __table_args__ = (
-        Index(
-            'idx_historico_usuario',
-            'usuario',
-            postgresql_where=text("deletado_em IS NULL")
+        CheckConstraint(
+            "numero_processo ~ '^[0-9]+$'",
+            name="ck_historico_pesquisas_numero_processo_digits"
         ),
         Index(
-            'idx_historico_numero_processo',
+            # Só igualdade (ORDER BY/GROUP BY usam outros caminhos): hash guarda
+            # 4 bytes por linha em vez da string inteira
+            'idx_historico_numero_processo_hash',
             'numero_processo',
+            postgresql_using='hash',
             postgresql_where=text("deletado_em IS NULL")
         ),
         Index(
-            'idx_historico_criado_em',
+            'brin_historico_pesquisas_criado_em',
             'criado_em',
-            postgresql_using='btree',
-            postgresql_ops={'criado_em': 'DESC'},
+            postgresql_using='brin',
+            postgresql_with={'pages_per_range': 32},
             postgresql_where=text("deletado_em IS NULL")
         ),
         Index(
@@ -108,8 +132,16 @@ class HistoricoPesquisa(Base):
             'usuario',
             'numero_processo',
             'id_unidade',
+            postgresql_include=['criado_em', 'id'],
             postgresql_where=text("deletado_em IS NULL")
         ),
+        Index(
+            # Lixeira/restauração: só as linhas deletadas de cada usuário
+            'idx_historico_usuario_deletado',
+            'usuario',
+            'deletado_em',
+            postgresql_where=text("deletado_em IS NOT NULL")
+        ),
         {'comment': 'Tabela de histórico de pesquisas de processos do SEI'}
     )
 
@@ -125,27 +157,50 @@ class HistoricoPesquisa(Base):
 
     def soft_delete(self) -> None:
         """Marca o registro como deletado (soft delete)"""
-        self.deletado_em = datetime.utcnow()
+        self.deletado_em = datetime.now(timezone.utc)
+
+    @classmethod
+    async def soft_delete_many(cls, session: AsyncSession, ids: Iterable[uuid.UUID]) -> int:
+        """
+        Soft delete de vários registros em um único UPDATE, sem carregá-los no
+        ORM. Retorna quantos registros foram marcados.
+        """
+        result = await session.execute(
+            update(cls)
+            .where(cls.id.in_(list(ids)), cls.deletado_em.is_(None))
+            .values(deletado_em=datetime.now(timezone.utc))
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+
+    @classmethod
+    async def bulk_create(cls, session: AsyncSession, rows: list[dict]) -> None:
+        """
+        Insere vários registros (dicts coluna -> valor) sem instanciar o model.
+        O asyncpg envia tudo como INSERT de várias linhas (insertmanyvalues),
+        em lotes de 1000 por statement.
+        """
+        if not rows:
+            return
+        await session.execute(insert(cls), rows)
 
     def restore(self) -> None:
         """Restaura um registro deletado"""
         self.deletado_em = None
 
-    @property
+    @hybrid_property
     def is_deleted(self) -> bool:
         """Verifica se o registro está deletado"""
         return self.deletado_em is not None
 
+    @is_deleted.inplace.expression
+    @classmethod
+    def _is_deleted_expression(cls):
+        return cls.deletado_em.is_not(None)
+
     def to_dict(self) -> dict:
-        """Converte o model para dicionário"""
-        return {
-            "id": str(self.id),
-            "numero_processo": self.numero_processo,
-            "numero_processo_formatado": self.numero_processo_formatado,
-            "usuario": self.usuario,
-            "id_unidade": self.id_unidade,
-            "caixa_contexto": self.caixa_contexto,
-            "criado_em": self.criado_em.isoformat() if self.criado_em else None,
-            "atualizado_em": self.atualizado_em.isoformat() if self.atualizado_em else None,
-            "deletado_em": self.deletado_em.isoformat() if self.deletado_em else None,
-        }
+        """
+        Converte o model para dicionário. O id (UUID) e as datas (datetime) ficam
+        nativos: a formatação é feita na serialização da resposta (orjson).
+        """
+        return dict(zip(_TO_DICT_KEYS, _CAMPOS_TO_DICT(self)))
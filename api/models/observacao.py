@@ -1,11 +1,11 @@
 """
 Model SQLAlchemy para observacoes de processos
 """
-from sqlalchemy import Column, String, Text, TIMESTAMP, Index, ForeignKey, text
+from sqlalchemy import Column, String, Text, TIMESTAMP, Index, ForeignKey, CheckConstraint, text, FetchedValue
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from datetime import datetime
-import uuid
+from sqlalchemy.ext.hybrid import hybrid_property
+from datetime import datetime, timezone
 
 from ..database import Base
 
@@ -19,12 +19,12 @@ class Observacao(Base):
     Suporta mencoes via relationship com ObservacaoMencao.
     """
     __tablename__ = "observacoes"
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
-        server_default=text("gen_random_uuid()"),
+        server_default=text("uuidv7()"),
         comment="Identificador unico da observacao"
     )
 
@@ -50,7 +50,7 @@ class Observacao(Base):
 
     equipe_id = Column(
         UUID(as_uuid=True),
-        ForeignKey("equipes.id", ondelete="SET NULL"),
+        ForeignKey("equipes.id", ondelete="SET NULL", deferrable=True, initially="IMMEDIATE"),
         nullable=True,
         comment="ID da equipe (obrigatorio quando escopo=equipe)"
     )
@@ -79,6 +79,7 @@ class Observacao(Base):
         TIMESTAMP(timezone=True),
         nullable=False,
         server_default=text("CURRENT_TIMESTAMP"),
+        server_onupdate=FetchedValue(),
         comment="Data e hora da ultima atualizacao"
     )
 
@@ -107,10 +108,17 @@ class Observacao(Base):
     )
 
     __table_args__ = (
+        CheckConstraint(
+            "numero_processo ~ '^[0-9]+$'",
+            name="ck_observacoes_numero_processo_digits"
+        ),
+        # Listagem por processo: só observações raiz, já na ordem de criado_em.
+        # Buscas só por numero_processo usam o prefixo de idx_observacao_escopo.
         Index(
-            'idx_observacao_processo',
+            'idx_observacao_processo_raiz',
             'numero_processo',
-            postgresql_where=text("deletado_em IS NULL")
+            'criado_em',
+            postgresql_where=text("deletado_em IS NULL AND parent_id IS NULL")
         ),
         Index(
             'idx_observacao_usuario',
@@ -133,6 +141,13 @@ class Observacao(Base):
             'parent_id',
             postgresql_where=text("parent_id IS NOT NULL AND deletado_em IS NULL")
         ),
+        Index(
+            'brin_observacoes_criado_em',
+            'criado_em',
+            postgresql_using='brin',
+            postgresql_with={'pages_per_range': 32},
+            postgresql_where=text("deletado_em IS NULL")
+        ),
         {'comment': 'Tabela de observacoes sobre processos'}
     )
 
@@ -146,11 +161,16 @@ class Observacao(Base):
         )
 
     def soft_delete(self) -> None:
-        self.deletado_em = datetime.utcnow()
+        self.deletado_em = datetime.now(timezone.utc)
 
     def restore(self) -> None:
         self.deletado_em = None
 
-    @property
+    @hybrid_property
     def is_deleted(self) -> bool:
         return self.deletado_em is not None
+
+    @is_deleted.inplace.expression
+    @classmethod
+    def _is_deleted_expression(cls):
+        return cls.deletado_em.is_not(None)
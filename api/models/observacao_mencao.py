@@ -4,8 +4,7 @@ Model SQLAlchemy para mencoes em observacoes
 from sqlalchemy import Column, String, TIMESTAMP, ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from datetime import datetime
-import uuid
+from datetime import datetime, timezone
 
 from ..database import Base
 
@@ -21,7 +20,6 @@ class ObservacaoMencao(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
         server_default=text("gen_random_uuid()"),
         comment="Identificador unico da mencao"
     )
@@ -74,7 +72,7 @@ class ObservacaoMencao(Base):
         )
 
     def marcar_visto(self) -> None:
-        self.visto_em = datetime.utcnow()
+        self.visto_em = datetime.now(timezone.utc)
 
     @property
     def foi_visto(self) -> bool:
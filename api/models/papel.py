@@ -1,12 +1,12 @@
 """
 Model SQLAlchemy para papéis (roles) do sistema RBAC.
 """
-from datetime import datetime
-import uuid
+from datetime import datetime, timezone
 
-from sqlalchemy import Column, String, Text, Boolean, TIMESTAMP, Index, text
+from sqlalchemy import Column, String, Text, Boolean, TIMESTAMP, Index, text, FetchedValue
 from sqlalchemy.dialects.postgresql import UUID, ARRAY
 from sqlalchemy.orm import relationship
+from sqlalchemy.ext.hybrid import hybrid_property
 
 from ..database import Base
 
@@ -17,11 +17,11 @@ class Papel(Base):
     Soft delete — apenas um papel ativo por slug.
     """
     __tablename__ = "papeis"
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
         server_default=text("gen_random_uuid()"),
     )
 
@@ -40,6 +40,7 @@ class Papel(Base):
         TIMESTAMP(timezone=True),
         nullable=False,
         server_default=text("CURRENT_TIMESTAMP"),
+        server_onupdate=FetchedValue(),
     )
     deletado_em = Column(TIMESTAMP(timezone=True), nullable=True)
 
@@ -57,8 +58,13 @@ class Papel(Base):
     )
 
     def soft_delete(self) -> None:
-        self.deletado_em = datetime.utcnow()
+        self.deletado_em = datetime.now(timezone.utc)
 
-    @property
+    @hybrid_property
     def is_deleted(self) -> bool:
         return self.deletado_em is not None
+
+    @is_deleted.inplace.expression
+    @classmethod
+    def _is_deleted_expression(cls):
+        return cls.deletado_em.is_not(None)
@@ -1,10 +1,10 @@
 """
 Model SQLAlchemy para entendimentos de processos gerados por IA
 """
-from sqlalchemy import Column, String, Text, TIMESTAMP, Index, text
+from sqlalchemy import Column, String, Text, TIMESTAMP, Index, CheckConstraint, text, FetchedValue
 from sqlalchemy.dialects.postgresql import UUID
-from datetime import datetime
-import uuid
+from sqlalchemy.ext.hybrid import hybrid_property
+from datetime import datetime, timezone
 
 from ..database import Base
 
@@ -16,12 +16,12 @@ class ProcessoEntendimento(Base):
     Implementa soft delete atraves do campo deletado_em.
     """
     __tablename__ = "processo_entendimentos"
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
-        server_default=text("gen_random_uuid()"),
+        server_default=text("uuidv7()"),
         comment="Identificador unico do entendimento"
     )
 
@@ -48,6 +48,7 @@ class ProcessoEntendimento(Base):
         TIMESTAMP(timezone=True),
         nullable=False,
         server_default=text("CURRENT_TIMESTAMP"),
+        server_onupdate=FetchedValue(),
         comment="Data e hora da ultima atualizacao"
     )
 
@@ -58,12 +59,23 @@ class ProcessoEntendimento(Base):
     )
 
     __table_args__ = (
+        CheckConstraint(
+            "numero_processo ~ '^[0-9]+$'",
+            name="ck_processo_entendimentos_numero_processo_digits"
+        ),
         Index(
             'idx_entendimento_processo_unique',
             'numero_processo',
             unique=True,
             postgresql_where=text("deletado_em IS NULL")
         ),
+        Index(
+            'brin_processo_entendimentos_criado_em',
+            'criado_em',
+            postgresql_using='brin',
+            postgresql_with={'pages_per_range': 32},
+            postgresql_where=text("deletado_em IS NULL")
+        ),
         {'comment': 'Entendimentos de processos gerados por IA'}
     )
 
@@ -76,11 +88,16 @@ class ProcessoEntendimento(Base):
         )
 
     def soft_delete(self) -> None:
-        self.deletado_em = datetime.utcnow()
+        self.deletado_em = datetime.now(timezone.utc)
 
     def restore(self) -> None:
         self.deletado_em = None
 
-    @property
+    @hybrid_property
     def is_deleted(self) -> bool:
         return self.deletado_em is not None
+
+    @is_deleted.inplace.expression
+    @classmethod
+    def _is_deleted_expression(cls):
+        return cls.deletado_em.is_not(None)
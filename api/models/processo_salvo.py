@@ -1,10 +1,13 @@
 """
 Model SQLAlchemy para processos salvos (junção tag ↔ processo)
 """
-from sqlalchemy import Column, String, Text, TIMESTAMP, Index, ForeignKey, text
+from sqlalchemy import Column, String, Text, TIMESTAMP, Index, Computed, ForeignKey, CheckConstraint, text, update
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from datetime import datetime
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.hybrid import hybrid_property
+from datetime import datetime, timezone
+from typing import Iterable
 import uuid
 
 from ..database import Base
@@ -21,14 +24,13 @@ class ProcessoSalvo(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
-        server_default=text("gen_random_uuid()"),
+        server_default=text("uuidv7()"),
         comment="Identificador único do processo salvo"
     )
 
     tag_id = Column(
         UUID(as_uuid=True),
-        ForeignKey("tags.id", ondelete="CASCADE"),
+        ForeignKey("tags.id", ondelete="CASCADE", deferrable=True, initially="IMMEDIATE"),
         nullable=False,
         comment="ID da tag associada"
     )
@@ -41,6 +43,14 @@ class ProcessoSalvo(Base):
 
     numero_processo_formatado = Column(
         String(50),
+        Computed(
+            "CASE WHEN numero_processo ~ '^[0-9]{17}$' THEN "
+            "substring(numero_processo from 1 for 5) || '.' || "
+            "substring(numero_processo from 6 for 6) || '/' || "
+            "substring(numero_processo from 12 for 4) || '-' || "
+            "substring(numero_processo from 16 for 2) END",
+            persisted=True,
+        ),
         nullable=True,
         comment="Número do processo formatado"
     )
@@ -64,9 +74,13 @@ class ProcessoSalvo(Base):
         comment="Data e hora da exclusão (soft delete)"
     )
 
-    tag = relationship("Tag", back_populates="processos")
+    tag = relationship("Tag", back_populates="processos", lazy="raise_on_sql")
 
     __table_args__ = (
+        CheckConstraint(
+            "numero_processo ~ '^[0-9]+$'",
+            name="ck_processos_salvos_numero_processo_digits"
+        ),
         Index(
             'uq_processo_salvo_tag_numero',
             'tag_id', 'numero_processo',
@@ -74,8 +88,10 @@ class ProcessoSalvo(Base):
             postgresql_where=text("deletado_em IS NULL")
         ),
         Index(
-            'idx_processo_salvo_tag',
-            'tag_id',
+            # Conteúdo de um grupo, mais recentes primeiro: varredura já ordenada
+            'idx_processo_salvo_tag_criado',
+            'tag_id', 'criado_em',
+            postgresql_ops={'criado_em': 'DESC'},
             postgresql_where=text("deletado_em IS NULL")
         ),
         Index(
@@ -83,6 +99,13 @@ class ProcessoSalvo(Base):
             'numero_processo',
             postgresql_where=text("deletado_em IS NULL")
         ),
+        Index(
+            'brin_processos_salvos_criado_em',
+            'criado_em',
+            postgresql_using='brin',
+            postgresql_with={'pages_per_range': 32},
+            postgresql_where=text("deletado_em IS NULL")
+        ),
         {'comment': 'Tabela de processos salvos em tags'}
     )
 
@@ -96,11 +119,30 @@ class ProcessoSalvo(Base):
         )
 
     def soft_delete(self) -> None:
-        self.deletado_em = datetime.utcnow()
+        self.deletado_em = datetime.now(timezone.utc)
+
+    @classmethod
+    async def soft_delete_many(cls, session: AsyncSession, ids: Iterable[uuid.UUID]) -> int:
+        """
+        Soft delete de vários registros em um único UPDATE, sem carregá-los no
+        ORM. Retorna quantos registros foram marcados.
+        """
+        result = await session.execute(
+            update(cls)
+            .where(cls.id.in_(list(ids)), cls.deletado_em.is_(None))
+            .values(deletado_em=datetime.now(timezone.utc))
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
 
     def restore(self) -> None:
         self.deletado_em = None
 
-    @property
+    @hybrid_property
     def is_deleted(self) -> bool:
         return self.deletado_em is not None
+
+    @is_deleted.inplace.expression
+    @classmethod
+    def _is_deleted_expression(cls):
+        return cls.deletado_em.is_not(None)
@@ -1,10 +1,10 @@
 """
 Model SQLAlchemy para situação atual de processos gerada por IA
 """
-from sqlalchemy import Column, String, Integer, Text, TIMESTAMP, Index, text
+from sqlalchemy import Column, String, Integer, Text, TIMESTAMP, Index, text, FetchedValue
 from sqlalchemy.dialects.postgresql import UUID
-from datetime import datetime
-import uuid
+from sqlalchemy.ext.hybrid import hybrid_property
+from datetime import datetime, timezone
 
 from ..database import Base
 
@@ -16,11 +16,11 @@ class ProcessoSituacao(Base):
     Implements soft delete via deletado_em.
     """
     __tablename__ = "processo_situacoes"
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
         server_default=text("gen_random_uuid()"),
         comment="Identificador unico",
     )
@@ -60,6 +60,7 @@ class ProcessoSituacao(Base):
         TIMESTAMP(timezone=True),
         nullable=False,
         server_default=text("CURRENT_TIMESTAMP"),
+        server_onupdate=FetchedValue(),
         comment="Data e hora da ultima atualizacao",
     )
 
@@ -89,11 +90,16 @@ class ProcessoSituacao(Base):
         )
 
     def soft_delete(self) -> None:
-        self.deletado_em = datetime.utcnow()
+        self.deletado_em = datetime.now(timezone.utc)
 
     def restore(self) -> None:
         self.deletado_em = None
 
-    @property
+    @hybrid_property
     def is_deleted(self) -> bool:
         return self.deletado_em is not None
+
+    @is_deleted.inplace.expression
+    @classmethod
+    def _is_deleted_expression(cls):
+        return cls.deletado_em.is_not(None)
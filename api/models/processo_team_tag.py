@@ -1,11 +1,11 @@
 """
 Model SQLAlchemy para associacao processo <-> team tag
 """
-from sqlalchemy import Column, String, TIMESTAMP, Index, ForeignKey, text
+from sqlalchemy import Column, String, TIMESTAMP, Index, ForeignKey, CheckConstraint, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from datetime import datetime
-import uuid
+from sqlalchemy.ext.hybrid import hybrid_property
+from datetime import datetime, timezone
 
 from ..database import Base
 
@@ -21,14 +21,13 @@ class ProcessoTeamTag(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
-        server_default=text("gen_random_uuid()"),
+        server_default=text("uuidv7()"),
         comment="Identificador unico da associacao"
     )
 
     team_tag_id = Column(
         UUID(as_uuid=True),
-        ForeignKey("team_tags.id", ondelete="CASCADE"),
+        ForeignKey("team_tags.id", ondelete="CASCADE", deferrable=True, initially="IMMEDIATE"),
         nullable=False,
         comment="ID da team tag"
     )
@@ -58,9 +57,13 @@ class ProcessoTeamTag(Base):
         comment="Data e hora da exclusao (soft delete)"
     )
 
-    team_tag = relationship("TeamTag", back_populates="processos")
+    team_tag = relationship("TeamTag", back_populates="processos", lazy="raise_on_sql")
 
     __table_args__ = (
+        CheckConstraint(
+            "numero_processo ~ '^[0-9]+$'",
+            name="ck_processo_team_tags_numero_processo_digits"
+        ),
         Index(
             'uq_processo_team_tag',
             'team_tag_id', 'numero_processo',
@@ -72,6 +75,13 @@ class ProcessoTeamTag(Base):
             'numero_processo',
             postgresql_where=text("deletado_em IS NULL")
         ),
+        Index(
+            'brin_processo_team_tags_criado_em',
+            'criado_em',
+            postgresql_using='brin',
+            postgresql_with={'pages_per_range': 32},
+            postgresql_where=text("deletado_em IS NULL")
+        ),
         {'comment': 'Associacao entre processos e tags de equipe'}
     )
 
@@ -85,11 +95,16 @@ class ProcessoTeamTag(Base):
         )
 
     def soft_delete(self) -> None:
-        self.deletado_em = datetime.utcnow()
+        self.deletado_em = datetime.now(timezone.utc)
 
     def restore(self) -> None:
         self.deletado_em = None
 
-    @property
+    @hybrid_property
     def is_deleted(self) -> bool:
         return self.deletado_em is not None
+
+    @is_deleted.inplace.expression
+    @classmethod
+    def _is_deleted_expression(cls):
+        return cls.deletado_em.is_not(None)
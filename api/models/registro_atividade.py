@@ -3,8 +3,8 @@ Model SQLAlchemy para registro de atividades do sistema - PostgreSQL
 """
 from sqlalchemy import Column, String, Text, Integer, TIMESTAMP, Index, text
 from sqlalchemy.dialects.postgresql import UUID
-from datetime import datetime
-import uuid
+from sqlalchemy.ext.hybrid import hybrid_property
+from datetime import datetime, timezone
 
 from ..database import Base
 
@@ -19,7 +19,6 @@ class RegistroAtividade(Base):
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
         server_default=text("gen_random_uuid()"),
         comment="Identificador unico da atividade"
     )
@@ -136,15 +135,20 @@ class RegistroAtividade(Base):
         )
 
     def soft_delete(self) -> None:
-        self.deletado_em = datetime.utcnow()
+        self.deletado_em = datetime.now(timezone.utc)
 
     def restore(self) -> None:
         self.deletado_em = None
 
-    @property
+    @hybrid_property
     def is_deleted(self) -> bool:
         return self.deletado_em is not None
 
+    @is_deleted.inplace.expression
+    @classmethod
+    def _is_deleted_expression(cls):
+        return cls.deletado_em.is_not(None)
+
     def to_dict(self) -> dict:
         return {
             "id": str(self.id),
@@ -3,11 +3,11 @@ Model SQLAlchemy para grupos de processos.
 
 Grupos podem ser pessoais (equipe_id IS NULL) ou de equipe (equipe_id set).
 """
-from sqlalchemy import Column, String, TIMESTAMP, Index, ForeignKey, text
+from sqlalchemy import Column, String, TIMESTAMP, Index, ForeignKey, text, FetchedValue
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from datetime import datetime
-import uuid
+from sqlalchemy.ext.hybrid import hybrid_property
+from datetime import datetime, timezone
 
 from ..database import Base
 
@@ -21,12 +21,12 @@ class Tag(Base):
     Implementa soft delete atraves do campo deletado_em.
     """
     __tablename__ = "tags"
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
-        server_default=text("gen_random_uuid()"),
+        server_default=text("uuidv7()"),
         comment="Identificador unico do grupo"
     )
 
@@ -66,6 +66,7 @@ class Tag(Base):
         TIMESTAMP(timezone=True),
         nullable=False,
         server_default=text("CURRENT_TIMESTAMP"),
+        server_onupdate=FetchedValue(),
         comment="Data e hora da ultima atualizacao"
     )
 
@@ -75,7 +76,8 @@ class Tag(Base):
         comment="Data e hora da exclusao (soft delete)"
     )
 
-    processos = relationship("ProcessoSalvo", back_populates="tag", lazy="selectin")
+    # raise_on_sql: carregar explicitamente com selectinload(Tag.processos)
+    processos = relationship("ProcessoSalvo", back_populates="tag", lazy="raise_on_sql")
 
     __table_args__ = (
         Index(
@@ -90,16 +92,6 @@ class Tag(Base):
             unique=True,
             postgresql_where=text("deletado_em IS NULL AND equipe_id IS NOT NULL")
         ),
-        Index(
-            'idx_tag_usuario',
-            'usuario',
-            postgresql_where=text("deletado_em IS NULL AND equipe_id IS NULL")
-        ),
-        Index(
-            'idx_tags_equipe_id',
-            'equipe_id',
-            postgresql_where=text("deletado_em IS NULL AND equipe_id IS NOT NULL")
-        ),
         {'comment': 'Tabela de grupos de processos (pessoais ou de equipe)'}
     )
 
@@ -113,11 +105,16 @@ class Tag(Base):
         )
 
     def soft_delete(self) -> None:
-        self.deletado_em = datetime.utcnow()
+        self.deletado_em = datetime.now(timezone.utc)
 
     def restore(self) -> None:
         self.deletado_em = None
 
-    @property
+    @hybrid_property
     def is_deleted(self) -> bool:
         return self.deletado_em is not None
+
+    @is_deleted.inplace.expression
+    @classmethod
+    def _is_deleted_expression(cls):
+        return cls.deletado_em.is_not(None)
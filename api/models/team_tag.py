@@ -3,11 +3,11 @@ Model SQLAlchemy para tags (rotulos aplicaveis a processos).
 
 Tags podem ser pessoais (equipe_id IS NULL) ou de equipe (equipe_id set).
 """
-from sqlalchemy import Column, String, TIMESTAMP, Index, ForeignKey, text
+from sqlalchemy import Column, String, TIMESTAMP, Index, ForeignKey, text, FetchedValue
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from datetime import datetime
-import uuid
+from sqlalchemy.ext.hybrid import hybrid_property
+from datetime import datetime, timezone
 
 from ..database import Base
 
@@ -21,12 +21,12 @@ class TeamTag(Base):
     Implementa soft delete atraves do campo deletado_em.
     """
     __tablename__ = "team_tags"
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
-        server_default=text("gen_random_uuid()"),
+        server_default=text("uuidv7()"),
         comment="Identificador unico da tag"
     )
 
@@ -66,6 +66,7 @@ class TeamTag(Base):
         TIMESTAMP(timezone=True),
         nullable=False,
         server_default=text("CURRENT_TIMESTAMP"),
+        server_onupdate=FetchedValue(),
         comment="Data e hora da ultima atualizacao"
     )
 
@@ -75,7 +76,8 @@ class TeamTag(Base):
         comment="Data e hora da exclusao (soft delete)"
     )
 
-    processos = relationship("ProcessoTeamTag", back_populates="team_tag", lazy="selectin")
+    # raise_on_sql: carregar explicitamente com selectinload(TeamTag.processos)
+    processos = relationship("ProcessoTeamTag", back_populates="team_tag", lazy="raise_on_sql")
 
     __table_args__ = (
         # Team tags: unique name per team
@@ -115,11 +117,16 @@ class TeamTag(Base):
         )
 
     def soft_delete(self) -> None:
-        self.deletado_em = datetime.utcnow()
+        self.deletado_em = datetime.now(timezone.utc)
 
     def restore(self) -> None:
         self.deletado_em = None
 
-    @property
+    @hybrid_property
     def is_deleted(self) -> bool:
         return self.deletado_em is not None
+
+    @is_deleted.inplace.expression
+    @classmethod
+    def _is_deleted_expression(cls):
+        return cls.deletado_em.is_not(None)
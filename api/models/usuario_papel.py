@@ -2,12 +2,12 @@
 Model SQLAlchemy para atribuição de papel por usuario_sei (email SEI).
 Papel é vinculado ao email, não ao id_pessoa — usuarios com mesmo email compartilham o papel.
 """
-from datetime import datetime
-import uuid
+from datetime import datetime, timezone
 
-from sqlalchemy import Column, String, TIMESTAMP, Index, ForeignKey, text
+from sqlalchemy import Column, String, TIMESTAMP, Index, ForeignKey, text, FetchedValue
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
+from sqlalchemy.ext.hybrid import hybrid_property
 
 from ..database import Base
 
@@ -18,11 +18,11 @@ class UsuarioPapel(Base):
     Apenas uma atribuição ativa por usuario_sei (soft delete aware).
     """
     __tablename__ = "usuario_papel"
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
         server_default=text("gen_random_uuid()"),
     )
 
@@ -43,6 +43,7 @@ class UsuarioPapel(Base):
         TIMESTAMP(timezone=True),
         nullable=False,
         server_default=text("CURRENT_TIMESTAMP"),
+        server_onupdate=FetchedValue(),
     )
     deletado_em = Column(TIMESTAMP(timezone=True), nullable=True)
 
@@ -65,8 +66,13 @@ class UsuarioPapel(Base):
     )
 
     def soft_delete(self) -> None:
-        self.deletado_em = datetime.utcnow()
+        self.deletado_em = datetime.now(timezone.utc)
 
-    @property
+    @hybrid_property
     def is_deleted(self) -> bool:
         return self.deletado_em is not None
+
+    @is_deleted.inplace.expression
+    @classmethod
+    def _is_deleted_expression(cls):
+        return cls.deletado_em.is_not(None)
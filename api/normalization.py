@@ -5,20 +5,47 @@ Aceita tanto formato com pontuação (00002.012041/2025-95)
 quanto apenas dígitos (00002012041202595).
 """
 import re
+from functools import lru_cache
+from typing import Annotated
 
+from pydantic import AfterValidator
 
+# Compilado uma vez: a normalização roda em toda requisição que recebe um número
+_NAO_DIGITOS = re.compile(r'\D')
+
+# Tabela de remoção para entradas ASCII (o caso normal): str.translate é um laço
+# em C sem a máquina de estados do regex. Entradas não-ASCII seguem pelo regex,
+# que preserva a semântica Unicode de \D.
+_REMOVER_NAO_DIGITOS_ASCII = {c: None for c in range(128) if not 0x30 <= c <= 0x39}
+
+
+# Os mesmos números se repetem muito dentro de uma sessão (listagens, histórico)
+@lru_cache(maxsize=4096)
 def normalizar_numero_processo(numero: str) -> str:
     """Remove todos os caracteres não-numéricos de um número de processo."""
-    return re.sub(r'\D', '', numero)
+    if numero.isascii():
+        # Caso mais comum: já chega só com dígitos e não há o que remover
+        if numero.isdigit():
+            return numero
+        return numero.translate(_REMOVER_NAO_DIGITOS_ASCII)
+    return _NAO_DIGITOS.sub('', numero)
 
 
-def formatar_numero_processo(numero: str) -> str:
-    """
-    Formata um número de processo de 17 dígitos no padrão NNNNN.NNNNNN/AAAA-DD.
 
-    Se o número não tiver exatamente 17 dígitos, retorna o valor original.
+def validar_numero_processo(numero: str) -> str:
     """
-    limpo = re.sub(r'\D', '', numero)
-    if len(limpo) != 17:
-        return numero
-    return f"{limpo[:5]}.{limpo[5:11]}/{limpo[11:15]}-{limpo[15:17]}"
+    Normaliza o número e exige que o resultado seja formado só por dígitos
+    ASCII, o formato gravado no banco (CHECK numero_processo ~ '^[0-9]+$').
+    Levanta ValueError (422 nos schemas e parâmetros) para entradas vazias,
+    sem dígitos ou com dígitos não-ASCII (ex.: '１２3').
+    """
+    numero_limpo = normalizar_numero_processo(numero)
+    if not (numero_limpo.isascii() and numero_limpo.isdigit()):
+        raise ValueError("numero_processo deve conter apenas dígitos (0-9)")
+    return numero_limpo
+
+
+# Para parâmetros de rota/query que são gravados no banco. Em query, declarar
+# como Annotated[NumeroProcesso, Query(...)]: com "= Query(...)" como default
+# o FastAPI descarta o validador.
+NumeroProcesso = Annotated[str, AfterValidator(validar_numero_processo)]
@@ -1,8 +1,9 @@
 import asyncio
-import base64
+import hashlib
 import logging
+import os
 import time
-from io import BytesIO
+from collections import OrderedDict
 
 import httpx
 from openai import AsyncOpenAI
@@ -14,6 +15,16 @@ from .telemetry import (
     pdf_processing_duration,
 )
 
+try:
+    # libbase64 com SIMD (SSSE3/AVX2): bem mais rápido que o encoder do CPython
+    from pybase64 import b64encode_as_string
+except ImportError:
+    import base64
+
+    def b64encode_as_string(data) -> str:
+        return base64.b64encode(data).decode('ascii')
+
+
 logger = logging.getLogger(__name__)
 tracer = trace.get_tracer("api.openai_client")
 
@@ -31,52 +42,160 @@ SYSTEM_RESUMO = (
 USER_RESUMO_HTML = "Resuma:\n{conteudo_md}"
 USER_RESUMO_PDF = "Resuma as páginas do documento PDF abaixo:"
 
+# ── Prompt de situação atual ──
+SYSTEM_SITUACAO = (
+    "Você é um assistente jurídico. Com base no resumo do processo, no conteúdo do último documento "
+    "adicionado e nas últimas atividades, produza uma análise estruturada da situação atual.\n"
+    "Formato:\n"
+    "1. Comece com UMA ÚNICA frase-síntese sobre o estado atual do processo.\n"
+    "2. Em seguida, liste os pontos relevantes em tópicos usando '•', um por linha.\n"
+    "IMPORTANTE: Cada tópico DEVE começar com a data em que o andamento ocorreu (formato DD/MM/AAAA), "
+    "seguido da descrição do que aconteceu. "
+    "Referencie o ID do documento ou atividade entre parênteses ao citar informações. "
+    "Exemplo: '• 15/03/2024 — Documento encaminhado para análise da SEAD (Documento SEI-1234567).'\n"
+    "Seja claro, objetivo e conciso."
+)
+
+# ── Prompt de análise de documento ──
+SYSTEM_DOCUMENTO = "Você é um assistente jurídico especializado..."
+
+# Mensagens de sistema montadas uma única vez e reaproveitadas em toda chamada
+# (somente leitura: o client apenas as serializa)
+_MSG_SYSTEM_RESUMO = {"role": "system", "content": SYSTEM_RESUMO}
+_MSG_SYSTEM_SITUACAO = {"role": "system", "content": SYSTEM_SITUACAO}
+_MSG_SYSTEM_DOCUMENTO = {"role": "system", "content": SYSTEM_DOCUMENTO}
+
+# Pool HTTP/2 explícito: chamadas simultâneas (streaming) multiplexam na mesma
+# conexão TLS em vez de abrir uma nova a cada rajada
+llm_http_client = httpx.AsyncClient(
+    timeout=httpx.Timeout(float(settings.OPENAI_TIMEOUT), connect=10.0),
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=50, keepalive_expiry=60.0),
+    http2=True,
+)
+
 client = AsyncOpenAI(
     base_url=settings.OPENAI_BASE_URL,
     api_key=settings.OPENAI_API_KEY,
     timeout=httpx.Timeout(float(settings.OPENAI_TIMEOUT), connect=10.0),
+    http_client=llm_http_client,
 )
 
 
-def _pdf_para_imagens_base64_sync(pdf_bytes: bytes, max_pages: int = 5) -> list[dict]:
-    """
-    Converte PDF em lista de objetos image_url para a API de visão.
-    Execução síncrona (CPU-bound) - deve ser chamada via asyncio.to_thread().
-    """
-    from pdf2image import convert_from_bytes
+# Limite de pdftoppm simultâneos no processo (cada página é um subprocesso)
+_PDF_WORKERS = min(8, os.cpu_count() or 1)
+_pdf_semaforo = asyncio.Semaphore(_PDF_WORKERS)
 
-    images = convert_from_bytes(pdf_bytes, first_page=1, last_page=max_pages)
-    logger.debug(f"PDF convertido em {len(images)} imagem(ns)")
+# Páginas já convertidas, por (digest do PDF, max_pages): resumo, situação atual
+# e streaming costumam converter o mesmo documento em sequência
+_PDF_CACHE_MAXSIZE = 16
+_pdf_cache: OrderedDict[tuple[bytes, int], tuple[dict, ...]] = OrderedDict()
 
-    image_contents = []
-    for image in images:
-        buffered = BytesIO()
-        image.save(buffered, format="PNG")
-        img_base64 = base64.b64encode(buffered.getvalue()).decode('utf-8')
 
-        image_contents.append({
-            "type": "image_url",
-            "image_url": {
-                "url": f"data:image/png;base64,{img_base64}"
-            }
-        })
+async def _executar_poppler(args: tuple[str, ...], pdf_bytes: bytes) -> tuple[int, bytes, bytes]:
+    """
+    Executa um utilitário do poppler lendo o PDF do stdin. Se a chamada for
+    cancelada ou falhar, o subprocesso é morto e aguardado (sem processos órfãos
+    nem zumbis).
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *args,
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    try:
+        stdout, stderr = await proc.communicate(pdf_bytes)
+    except BaseException:
+        if proc.returncode is None:
+            proc.kill()
+            await asyncio.shield(proc.wait())
+        raise
+    return proc.returncode, stdout, stderr
+
+
+async def _contar_paginas_pdf(pdf_bytes: bytes) -> int:
+    """Lê o número de páginas do PDF com o pdfinfo (poppler)."""
+    async with _pdf_semaforo:
+        returncode, stdout, stderr = await _executar_poppler(("pdfinfo", "-"), pdf_bytes)
+
+    if returncode == 0:
+        for linha in stdout.decode(errors='replace').splitlines():
+            chave, _, valor = linha.partition(":")
+            if chave.strip() == "Pages" and int(valor) > 0:
+                return int(valor)
+    raise RuntimeError(f"pdfinfo falhou: {stderr.decode(errors='replace').strip()}")
+
+
+async def _rasterizar_pagina_jpeg(pdf_bytes: bytes, pagina: int) -> bytes:
+    """
+    Renderiza uma página do PDF direto em JPEG com o pdftoppm (poppler),
+    lendo o PDF do stdin e escrevendo a imagem no stdout, sem passar pelo PIL.
+    """
+    async with _pdf_semaforo:
+        returncode, stdout, stderr = await _executar_poppler((
+            "pdftoppm", "-jpeg",
+            "-jpegopt", f"quality={settings.PDF_IMAGE_QUALITY}",
+            "-scale-to", str(settings.PDF_IMAGE_MAX_DIM),
+            "-f", str(pagina), "-l", str(pagina),
+            "-",
+        ), pdf_bytes)
 
-    return image_contents
+    if returncode != 0 or not stdout:
+        raise RuntimeError(f"pdftoppm falhou na página {pagina}: {stderr.decode(errors='replace').strip()}")
+    return stdout
 
 
 async def _pdf_para_imagens_base64(pdf_bytes: bytes, max_pages: int = 5) -> list[dict]:
     """
-    Wrapper async que executa a conversão PDF→imagens em thread separada
-    para não bloquear o event loop.
+    Converte PDF em lista de objetos image_url (JPEG em base64) para a API de
+    visão. As páginas são renderizadas em paralelo e retornadas na ordem do
+    documento; conversões recentes são reaproveitadas de _pdf_cache.
     """
     with tracer.start_as_current_span("pdf.convert_to_images", attributes={
         "pdf.input_size_bytes": len(pdf_bytes),
         "pdf.max_pages": max_pages,
     }) as span:
+        chave = (hashlib.blake2b(pdf_bytes, digest_size=16).digest(), max_pages)
+        cached = _pdf_cache.get(chave)
+        span.set_attribute("pdf.cache_hit", cached is not None)
+        if cached is not None:
+            _pdf_cache.move_to_end(chave)
+            span.set_attribute("pdf.output_page_count", len(cached))
+            return list(cached)
+
         start = time.monotonic()
-        result = await asyncio.to_thread(_pdf_para_imagens_base64_sync, pdf_bytes, max_pages)
+        # Conta as páginas uma vez e dispara só os pdftoppm necessários
+        total_paginas = min(await _contar_paginas_pdf(pdf_bytes), max_pages)
+        span.set_attribute("pdf.page_count", total_paginas)
+        tarefas = [
+            asyncio.ensure_future(_rasterizar_pagina_jpeg(pdf_bytes, pagina))
+            for pagina in range(1, total_paginas + 1)
+        ]
+        try:
+            paginas = await asyncio.gather(*tarefas)
+        except BaseException:
+            # Falha em uma página: cancela as demais (que matam seus pdftoppm)
+            for tarefa in tarefas:
+                tarefa.cancel()
+            await asyncio.gather(*tarefas, return_exceptions=True)
+            raise
+
+        result = []
+        for jpeg in paginas:
+            result.append({
+                "type": "image_url",
+                "image_url": {
+                    "url": f"data:image/jpeg;base64,{b64encode_as_string(jpeg)}"
+                }
+            })
+        logger.debug("PDF convertido em %s imagem(ns)", len(result))
+
         pdf_processing_duration.record(time.monotonic() - start)
         span.set_attribute("pdf.output_page_count", len(result))
+
+        _pdf_cache[chave] = tuple(result)
+        while len(_pdf_cache) > _PDF_CACHE_MAXSIZE:
+            _pdf_cache.popitem(last=False)
         return result
 
 
@@ -91,11 +210,11 @@ async def enviar_para_ia_conteudo(conteudo_md: str) -> dict:
     }) as span:
         start = time.monotonic()
         try:
-            logger.debug(f"Enviando conteúdo para IA. Tamanho: {len(conteudo_md)} caracteres")
+            logger.debug("Enviando conteúdo para IA. Tamanho: %s caracteres", len(conteudo_md))
             resposta = await client.chat.completions.create(
                 model=settings.OPENAI_MODEL,
                 messages=[
-                    {"role": "system", "content": "Você é um assistente jurídico especializado..."},
+                    _MSG_SYSTEM_DOCUMENTO,
                     {"role": "user", "content": f"Leia cuidadosamente o documento Markdown abaixo e produza um relatório detalhado...\n\nDocumento:\n\n{conteudo_md}"}
                 ],
                 temperature=0.7,
@@ -134,10 +253,10 @@ async def enviar_para_ia_conteudo_md(conteudo_md: str, tipo_arquivo: str = "html
             return {"status": "erro", "resposta_ia": "Conteúdo Markdown vazio"}
 
         modelo = settings.OPENAI_MODEL_TEXTO
-        logger.debug(f"Usando modelo TEXTO: {modelo}")
+        logger.debug("Usando modelo TEXTO: %s", modelo)
     elif tipo_arquivo == "pdf":
         modelo = settings.OPENAI_MODEL_VISAO
-        logger.debug(f"Usando modelo VISÃO: {modelo}")
+        logger.debug("Usando modelo VISÃO: %s", modelo)
     else:
         return {"status": "erro", "resposta_ia": f"Tipo de arquivo não suportado: {tipo_arquivo}"}
 
@@ -148,13 +267,13 @@ async def enviar_para_ia_conteudo_md(conteudo_md: str, tipo_arquivo: str = "html
     }) as span:
         start = time.monotonic()
         try:
-            logger.debug(f"Enviando conteúdo para IA (tipo: {tipo_arquivo}). Modelo: {modelo}")
+            logger.debug("Enviando conteúdo para IA (tipo: %s). Modelo: %s", tipo_arquivo, modelo)
 
             if tipo_arquivo == "html":
                 resposta = await client.chat.completions.create(
                     model=modelo,
                     messages=[
-                        {"role": "system", "content": SYSTEM_RESUMO},
+                        _MSG_SYSTEM_RESUMO,
                         {"role": "user", "content": USER_RESUMO_HTML.format(conteudo_md=conteudo_md)}
                     ],
                     temperature=0.7,
@@ -171,15 +290,15 @@ async def enviar_para_ia_conteudo_md(conteudo_md: str, tipo_arquivo: str = "html
                     resposta = await client.chat.completions.create(
                         model=modelo,
                         messages=[
-                            {"role": "system", "content": SYSTEM_RESUMO},
+                            _MSG_SYSTEM_RESUMO,
                             {"role": "user", "content": user_content}
                         ],
                         temperature=0.7,
                         max_tokens=350,
                     )
-                except ImportError:
-                    logger.error("pdf2image não está instalado. Instale com: pip install pdf2image")
-                    return {"status": "erro", "resposta_ia": "Erro: biblioteca pdf2image não disponível para processar PDF"}
+                except FileNotFoundError:
+                    logger.error("pdftoppm não está instalado. Instale o pacote poppler-utils")
+                    return {"status": "erro", "resposta_ia": "Erro: pdftoppm (poppler-utils) não disponível para processar PDF"}
                 except Exception as pdf_error:
                     logger.error(f"Erro ao processar PDF: {str(pdf_error)}")
                     return {"status": "erro", "resposta_ia": f"Erro ao processar PDF: {str(pdf_error)}"}
@@ -189,7 +308,7 @@ async def enviar_para_ia_conteudo_md(conteudo_md: str, tipo_arquivo: str = "html
             if resposta.usage:
                 span.set_attribute("llm.usage.total_tokens", resposta.usage.total_tokens)
                 llm_token_usage.add(resposta.usage.total_tokens, {"llm.model": modelo})
-            logger.debug(f"Resposta da IA (tipo: {tipo_arquivo}) recebida com sucesso")
+            logger.debug("Resposta da IA (tipo: %s) recebida com sucesso", tipo_arquivo)
             return {"status": "ok", "resposta_ia": resposta.choices[0].message.content.strip()}
 
         except httpx.TimeoutException as e:
@@ -221,7 +340,7 @@ async def enviar_para_ia_conteudo_md_stream(conteudo_md, tipo_arquivo: str = "ht
 
     if tipo_arquivo == "html":
         messages = [
-            {"role": "system", "content": SYSTEM_RESUMO},
+            _MSG_SYSTEM_RESUMO,
             {"role": "user", "content": USER_RESUMO_HTML.format(conteudo_md=conteudo_md)}
         ]
     else:  # PDF
@@ -230,7 +349,7 @@ async def enviar_para_ia_conteudo_md_stream(conteudo_md, tipo_arquivo: str = "ht
             {"type": "text", "text": USER_RESUMO_PDF}
         ] + image_contents
         messages = [
-            {"role": "system", "content": SYSTEM_RESUMO},
+            _MSG_SYSTEM_RESUMO,
             {"role": "user", "content": user_content}
         ]
 
@@ -262,24 +381,8 @@ async def enviar_situacao_atual_stream(entendimento: str, ultimo_doc_conteudo: s
     Gera streaming da situação atual do processo com base no entendimento,
     último documento e últimos andamentos.
     """
-    system_situacao = (
-        "Você é um assistente jurídico. Com base no resumo do processo, no conteúdo do último documento "
-        "adicionado e nas últimas atividades, produza uma análise estruturada da situação atual.\n"
-        "Formato:\n"
-        "1. Comece com UMA ÚNICA frase-síntese sobre o estado atual do processo.\n"
-        "2. Em seguida, liste os pontos relevantes em tópicos usando '•', um por linha.\n"
-        "IMPORTANTE: Cada tópico DEVE começar com a data em que o andamento ocorreu (formato DD/MM/AAAA), "
-        "seguido da descrição do que aconteceu. "
-        "Referencie o ID do documento ou atividade entre parênteses ao citar informações. "
-        "Exemplo: '• 15/03/2024 — Documento encaminhado para análise da SEAD (Documento SEI-1234567).'\n"
-        "Seja claro, objetivo e conciso."
-    )
-
     messages = [
-        {
-            "role": "system",
-            "content": system_situacao,
-        },
+        _MSG_SYSTEM_SITUACAO,
         {
             "role": "user",
             "content": f"Resumo do processo:\n{entendimento}\n\nÚltimo documento adicionado:\n{ultimo_doc_conteudo}\n\nÚltimas atividades:\n{ultimos_andamentos_texto}",
@@ -325,7 +428,7 @@ async def enviar_documento_ia_conteudo_stream(conteudo_md, tipo_arquivo: str = "
 
     if tipo_arquivo == "html":
         messages = [
-            {"role": "system", "content": "Você é um assistente jurídico especializado..."},
+            _MSG_SYSTEM_DOCUMENTO,
             {"role": "user", "content": f"Leia cuidadosamente o documento Markdown abaixo e produza um resumo de maximo 300 caracteres...\n\nDocumento:\n\n{conteudo_md}"}
         ]
     else:  # PDF
@@ -337,7 +440,7 @@ async def enviar_documento_ia_conteudo_stream(conteudo_md, tipo_arquivo: str = "
             }
         ] + image_contents
         messages = [
-            {"role": "system", "content": "Você é um assistente jurídico especializado..."},
+            _MSG_SYSTEM_DOCUMENTO,
             {"role": "user", "content": user_content}
         ]
 
@@ -376,10 +479,10 @@ async def enviar_documento_ia_conteudo(conteudo_md: str, tipo_arquivo: str = "ht
             return {"status": "erro", "resposta_ia": "Conteúdo Markdown vazio"}
 
         modelo = settings.OPENAI_MODEL_TEXTO
-        logger.debug(f"Usando modelo TEXTO: {modelo}")
+        logger.debug("Usando modelo TEXTO: %s", modelo)
     elif tipo_arquivo == "pdf":
         modelo = settings.OPENAI_MODEL_VISAO
-        logger.debug(f"Usando modelo VISÃO: {modelo}")
+        logger.debug("Usando modelo VISÃO: %s", modelo)
     else:
         return {"status": "erro", "resposta_ia": f"Tipo de arquivo não suportado: {tipo_arquivo}"}
 
@@ -390,13 +493,13 @@ async def enviar_documento_ia_conteudo(conteudo_md: str, tipo_arquivo: str = "ht
     }) as span:
         start = time.monotonic()
         try:
-            logger.debug(f"Enviando documento para IA (tipo: {tipo_arquivo}). Modelo: {modelo}")
+            logger.debug("Enviando documento para IA (tipo: %s). Modelo: %s", tipo_arquivo, modelo)
 
             if tipo_arquivo == "html":
                 resposta = await client.chat.completions.create(
                     model=modelo,
                     messages=[
-                        {"role": "system", "content": "Você é um assistente jurídico especializado..."},
+                        _MSG_SYSTEM_DOCUMENTO,
                         {"role": "user", "content": f"Leia cuidadosamente o documento Markdown abaixo e produza um resumo de maximo 300 caracteres...\n\nDocumento:\n\n{conteudo_md}"}
                     ],
                     temperature=0.7,
@@ -415,7 +518,7 @@ async def enviar_documento_ia_conteudo(conteudo_md: str, tipo_arquivo: str = "ht
                     resposta = await client.chat.completions.create(
                         model=modelo,
                         messages=[
-                            {"role": "system", "content": "Você é um assistente jurídico especializado..."},
+                            _MSG_SYSTEM_DOCUMENTO,
                             {
                                 "role": "user",
                                 "content": user_content
@@ -423,9 +526,9 @@ async def enviar_documento_ia_conteudo(conteudo_md: str, tipo_arquivo: str = "ht
                         ],
                         temperature=0.7,
                     )
-                except ImportError:
-                    logger.error("pdf2image não está instalado. Instale com: pip install pdf2image")
-                    return {"status": "erro", "resposta_ia": "Erro: biblioteca pdf2image não disponível para processar PDF"}
+                except FileNotFoundError:
+                    logger.error("pdftoppm não está instalado. Instale o pacote poppler-utils")
+                    return {"status": "erro", "resposta_ia": "Erro: pdftoppm (poppler-utils) não disponível para processar PDF"}
                 except Exception as pdf_error:
                     logger.error(f"Erro ao processar PDF: {str(pdf_error)}")
                     return {"status": "erro", "resposta_ia": f"Erro ao processar PDF: {str(pdf_error)}"}
@@ -435,7 +538,7 @@ async def enviar_documento_ia_conteudo(conteudo_md: str, tipo_arquivo: str = "ht
             if resposta.usage:
                 span.set_attribute("llm.usage.total_tokens", resposta.usage.total_tokens)
                 llm_token_usage.add(resposta.usage.total_tokens, {"llm.model": modelo})
-            logger.debug(f"Resposta da IA (tipo: {tipo_arquivo}) recebida com sucesso")
+            logger.debug("Resposta da IA (tipo: %s) recebida com sucesso", tipo_arquivo)
             return {"status": "ok", "resposta_ia": resposta.choices[0].message.content.strip()}
 
         except httpx.TimeoutException as e:
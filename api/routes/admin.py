@@ -172,7 +172,6 @@ async def save_configuracao_horas(
         existing = result.scalar_one_or_none()
         if existing:
             existing.horas = item.horas
-            existing.atualizado_em = now
             existing.atualizado_por = admin_user
         else:
             db.add(ConfiguracaoHorasAndamento(
@@ -234,7 +233,8 @@ async def cache_status():
                     "connected_clients": info.get("connected_clients", 0),
                     "keyspace_hits": info.get("keyspace_hits", 0),
                     "keyspace_misses": info.get("keyspace_misses", 0)
-                }
+                },
+                "local_cache": cache.stats()
             }
         except Exception as e:
             logger.error(f"Erro ao obter informações do Redis: {str(e)}")
@@ -252,7 +252,7 @@ async def cache_status():
                 type=ErrorType.PROCESSING_ERROR,
                 message="Erro ao verificar status do cache",
                 details={"error": str(e)}
-            ).dict()
+            ).model_dump(mode="json")
         )
 
 
@@ -272,7 +272,7 @@ async def reset_cache():
                     type=ErrorType.EXTERNAL_SERVICE_ERROR,
                     message="Redis não está disponível",
                     details={}
-                ).dict()
+                ).model_dump(mode="json")
             )
 
         # Remove todas as chaves do banco atual
@@ -296,7 +296,7 @@ async def reset_cache():
                 type=ErrorType.PROCESSING_ERROR,
                 message="Erro ao resetar cache",
                 details={"error": str(e)}
-            ).dict()
+            ).model_dump(mode="json")
         )
 
 
@@ -320,7 +320,7 @@ async def reset_cache_processo(numero_processo: str):
                     type=ErrorType.EXTERNAL_SERVICE_ERROR,
                     message="Redis não está disponível",
                     details={}
-                ).dict()
+                ).model_dump(mode="json")
             )
 
         # Remove todas as chaves relacionadas ao processo (incluindo proxy cache)
@@ -354,7 +354,7 @@ async def reset_cache_processo(numero_processo: str):
                 type=ErrorType.PROCESSING_ERROR,
                 message="Erro ao resetar cache do processo",
                 details={"error": str(e), "numero_processo": numero_processo}
-            ).dict()
+            ).model_dump(mode="json")
         )
 
 
@@ -377,7 +377,7 @@ async def reset_cache_documento(documento_formatado: str):
                     type=ErrorType.EXTERNAL_SERVICE_ERROR,
                     message="Redis não está disponível",
                     details={}
-                ).dict()
+                ).model_dump(mode="json")
             )
 
         # Remove a chave específica do documento
@@ -403,7 +403,7 @@ async def reset_cache_documento(documento_formatado: str):
                 type=ErrorType.PROCESSING_ERROR,
                 message="Erro ao resetar cache do documento",
                 details={"error": str(e), "documento_formatado": documento_formatado}
-            ).dict()
+            ).model_dump(mode="json")
         )
 
 
@@ -427,7 +427,7 @@ async def list_cache_keys(pattern: str = "*", limit: int = 100):
                     type=ErrorType.EXTERNAL_SERVICE_ERROR,
                     message="Redis não está disponível",
                     details={}
-                ).dict()
+                ).model_dump(mode="json")
             )
 
         # Lista as chaves usando SCAN
@@ -465,7 +465,7 @@ async def list_cache_keys(pattern: str = "*", limit: int = 100):
                 type=ErrorType.PROCESSING_ERROR,
                 message="Erro ao listar chaves do cache",
                 details={"error": str(e)}
-            ).dict()
+            ).model_dump(mode="json")
         )
 
 
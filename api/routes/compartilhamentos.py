@@ -51,8 +51,10 @@ async def compartilhar_tag(
         ]
         if dados.equipe_destino_id:
             dup_conditions.append(Compartilhamento.equipe_destino_id == dados.equipe_destino_id)
+            dup_conditions.append(Compartilhamento.equipe_destino_id.is_not(None))
         elif dados.usuario_destino:
             dup_conditions.append(Compartilhamento.usuario_destino == dados.usuario_destino)
+            dup_conditions.append(Compartilhamento.usuario_destino.is_not(None))
 
         dup_q = await db.execute(select(Compartilhamento).where(and_(*dup_conditions)))
         if dup_q.scalar_one_or_none():
@@ -105,6 +107,7 @@ async def recebidos(
         conditions = [
             and_(
                 Compartilhamento.usuario_destino == usuario,
+                Compartilhamento.usuario_destino.is_not(None),
                 Compartilhamento.deletado_em.is_(None),
             )
         ]
@@ -112,6 +115,7 @@ async def recebidos(
             conditions.append(
                 and_(
                     Compartilhamento.equipe_destino_id.in_(equipe_ids),
+                    Compartilhamento.equipe_destino_id.is_not(None),
                     Compartilhamento.deletado_em.is_(None),
                 )
             )
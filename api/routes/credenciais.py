@@ -133,8 +133,8 @@ async def auto_login(body: AutoLoginRequest, db: AsyncSession = Depends(get_db))
             data["id_pessoa"] = cred.id_pessoa
             await _enrich_with_modulos(data, db, cred.usuario_sei)
 
-            # 4. Cache the successful response
-            await cache.set(cache_key, {
+            # 4. Cache the successful response (set_sync: o próximo auto-login lê ou invalida esta chave)
+            await cache.set_sync(cache_key, {
                 "response": data,
                 "cached_at": datetime.now(timezone.utc).isoformat(),
             }, ttl=LOGIN_CACHE_TTL)
@@ -210,7 +210,7 @@ async def embed_login(body: EmbedLoginRequest, db: AsyncSession = Depends(get_db
 
     # 3. Cache the login response for future auto-logins
     cache_key = gerar_chave_login(body.id_pessoa)
-    await cache.set(cache_key, {
+    await cache.set_sync(cache_key, {
         "response": data,
         "cached_at": datetime.now(timezone.utc).isoformat(),
     }, ttl=LOGIN_CACHE_TTL)
@@ -6,7 +6,7 @@ evitando mixed-content (HTTPS→HTTP) no navegador.
 """
 import logging
 from fastapi import APIRouter, HTTPException
-from fastapi.responses import ORJSONResponse
+from fastapi.responses import Response
 from ..sei import http_client
 from ..config import settings
 
@@ -16,6 +16,11 @@ logger = logging.getLogger(__name__)
 D1_TIMEOUT = 8  # seconds (frontend has 5s, give backend a bit more)
 
 
+def _json_passthrough(resp) -> Response:
+    """Repassa o corpo JSON do D-1 como está, sem parse + re-serialização."""
+    return Response(content=resp.content, status_code=200, media_type="application/json")
+
+
 @router.get("/processo/{numero:path}/andamentos")
 async def d1_andamentos(numero: str):
     """Proxy: GET /d1/processo/{numero}/andamentos → D-1 API."""
@@ -33,7 +38,7 @@ async def d1_andamentos(numero: str):
     if resp.status_code != 200:
         raise HTTPException(status_code=resp.status_code, detail=resp.text)
 
-    return ORJSONResponse(content=resp.json(), status_code=200)
+    return _json_passthrough(resp)
 
 
 # ─── BI proxy endpoints ──────────────────────────────────────────────────
@@ -52,7 +57,7 @@ async def _proxy_bi_get(path: str, params: dict | None = None):
         raise HTTPException(status_code=502, detail=f"D-1 BI indisponível: {e}")
     if resp.status_code != 200:
         raise HTTPException(status_code=resp.status_code, detail=resp.text)
-    return ORJSONResponse(content=resp.json(), status_code=200)
+    return _json_passthrough(resp)
 
 
 @router.get("/bi/estoque-processos")
@@ -131,7 +136,7 @@ async def bi_estoque_refresh():
         raise HTTPException(status_code=502, detail=f"D-1 BI indisponível: {e}")
     if resp.status_code != 200:
         raise HTTPException(status_code=resp.status_code, detail=resp.text)
-    return ORJSONResponse(content=resp.json(), status_code=200)
+    return _json_passthrough(resp)
 
 
 @router.get("/bi/tasks")
@@ -4,7 +4,6 @@ Rotas para gerenciamento de equipes
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, and_
-from datetime import datetime
 from uuid import UUID
 import logging
 
@@ -197,7 +196,6 @@ async def atualizar_equipe(
             equipe.nome = dados.nome
         if dados.descricao is not None:
             equipe.descricao = dados.descricao
-        equipe.atualizado_em = datetime.utcnow()
 
         await db.commit()
         await db.refresh(equipe)
@@ -494,7 +492,6 @@ async def mover_processo_kanban(
         novo_processo = ProcessoSalvo(
             tag_id=dados.tag_id_destino,
             numero_processo=processo.numero_processo,
-            numero_processo_formatado=processo.numero_processo_formatado,
             nota=processo.nota,
         )
         db.add(novo_processo)
@@ -556,7 +553,6 @@ async def salvar_processo_kanban(
         novo_processo = ProcessoSalvo(
             tag_id=dados.tag_id_destino,
             numero_processo=dados.numero_processo,
-            numero_processo_formatado=dados.numero_processo_formatado,
             nota=dados.nota,
         )
         db.add(novo_processo)
@@ -589,7 +585,7 @@ async def _get_equipe_como_membro(db: AsyncSession, equipe_id: UUID, usuario: st
         raise HTTPException(status_code=404, detail="Equipe não encontrada")
 
     membro_q = await db.execute(
-        select(EquipeMembro).where(and_(
+        select(EquipeMembro.usuario).where(and_(
             EquipeMembro.equipe_id == equipe_id,
             EquipeMembro.usuario == usuario,
             EquipeMembro.deletado_em.is_(None),
@@ -622,7 +618,7 @@ async def _verificar_admin(db: AsyncSession, equipe_id: UUID, usuario: str):
         raise HTTPException(status_code=404, detail="Equipe não encontrada")
 
     result = await db.execute(
-        select(EquipeMembro).where(and_(
+        select(EquipeMembro.papel).where(and_(
             EquipeMembro.equipe_id == equipe_id,
             EquipeMembro.usuario == usuario,
             EquipeMembro.papel == "admin",
@@ -40,7 +40,7 @@ async def _verificar_membro(db: AsyncSession, equipe_id: UUID, usuario: str):
         raise HTTPException(status_code=404, detail="Equipe nao encontrada")
 
     membro = await db.execute(
-        select(EquipeMembro).where(
+        select(EquipeMembro.usuario).where(
             and_(
                 EquipeMembro.equipe_id == equipe_id,
                 EquipeMembro.usuario == usuario,
@@ -290,7 +290,6 @@ async def atualizar_fluxo(
         if dados.status is not None:
             fluxo.status = dados.status
 
-        fluxo.atualizado_em = datetime.utcnow()
         await db.flush()
         await db.refresh(fluxo)
 
@@ -412,7 +411,6 @@ async def salvar_canvas(
         # Update fluxo metadata
         fluxo.viewport = dados.viewport
         fluxo.versao = fluxo.versao + 1
-        fluxo.atualizado_em = datetime.utcnow()
 
         await db.flush()
         await db.refresh(fluxo)
@@ -581,7 +579,6 @@ async def atualizar_processo_vinculado(
         if dados.notas is not None:
             fp.notas = dados.notas
 
-        fp.atualizado_em = now
         await db.flush()
         await db.refresh(fp)
 
@@ -3,8 +3,8 @@ Rotas para gerenciamento do histórico de pesquisas de processos
 """
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_, desc
-from datetime import datetime
+from sqlalchemy import select, update, func, and_, desc
+from datetime import datetime, timezone
 from typing import Optional
 from uuid import UUID
 import logging
@@ -24,6 +24,19 @@ from ..schemas import (
     HistoricoPesquisaRestoreResponse,
 )
 
+# Colunas de HistoricoPesquisaResponse, para as listagens
+_COLUNAS_LISTAGEM = (
+    HistoricoPesquisa.id,
+    HistoricoPesquisa.numero_processo,
+    HistoricoPesquisa.numero_processo_formatado,
+    HistoricoPesquisa.usuario,
+    HistoricoPesquisa.id_unidade,
+    HistoricoPesquisa.caixa_contexto,
+    HistoricoPesquisa.criado_em,
+    HistoricoPesquisa.atualizado_em,
+    HistoricoPesquisa.deletado_em,
+)
+
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
@@ -86,7 +99,6 @@ async def criar_historico(
         # Criar novo registro
         novo_historico = HistoricoPesquisa(
             numero_processo=dados.numero_processo,
-            numero_processo_formatado=dados.numero_processo_formatado,
             usuario=dados.usuario,
             id_unidade=dados.id_unidade,
             caixa_contexto=dados.caixa_contexto
@@ -144,8 +156,9 @@ async def listar_historico_usuario(
 
         logger.info(f"GET /historico/{usuario} — cache MISS")
 
-        # Query base
-        base_query = select(HistoricoPesquisa).where(
+        # Query base: só as colunas da resposta, em Rows leves (sem identity map
+        # nem InstanceState do ORM); HistoricoPesquisaResponse lê os atributos direto
+        base_query = select(*_COLUNAS_LISTAGEM).where(
             HistoricoPesquisa.usuario == usuario
         )
 
@@ -166,7 +179,7 @@ async def listar_historico_usuario(
         ).limit(limit).offset(offset)
 
         result = await db.execute(query)
-        pesquisas = result.scalars().all()
+        pesquisas = result.all()
 
         response_data = {
             "status": "success",
@@ -188,7 +201,8 @@ async def listar_historico_usuario(
                 "status": "success",
                 "data": response_data["data"].model_dump(mode="json"),
             }
-            await cache.set(cache_key, cache_data, ttl=600)
+            # set_sync: as escritas no histórico invalidam esta chave logo em seguida
+            await cache.set_sync(cache_key, cache_data, ttl=600)
 
         return response_data
 
@@ -334,17 +348,22 @@ async def deletar_historico_usuario(
 ):
     """Soft delete de todo histórico de um usuário"""
     try:
-        # Buscar registros não deletados
-        query = select(HistoricoPesquisa).where(
-            and_(
-                HistoricoPesquisa.usuario == usuario,
-                HistoricoPesquisa.deletado_em.is_(None)
+        # Soft delete em um único UPDATE, sem carregar os registros no ORM
+        agora = datetime.now(timezone.utc)
+        result = await db.execute(
+            update(HistoricoPesquisa)
+            .where(
+                and_(
+                    HistoricoPesquisa.usuario == usuario,
+                    HistoricoPesquisa.deletado_em.is_(None)
+                )
             )
+            .values(deletado_em=agora)
+            .execution_options(synchronize_session=False)
         )
-        result = await db.execute(query)
-        registros = result.scalars().all()
+        registros_apagados = result.rowcount
 
-        if not registros:
+        if not registros_apagados:
             return {
                 "status": "success",
                 "message": "Nenhum registro encontrado para deletar",
@@ -355,16 +374,11 @@ async def deletar_historico_usuario(
                 )
             }
 
-        # Soft delete
-        agora = datetime.utcnow()
-        for registro in registros:
-            registro.soft_delete()
-
         await db.commit()
 
         logger.info(
             f"Histórico deletado: usuario={usuario}, "
-            f"registros={len(registros)}"
+            f"registros={registros_apagados}"
         )
 
         return {
@@ -373,7 +387,7 @@ async def deletar_historico_usuario(
             "data": HistoricoPesquisaDeleteResponse(
                 message="Histórico apagado com sucesso",
                 usuario=usuario,
-                registros_apagados=len(registros),
+                registros_apagados=registros_apagados,
                 deletado_em=agora
             )
         }
@@ -11,6 +11,7 @@ import logging
 from datetime import datetime
 
 from ..database import get_db
+from ..normalization import NumeroProcesso, normalizar_numero_processo
 from ..models import Observacao, EquipeMembro, ObservacaoMencao
 from ..schemas import ObservacaoCreate, ObservacaoUpdate, ObservacaoResponse
 
@@ -18,10 +19,6 @@ router = APIRouter()
 logger = logging.getLogger(__name__)
 
 
-def _strip_non_digits(value: str) -> str:
-    return re.sub(r'\D', '', value)
-
-
 def _extrair_mencoes(conteudo: str) -> list[str]:
     """Extrai @usuarios do conteudo da observacao."""
     mencoes = re.findall(r'@([\w.]+(?:@[\w.]+)*)', conteudo)
@@ -40,12 +37,12 @@ def _extrair_mencoes(conteudo: str) -> list[str]:
     summary="Contar mencoes nao lidas para um usuario neste processo",
 )
 async def mencoes_nao_lidas(
-    numero_processo: str,
+    numero_processo: NumeroProcesso,
     usuario: str = Query(..., description="Usuario logado"),
     db: AsyncSession = Depends(get_db),
 ):
     try:
-        numero_limpo = _strip_non_digits(numero_processo)
+        numero_limpo = normalizar_numero_processo(numero_processo)
 
         count_q = await db.execute(
             select(func.count(ObservacaoMencao.id))
@@ -71,13 +68,13 @@ async def mencoes_nao_lidas(
     summary="Listar observacoes de um processo",
 )
 async def listar_observacoes(
-    numero_processo: str,
+    numero_processo: NumeroProcesso,
     equipe_id: UUID | None = Query(None, description="Filtrar obs de equipe por equipe especifica"),
     usuario: str | None = Query(None, description="Usuario logado (necessario para ver obs pessoais e de equipe)"),
     db: AsyncSession = Depends(get_db),
 ):
     try:
-        numero_limpo = _strip_non_digits(numero_processo)
+        numero_limpo = normalizar_numero_processo(numero_processo)
 
         conditions = [
             Observacao.numero_processo == numero_limpo,
@@ -158,13 +155,13 @@ async def listar_observacoes(
     summary="Criar observacao sobre um processo",
 )
 async def criar_observacao(
-    numero_processo: str,
+    numero_processo: NumeroProcesso,
     dados: ObservacaoCreate,
     usuario: str = Query(..., description="Usuario autor"),
     db: AsyncSession = Depends(get_db),
 ):
     try:
-        numero_limpo = _strip_non_digits(numero_processo)
+        numero_limpo = normalizar_numero_processo(numero_processo)
         escopo = dados.escopo
 
         # Validacoes por escopo
@@ -257,13 +254,13 @@ async def criar_observacao(
     summary="Marcar mencoes de um usuario como vistas em uma observacao",
 )
 async def marcar_visto(
-    numero_processo: str,
+    numero_processo: NumeroProcesso,
     observacao_id: UUID,
     usuario: str = Query(..., description="Usuario que visualizou"),
     db: AsyncSession = Depends(get_db),
 ):
     try:
-        numero_limpo = _strip_non_digits(numero_processo)
+        numero_limpo = normalizar_numero_processo(numero_processo)
         agora = datetime.utcnow()
 
         # Busca a obs principal para validar que existe
@@ -312,14 +309,14 @@ async def marcar_visto(
     summary="Alterar observacao",
 )
 async def alterar_observacao(
-    numero_processo: str,
+    numero_processo: NumeroProcesso,
     observacao_id: UUID,
     dados: ObservacaoUpdate,
     usuario: str = Query(..., description="Usuario autor"),
     db: AsyncSession = Depends(get_db),
 ):
     try:
-        numero_limpo = _strip_non_digits(numero_processo)
+        numero_limpo = normalizar_numero_processo(numero_processo)
         result = await db.execute(
             select(Observacao).where(and_(
                 Observacao.id == observacao_id,
@@ -335,7 +332,6 @@ async def alterar_observacao(
             raise HTTPException(status_code=403, detail="Apenas o autor pode alterar a observacao")
 
         observacao.conteudo = dados.conteudo
-        observacao.atualizado_em = datetime.utcnow()
 
         mencoes_conteudo = _extrair_mencoes(dados.conteudo)
         todos_mencionados = list(dict.fromkeys(dados.mencoes + mencoes_conteudo))
@@ -393,13 +389,13 @@ async def alterar_observacao(
     summary="Excluir observacao (soft delete)",
 )
 async def deletar_observacao(
-    numero_processo: str,
+    numero_processo: NumeroProcesso,
     observacao_id: UUID,
     usuario: str = Query(..., description="Usuario autor"),
     db: AsyncSession = Depends(get_db),
 ):
     try:
-        numero_limpo = _strip_non_digits(numero_processo)
+        numero_limpo = normalizar_numero_processo(numero_processo)
         result = await db.execute(
             select(Observacao).where(and_(
                 Observacao.id == observacao_id,
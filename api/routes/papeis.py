@@ -3,7 +3,6 @@ Endpoints CRUD para papéis (roles) e atribuição de papéis a usuários.
 Montado sob o prefixo /admin pelo routes/__init__.py.
 """
 import logging
-from datetime import datetime, timezone
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Path
@@ -139,7 +138,6 @@ async def atualizar_papel(
     if body.descricao is not None:
         papel.descricao = body.descricao
 
-    papel.atualizado_em = datetime.now(timezone.utc)
     await db.flush()
 
     return {
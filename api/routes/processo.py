@@ -3,6 +3,7 @@ import json
 import time
 import logging
 from fastapi import APIRouter, Header, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy import select
 from starlette.responses import StreamingResponse
 from ..sei import listar_ultimos_andamentos, consultar_documento, baixar_documento, contar_andamentos
@@ -13,7 +14,7 @@ from ..openai_client import (
 )
 from ..schemas_legacy import ErrorDetail, ErrorType, Retorno
 from ..cache import cache, gerar_chave_processo, gerar_chave_documento, gerar_chave_andamento, gerar_chave_resumo
-from ..normalization import normalizar_numero_processo
+from ..normalization import NumeroProcesso, normalizar_numero_processo
 from ..database import AsyncSessionLocal
 from ..models.processo_entendimento import ProcessoEntendimento
 from ..models.processo_situacao import ProcessoSituacao
@@ -27,6 +28,15 @@ router = APIRouter()
 CACHE_TTL = 172800
 
 
+def _retorno(status: str, resumo: dict | None = None, andamento: dict | None = None) -> ORJSONResponse:
+    """
+    Mesmo JSON de Retorno, entregue direto ao orjson. Retornar um Response faz o
+    FastAPI pular o model_dump + revalidação + serialização do response_model
+    (que continua declarado nas rotas apenas para o OpenAPI).
+    """
+    return ORJSONResponse({"status": status, "resumo": resumo, "andamento": andamento, "error": None})
+
+
 @router.get("/andamento/{numero_processo}", response_model=Retorno)
 async def andamento(
     numero_processo: str,
@@ -57,7 +67,7 @@ async def andamento(
         cached_result = await cache.get(cache_key)
         if cached_result:
             logger.info(f"GET /andamento/{numero_processo} — cache HIT")
-            return Retorno(status="ok", andamento=cached_result.get("andamento"), resumo=cached_result.get("resumo"))
+            return _retorno(status="ok", andamento=cached_result.get("andamento"), resumo=cached_result.get("resumo"))
 
         logger.info(f"GET /andamento/{numero_processo} — cache MISS")
 
@@ -68,7 +78,7 @@ async def andamento(
                     type=ErrorType.NOT_FOUND,
                     message="ultimo_doc_formatado é obrigatório",
                     details={"numero_processo": numero_processo}
-                ).dict()
+                ).model_dump(mode="json")
             )
 
         # Consulta documento e baixa conteúdo em paralelo
@@ -87,7 +97,7 @@ async def andamento(
         }
         await cache.set(cache_key, resultado, ttl=CACHE_TTL)
 
-        return Retorno(
+        return _retorno(
             status="ok",
             andamento=doc_ultimo,
             resumo=resposta_ia_ultimo
@@ -103,7 +113,7 @@ async def andamento(
                 type=ErrorType.PROCESSING_ERROR,
                 message="Erro ao processar o andamento do processo",
                 details={"error": str(e), "numero_processo": numero_processo}
-            ).dict()
+            ).model_dump(mode="json")
         )
 
 
@@ -138,7 +148,7 @@ async def resumo(
         cached_result = await cache.get(cache_key)
         if cached_result:
             logger.info(f"GET /resumo/{numero_processo} — cache HIT")
-            return Retorno(status="ok", resumo=cached_result)
+            return _retorno(status="ok", resumo=cached_result)
 
         logger.info(f"GET /resumo/{numero_processo} — cache MISS")
 
@@ -149,7 +159,7 @@ async def resumo(
                     type=ErrorType.NOT_FOUND,
                     message="primeiro_doc_formatado e ultimo_doc_formatado são obrigatórios",
                     details={"numero_processo": numero_processo}
-                ).dict()
+                ).model_dump(mode="json")
             )
 
         # Busca todos os dados em paralelo
@@ -180,7 +190,7 @@ async def resumo(
         # Armazena no cache
         await cache.set(cache_key, resultado, ttl=CACHE_TTL)
 
-        return Retorno(status="ok", resumo=resultado)
+        return _retorno(status="ok", resumo=resultado)
 
     except HTTPException as he:
         raise he
@@ -192,7 +202,7 @@ async def resumo(
                 type=ErrorType.PROCESSING_ERROR,
                 message="Erro ao processar o resumo do processo",
                 details={"error": str(e), "numero_processo": numero_processo}
-            ).dict()
+            ).model_dump(mode="json")
         )
 
 
@@ -226,7 +236,7 @@ async def resumo_completo(
         cached_result = await cache.get(cache_key_base)
         if cached_result:
             logger.info(f"GET /resumo-completo/{numero_processo} — cache HIT")
-            return Retorno(status="ok", resumo=cached_result)
+            return _retorno(status="ok", resumo=cached_result)
 
         logger.info(f"GET /resumo-completo/{numero_processo} — cache MISS")
 
@@ -237,78 +247,78 @@ async def resumo_completo(
                     type=ErrorType.NOT_FOUND,
                     message="primeiro_doc_formatado é obrigatório",
                     details={"numero_processo": numero_processo}
-                ).dict()
+                ).model_dump(mode="json")
             )
 
         cache_key = cache_key_base
 
-        logger.debug(f"Iniciando processamento do processo {numero_processo}")
-        logger.debug(f"Primeiro documento: {primeiro_doc_formatado}")
+        async def _gerar_resumo_completo() -> dict:
+            logger.debug("Iniciando processamento do processo %s", numero_processo)
+            logger.debug("Primeiro documento: %s", primeiro_doc_formatado)
 
-        # Busca todos os dados em paralelo
-        results = await asyncio.gather(
-            consultar_documento(token, id_unidade, primeiro_doc_formatado),
-            baixar_documento(token, id_unidade, primeiro_doc_formatado, numero_processo),
-            return_exceptions=True
-        )
+            # Busca todos os dados em paralelo
+            results = await asyncio.gather(
+                consultar_documento(token, id_unidade, primeiro_doc_formatado),
+                baixar_documento(token, id_unidade, primeiro_doc_formatado, numero_processo),
+                return_exceptions=True
+            )
 
-        doc_primeiro = results[0] if not isinstance(results[0], Exception) else {}
-        md_primeiro = results[1] if not isinstance(results[1], Exception) else None
+            doc_primeiro = results[0] if not isinstance(results[0], Exception) else {}
+            md_primeiro = results[1] if not isinstance(results[1], Exception) else None
 
-        if isinstance(results[0], Exception):
-            logger.error(f"Falha ao consultar primeiro documento: {str(results[0])}")
-        else:
-            logger.debug(f"Primeiro documento consultado: {doc_primeiro.get('Titulo', 'Sem título')}")
+            if isinstance(results[0], Exception):
+                logger.error(f"Falha ao consultar primeiro documento: {str(results[0])}")
+            else:
+                logger.debug("Primeiro documento consultado: %s", doc_primeiro.get('Titulo', 'Sem título'))
 
-        conteudo_combinado = ""
-        tipo_arquivo = "html"  # Default
+            conteudo_combinado = ""
+            tipo_arquivo = "html"  # Default
 
-        if md_primeiro:
-            try:
-                # Detectar tipo de arquivo
-                if isinstance(md_primeiro, dict):
-                    tipo_arquivo = md_primeiro.get("tipo", "html")
-                    conteudo = md_primeiro.get("conteudo")
+            if md_primeiro:
+                try:
+                    # Detectar tipo de arquivo
+                    if isinstance(md_primeiro, dict):
+                        tipo_arquivo = md_primeiro.get("tipo", "html")
+                        conteudo = md_primeiro.get("conteudo")
+
+                        if tipo_arquivo == "html":
+                            logger.debug("Documento HTML - Conteúdo: %s caracteres", len(conteudo))
+                            conteudo_combinado += f"PRIMEIRO DOCUMENTO:\n{conteudo}\n\n"
+                        elif tipo_arquivo == "pdf":
+                            logger.debug("Documento PDF - Tamanho: %s bytes", len(conteudo))
+                            conteudo_combinado = conteudo  # Para PDF, usar o binário direto
+                    else:
+                        # Formato antigo (compatibilidade)
+                        conteudo_combinado += f"PRIMEIRO DOCUMENTO:\n{md_primeiro}\n\n"
+
+                except Exception as e:
+                    logger.error(f"Falha ao processar primeiro documento: {str(e)}")
+
+            logger.debug("Tipo de arquivo detectado: %s", tipo_arquivo)
 
-                    if tipo_arquivo == "html":
-                        logger.debug(f"Documento HTML - Conteúdo: {len(conteudo)} caracteres")
-                        conteudo_combinado += f"PRIMEIRO DOCUMENTO:\n{conteudo}\n\n"
-                    elif tipo_arquivo == "pdf":
-                        logger.debug(f"Documento PDF - Tamanho: {len(conteudo)} bytes")
-                        conteudo_combinado = conteudo  # Para PDF, usar o binário direto
+            try:
+                if conteudo_combinado:
+                    resposta_ia_combinada = await enviar_para_ia_conteudo_md(conteudo_combinado, tipo_arquivo)
+                    logger.debug("Resposta da IA recebida: %s", resposta_ia_combinada.get('status', 'sem status'))
                 else:
-                    # Formato antigo (compatibilidade)
-                    conteudo_combinado += f"PRIMEIRO DOCUMENTO:\n{md_primeiro}\n\n"
-
+                    resposta_ia_combinada = {}
             except Exception as e:
-                logger.error(f"Falha ao processar primeiro documento: {str(e)}")
-
-        logger.debug(f"Tipo de arquivo detectado: {tipo_arquivo}")
-
-        try:
-            if conteudo_combinado:
-                resposta_ia_combinada = await enviar_para_ia_conteudo_md(conteudo_combinado, tipo_arquivo)
-                logger.debug(f"Resposta da IA recebida: {resposta_ia_combinada.get('status', 'sem status')}")
-            else:
-                resposta_ia_combinada = {}
-        except Exception as e:
-            logger.error(f"Falha ao obter resposta da IA: {str(e)}")
-            resposta_ia_combinada = {"status": "erro", "resposta_ia": f"Erro ao processar: {str(e)}"}
-
-        # Monta o resultado
-        resultado = {
-            "processo": {
-                "numero": numero_processo,
-                "id_unidade": id_unidade
-            },
-            "primeiro_documento": doc_primeiro,
-            "resumo_combinado": resposta_ia_combinada
-        }
+                logger.error(f"Falha ao obter resposta da IA: {str(e)}")
+                resposta_ia_combinada = {"status": "erro", "resposta_ia": f"Erro ao processar: {str(e)}"}
+
+            return {
+                "processo": {
+                    "numero": numero_processo,
+                    "id_unidade": id_unidade
+                },
+                "primeiro_documento": doc_primeiro,
+                "resumo_combinado": resposta_ia_combinada
+            }
 
-        # Armazena no cache
-        await cache.set(cache_key, resultado, ttl=CACHE_TTL)
+        # Só um worker chama o LLM por processo; os demais esperam o resultado
+        resultado = await cache.get_or_set(cache_key, _gerar_resumo_completo, ttl=CACHE_TTL)
 
-        return Retorno(status="ok", resumo=resultado)
+        return _retorno(status="ok", resumo=resultado)
 
     except HTTPException as he:
         raise he
@@ -320,7 +330,7 @@ async def resumo_completo(
                 type=ErrorType.PROCESSING_ERROR,
                 message="Erro ao processar o resumo completo do processo",
                 details={"error": str(e), "numero_processo": numero_processo}
-            ).dict()
+            ).model_dump(mode="json")
         )
 
 
@@ -354,60 +364,60 @@ async def resumo_documento(
         cached_result = await cache.get(cache_key)
         if cached_result:
             logger.info(f"GET /resumo-documento/{documento_formatado} — cache HIT")
-            return Retorno(status="ok", resumo=cached_result)
+            return _retorno(status="ok", resumo=cached_result)
 
         logger.info(f"GET /resumo-documento/{documento_formatado} — cache MISS")
 
-        # Busca documento e conteúdo em paralelo
-        doc, md = await asyncio.gather(
-            consultar_documento(token, id_unidade, documento_formatado),
-            baixar_documento(token, id_unidade, documento_formatado)
-        )
+        async def _gerar_resumo() -> dict:
+            # Busca documento e conteúdo em paralelo
+            doc, md = await asyncio.gather(
+                consultar_documento(token, id_unidade, documento_formatado),
+                baixar_documento(token, id_unidade, documento_formatado)
+            )
 
-        conteudo = ""
-        tipo_arquivo = "html"  # Default
-
-        if md:
-            # Detectar tipo de arquivo
-            if isinstance(md, dict):
-                tipo_arquivo = md.get("tipo", "html")
-                conteudo_raw = md.get("conteudo")
-
-                if tipo_arquivo == "html":
-                    conteudo = conteudo_raw
-                    logger.debug(f"Documento HTML - Conteúdo: {len(conteudo)} caracteres")
-                elif tipo_arquivo == "pdf":
-                    conteudo = conteudo_raw  # Para PDF, manter binário
-                    logger.debug(f"Documento PDF - Tamanho: {len(conteudo)} bytes")
-            else:
-                # Formato antigo (compatibilidade)
-                conteudo = md
-        else:
-            logger.warning(f"Documento {documento_formatado} não retornou conteúdo MD, usando dados básicos")
+            conteudo = ""
+            tipo_arquivo = "html"  # Default
 
-        if not conteudo:
-            raise HTTPException(
-                status_code=404,
-                detail=ErrorDetail(
-                    type=ErrorType.NOT_FOUND,
-                    message="Documento não encontrado ou não foi possível processar o conteúdo",
-                    details={"documento_formatado": documento_formatado}
-                ).dict()
-            )
+            if md:
+                # Detectar tipo de arquivo
+                if isinstance(md, dict):
+                    tipo_arquivo = md.get("tipo", "html")
+                    conteudo_raw = md.get("conteudo")
 
-        logger.debug(f"Tipo de arquivo detectado: {tipo_arquivo}")
-        resposta_ia = await enviar_documento_ia_conteudo(conteudo, tipo_arquivo)
+                    if tipo_arquivo == "html":
+                        conteudo = conteudo_raw
+                        logger.debug("Documento HTML - Conteúdo: %s caracteres", len(conteudo))
+                    elif tipo_arquivo == "pdf":
+                        conteudo = conteudo_raw  # Para PDF, manter binário
+                        logger.debug("Documento PDF - Tamanho: %s bytes", len(conteudo))
+                else:
+                    # Formato antigo (compatibilidade)
+                    conteudo = md
+            else:
+                logger.warning(f"Documento {documento_formatado} não retornou conteúdo MD, usando dados básicos")
 
-        # Monta o resultado
-        resultado = {
-            "documento": doc,
-            "resumo": resposta_ia
-        }
+            if not conteudo:
+                raise HTTPException(
+                    status_code=404,
+                    detail=ErrorDetail(
+                        type=ErrorType.NOT_FOUND,
+                        message="Documento não encontrado ou não foi possível processar o conteúdo",
+                        details={"documento_formatado": documento_formatado}
+                    ).model_dump(mode="json")
+                )
+
+            logger.debug("Tipo de arquivo detectado: %s", tipo_arquivo)
+            resposta_ia = await enviar_documento_ia_conteudo(conteudo, tipo_arquivo)
+
+            return {
+                "documento": doc,
+                "resumo": resposta_ia
+            }
 
-        # Armazena no cache
-        await cache.set(cache_key, resultado, ttl=CACHE_TTL)
+        # Só um worker chama o LLM por documento; os demais esperam o resultado
+        resultado = await cache.get_or_set(cache_key, _gerar_resumo, ttl=CACHE_TTL)
 
-        return Retorno(status="ok", resumo=resultado)
+        return _retorno(status="ok", resumo=resultado)
 
     except HTTPException as he:
         raise he
@@ -419,7 +429,7 @@ async def resumo_documento(
                 type=ErrorType.PROCESSING_ERROR,
                 message="Erro ao processar o resumo do documento",
                 details={"error": str(e), "documento_formatado": documento_formatado}
-            ).dict()
+            ).model_dump(mode="json")
         )
 
 
@@ -430,7 +440,7 @@ def _sse_event(data: dict) -> str:
 
 @router.get("/resumo-completo-stream/{numero_processo}")
 async def resumo_completo_stream(
-    numero_processo: str,
+    numero_processo: NumeroProcesso,
     id_unidade: str,
     token: str = Query(default=None),
     x_sei_token: str = Header(default=None, alias="X-SEI-Token"),
@@ -557,7 +567,7 @@ async def resumo_completo_stream(
                     )
                     db.add(entendimento)
                     await db.commit()
-                    logger.debug(f"[stream] Entendimento salvo no DB para processo {numero_processo}")
+                    logger.debug("[stream] Entendimento salvo no DB para processo %s", numero_processo)
             except Exception as db_err:
                 logger.warning(f"[stream] Erro ao salvar entendimento no DB: {str(db_err)}")
 
@@ -751,9 +761,14 @@ async def resumo_situacao_stream(
         sse_active_connections.add(1, {"sse.type": "resumo_situacao"})
         _sse_start = time.monotonic()
         try:
-            # 1. Get cached entendimento (Redis first, then DB fallback)
+            # 1. Get cached entendimento (Redis first, then DB fallback).
+            # O conteúdo do último documento vem no mesmo MGET (um round-trip só).
             resumo_cache_key = f"processo:{numero_processo}:resumo_completo"
-            cached_resumo = await cache.get(resumo_cache_key)
+            doc_cache_key = f"processo:{numero_processo}:ultimo_doc:{ultimo_doc_formatado}" if ultimo_doc_formatado else None
+            if doc_cache_key:
+                cached_resumo, cached_doc_content = await cache.mget([resumo_cache_key, doc_cache_key])
+            else:
+                cached_resumo, cached_doc_content = await cache.get(resumo_cache_key), None
             entendimento = ""
             if cached_resumo:
                 entendimento = cached_resumo.get("resumo_combinado", {}).get("resposta_ia", "")
@@ -781,9 +796,6 @@ async def resumo_situacao_stream(
             # 2. Process last document content with smart caching
             ultimo_doc_conteudo = ""
             if ultimo_doc_formatado:
-                doc_cache_key = f"processo:{numero_processo}:ultimo_doc:{ultimo_doc_formatado}"
-
-                cached_doc_content = await cache.get(doc_cache_key)
                 if cached_doc_content:
                     ultimo_doc_conteudo = cached_doc_content
                     logger.info(f"[situacao-stream] ultimo_doc {ultimo_doc_formatado} cache HIT")
@@ -848,7 +860,7 @@ async def resumo_situacao_stream(
                         conteudo=full_text,
                     ))
                     await db.commit()
-                    logger.debug(f"[stream] Situação atual salva no DB para processo {numero_processo} (total_andamentos={current_total})")
+                    logger.debug("[stream] Situação atual salva no DB para processo %s (total_andamentos=%s)", numero_processo, current_total)
             except Exception as db_err:
                 logger.warning(f"[stream] Erro ao salvar situação no DB: {str(db_err)}")
 
@@ -3,16 +3,16 @@ Rotas para gerenciamento de grupos de processos.
 
 Grupos podem ser pessoais (equipe_id IS NULL) ou de equipe (equipe_id set).
 """
-import re
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_
-from datetime import datetime
+from sqlalchemy import select, update, func, and_
+from datetime import datetime, timezone
 from uuid import UUID
 from typing import Optional
 import logging
 
 from ..database import get_db
+from ..normalization import normalizar_numero_processo
 from ..models import Tag, ProcessoSalvo, Equipe, EquipeMembro
 from ..schemas import (
     TagCreate,
@@ -36,7 +36,7 @@ async def _verificar_membro(db: AsyncSession, equipe_id: UUID, usuario: str):
         raise HTTPException(status_code=404, detail="Equipe nao encontrada")
 
     membro = await db.execute(
-        select(EquipeMembro).where(and_(
+        select(EquipeMembro.usuario).where(and_(
             EquipeMembro.equipe_id == equipe_id,
             EquipeMembro.usuario == usuario,
             EquipeMembro.deletado_em.is_(None),
@@ -165,7 +165,7 @@ async def verificar_processo_salvo(
     db: AsyncSession = Depends(get_db),
 ):
     try:
-        numero_limpo = re.sub(r'\D', '', numero_processo)
+        numero_limpo = normalizar_numero_processo(numero_processo)
         query = (
             select(Tag.id, Tag.nome, Tag.cor)
             .join(ProcessoSalvo, ProcessoSalvo.tag_id == Tag.id)
@@ -254,7 +254,6 @@ async def atualizar_tag(
             tag.nome = dados.nome
         if dados.cor is not None:
             tag.cor = dados.cor
-        tag.atualizado_em = datetime.utcnow()
 
         await db.commit()
         await db.refresh(tag)
@@ -283,13 +282,13 @@ async def deletar_tag(
         tag = await _get_tag_com_acesso(db, tag_id, usuario)
         tag.soft_delete()
 
-        # Soft-delete dos processos associados
-        processos_q = select(ProcessoSalvo).where(
-            and_(ProcessoSalvo.tag_id == tag_id, ProcessoSalvo.deletado_em.is_(None))
+        # Soft-delete dos processos associados (um único UPDATE)
+        await db.execute(
+            update(ProcessoSalvo)
+            .where(and_(ProcessoSalvo.tag_id == tag_id, ProcessoSalvo.deletado_em.is_(None)))
+            .values(deletado_em=datetime.now(timezone.utc))
+            .execution_options(synchronize_session=False)
         )
-        result = await db.execute(processos_q)
-        for p in result.scalars().all():
-            p.soft_delete()
 
         await db.commit()
 
@@ -332,7 +331,6 @@ async def salvar_processo(
         processo = ProcessoSalvo(
             tag_id=tag_id,
             numero_processo=dados.numero_processo,
-            numero_processo_formatado=dados.numero_processo_formatado,
             nota=dados.nota,
         )
         db.add(processo)
@@ -5,16 +5,15 @@ Tags podem ser pessoais (sem equipe_id) ou de equipe (com equipe_id).
 - Pessoais: visiveis apenas para o usuario que criou.
 - De equipe: visiveis para todos os membros da equipe.
 """
-import re
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_
-from datetime import datetime
 from uuid import UUID
-from typing import Optional
+from typing import Annotated, Optional
 import logging
 
 from ..database import get_db
+from ..normalization import NumeroProcesso, normalizar_numero_processo
 from ..models import TeamTag, ProcessoTeamTag, Equipe, EquipeMembro
 from ..schemas import (
     TeamTagCreate,
@@ -28,10 +27,6 @@ router = APIRouter()
 logger = logging.getLogger(__name__)
 
 
-def _strip_non_digits(value: str) -> str:
-    return re.sub(r'\D', '', value)
-
-
 async def _verificar_membro(db: AsyncSession, equipe_id: UUID, usuario: str):
     """Verifica que a equipe existe e o usuario e membro."""
     eq = await db.execute(
@@ -41,7 +36,7 @@ async def _verificar_membro(db: AsyncSession, equipe_id: UUID, usuario: str):
         raise HTTPException(status_code=404, detail="Equipe nao encontrada")
 
     membro = await db.execute(
-        select(EquipeMembro).where(and_(
+        select(EquipeMembro.usuario).where(and_(
             EquipeMembro.equipe_id == equipe_id,
             EquipeMembro.usuario == usuario,
             EquipeMembro.deletado_em.is_(None),
@@ -228,7 +223,6 @@ async def atualizar_tag(
         if dados.cor is not None:
             tag.cor = dados.cor
 
-        tag.atualizado_em = datetime.utcnow()
         await db.commit()
         await db.refresh(tag)
 
@@ -288,7 +282,7 @@ async def tag_processo(
         tag = await _get_tag(db, tag_id)
         await _verificar_acesso_tag(db, tag, usuario)
 
-        numero_limpo = _strip_non_digits(dados.numero_processo)
+        numero_limpo = normalizar_numero_processo(dados.numero_processo)
 
         # Verificar duplicata
         existente = await db.execute(
@@ -330,7 +324,7 @@ async def tag_processo(
 )
 async def untag_processo_por_numero(
     tag_id: UUID,
-    numero_processo: str = Query(..., description="Numero do processo"),
+    numero_processo: Annotated[NumeroProcesso, Query(description="Numero do processo")],
     usuario: str = Query(..., description="Usuario"),
     db: AsyncSession = Depends(get_db),
 ):
@@ -338,7 +332,7 @@ async def untag_processo_por_numero(
         tag = await _get_tag(db, tag_id)
         await _verificar_acesso_tag(db, tag, usuario)
 
-        numero_limpo = _strip_non_digits(numero_processo)
+        numero_limpo = normalizar_numero_processo(numero_processo)
 
         result = await db.execute(
             select(ProcessoTeamTag).where(and_(
@@ -409,13 +403,13 @@ async def untag_processo(
     summary="Tags de um processo",
 )
 async def tags_por_processo(
-    numero_processo: str,
+    numero_processo: NumeroProcesso,
     usuario: str = Query(..., description="Usuario"),
     equipe_id: Optional[UUID] = Query(None, description="ID da equipe (omitir para tags pessoais)"),
     db: AsyncSession = Depends(get_db),
 ):
     try:
-        numero_limpo = _strip_non_digits(numero_processo)
+        numero_limpo = normalizar_numero_processo(numero_processo)
 
         if equipe_id:
             await _verificar_membro(db, equipe_id, usuario)
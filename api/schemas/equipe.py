@@ -1,11 +1,13 @@
 """
 Schemas Pydantic para equipes
 """
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, field_validator
 from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
+from ..normalization import validar_numero_processo
+
 
 class EquipeCreate(BaseModel):
     nome: str = Field(..., min_length=1, max_length=200, description="Nome da equipe")
@@ -63,6 +65,11 @@ class MoverProcessoKanban(BaseModel):
 
 class SalvarProcessoKanban(BaseModel):
     tag_id_destino: UUID
-    numero_processo: str
+    numero_processo: str = Field(..., min_length=1, max_length=50, description="Número do processo")
     numero_processo_formatado: Optional[str] = None
     nota: Optional[str] = None
+
+    @field_validator('numero_processo')
+    @classmethod
+    def strip_non_digits(cls, v: str) -> str:
+        return validar_numero_processo(v)
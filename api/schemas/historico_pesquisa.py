@@ -1,12 +1,13 @@
 """
 Schemas Pydantic para histórico de pesquisas
 """
-import re
 from pydantic import BaseModel, Field, ConfigDict, field_validator
 from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
+from ..normalization import validar_numero_processo
+
 
 class HistoricoPesquisaBase(BaseModel):
     """Schema base para histórico de pesquisas"""
@@ -24,10 +25,10 @@ class HistoricoPesquisaBase(BaseModel):
         examples=["12345.678901/2024-99"]
     )
 
-    @field_validator('numero_processo', mode='before')
+    @field_validator('numero_processo')
     @classmethod
     def strip_non_digits(cls, v: str) -> str:
-        return re.sub(r'\D', '', v)
+        return validar_numero_processo(v)
 
     usuario: str = Field(
         ...,
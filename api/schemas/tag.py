@@ -1,12 +1,13 @@
 """
 Schemas Pydantic para tags e processos salvos
 """
-import re
 from pydantic import BaseModel, Field, ConfigDict, field_validator
 from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
+from ..normalization import validar_numero_processo
+
 
 class TagCreate(BaseModel):
     nome: str = Field(..., min_length=1, max_length=200, description="Nome da tag")
@@ -35,10 +36,10 @@ class ProcessoSalvoCreate(BaseModel):
     numero_processo_formatado: Optional[str] = Field(None, max_length=50)
     nota: Optional[str] = Field(None, description="Nota opcional sobre o processo")
 
-    @field_validator('numero_processo', mode='before')
+    @field_validator('numero_processo')
     @classmethod
     def strip_non_digits(cls, v: str) -> str:
-        return re.sub(r'\D', '', v)
+        return validar_numero_processo(v)
 
 
 class ProcessoSalvoResponse(BaseModel):
@@ -1,12 +1,13 @@
 """
 Schemas Pydantic para tags e processo_team_tags
 """
-import re
 from pydantic import BaseModel, Field, ConfigDict, field_validator
 from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
+from ..normalization import validar_numero_processo
+
 
 class TeamTagCreate(BaseModel):
     nome: str = Field(..., min_length=1, max_length=100, description="Nome da tag")
@@ -33,10 +34,10 @@ class TeamTagResponse(BaseModel):
 class ProcessoTeamTagCreate(BaseModel):
     numero_processo: str = Field(..., min_length=1, max_length=50, description="Numero do processo")
 
-    @field_validator('numero_processo', mode='before')
+    @field_validator('numero_processo')
     @classmethod
     def strip_non_digits(cls, v: str) -> str:
-        return re.sub(r'\D', '', v)
+        return validar_numero_processo(v)
 
 
 class ProcessoTeamTagResponse(BaseModel):
@@ -1,6 +1,9 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from enum import Enum
 
+# Modelos só de leitura (respostas/erros): imutáveis e tolerantes a campos extras
+_CONFIG_LEITURA = ConfigDict(frozen=True, extra="ignore")
+
 class ErrorType(str, Enum):
     AUTHENTICATION_ERROR = "authentication_error"
     NOT_FOUND = "not_found"
@@ -10,28 +13,40 @@ class ErrorType(str, Enum):
     DATABASE_ERROR = "database_error"
 
 class ErrorDetail(BaseModel):
+    model_config = _CONFIG_LEITURA
+
     type: ErrorType
     message: str
     details: dict | None = None
 
 class Processo(BaseModel):
+    model_config = _CONFIG_LEITURA
+
     numero: str
     protocolo: str
     id_unidade: str
     assunto: str
 
 class Documento(BaseModel):
+    model_config = _CONFIG_LEITURA
+
     documento_formatado: str
 
 class DocumentoDetalhado(BaseModel):
+    model_config = _CONFIG_LEITURA
+
     conteudo: str
     titulo: str
 
 class Retorno(BaseModel):
+    model_config = _CONFIG_LEITURA
+
     status: str
     resumo: dict | None = None
     andamento: dict | None = None
     error: ErrorDetail | None = None
 
 class Andamentos(BaseModel):
+    model_config = _CONFIG_LEITURA
+
     andamento: str
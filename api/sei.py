@@ -17,7 +17,7 @@ tracer = trace.get_tracer("api.sei")
 # Cliente HTTP global com connection pool
 http_client = httpx.AsyncClient(
     timeout=httpx.Timeout(180.0, connect=30.0),
-    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
     http2=True,
     verify=False
 )
@@ -119,7 +119,7 @@ def _raise_sei_error(response, fallback_message: str):
                 type=ErrorType.EXTERNAL_SERVICE_ERROR,
                 message=sei_msg or fallback_message,
                 details={"status_code": status, "response": response.text[:500]}
-            ).dict()
+            ).model_dump(mode="json")
         )
 
     raise HTTPException(
@@ -128,7 +128,7 @@ def _raise_sei_error(response, fallback_message: str):
             type=ErrorType.EXTERNAL_SERVICE_ERROR,
             message=fallback_message,
             details={"status_code": status, "response": response.text[:500]}
-        ).dict()
+        ).model_dump(mode="json")
     )
 
 
@@ -194,7 +194,7 @@ async def listar_documentos(token: str, protocolo: str, id_unidade: str):
             "sinal_completo": "S"
         }
         headers = {"accept": "application/json", "token": token}
-        logger.debug(f"Fazendo requisição inicial de documentos para processo: {protocolo}")
+        logger.debug("Fazendo requisição inicial de documentos para processo: %s", protocolo)
         response = await _fazer_requisicao_com_retry(url, headers, params, max_tentativas=3)
 
         if response.status_code != 200:
@@ -268,8 +268,8 @@ async def listar_documentos(token: str, protocolo: str, id_unidade: str):
                         resultados_por_pagina[pagina] = resultado
 
                 logger.debug(
-                    f"Lote documentos páginas {batch[0]}-{batch[-1]} concluído "
-                    f"(tentativa {tentativa + 1}): {len(resultados_por_pagina)}/{total_paginas} ok"
+                    "Lote documentos páginas %s-%s concluído (tentativa %s): %s/%s ok",
+                    batch[0], batch[-1], tentativa + 1, len(resultados_por_pagina), total_paginas,
                 )
 
             paginas_pendentes = paginas_falhadas
@@ -286,7 +286,7 @@ async def listar_documentos(token: str, protocolo: str, id_unidade: str):
                     type=ErrorType.EXTERNAL_SERVICE_ERROR,
                     message=f"Falha ao buscar todas as páginas de documentos. {len(paginas_pendentes)} páginas falharam após {max_retries} tentativas.",
                     details={"paginas_falhadas": paginas_pendentes}
-                ).dict()
+                ).model_dump(mode="json")
             )
 
         # Combine in page order
@@ -304,7 +304,7 @@ async def listar_documentos(token: str, protocolo: str, id_unidade: str):
                 type=ErrorType.EXTERNAL_SERVICE_ERROR,
                 message="Erro ao conectar com o serviço SEI para listar documentos",
                 details={"error": str(e)}
-            ).dict()
+            ).model_dump(mode="json")
         )
 
 
@@ -340,7 +340,7 @@ async def listar_primeiro_documento(token: str, protocolo: str, id_unidade: str)
                 type=ErrorType.EXTERNAL_SERVICE_ERROR,
                 message="Erro ao conectar com o serviço SEI para listar documentos",
                 details={"error": str(e)}
-            ).dict()
+            ).model_dump(mode="json")
         )
 
 
@@ -593,7 +593,7 @@ async def listar_tarefa_parcial(token: str, protocolo: str, id_unidade: str):
                 type=ErrorType.EXTERNAL_SERVICE_ERROR,
                 message="Erro ao conectar com o serviço SEI para consultar andamentos",
                 details={"error": str(e)}
-            ).dict()
+            ).model_dump(mode="json")
         )
 
 
@@ -661,7 +661,7 @@ async def listar_documentos_parcial(token: str, protocolo: str, id_unidade: str)
                 type=ErrorType.EXTERNAL_SERVICE_ERROR,
                 message="Erro ao conectar com o serviço SEI para listar documentos",
                 details={"error": str(e)}
-            ).dict()
+            ).model_dump(mode="json")
         )
 
 
@@ -751,8 +751,8 @@ async def listar_tarefa(token: str, protocolo: str, id_unidade: str):
                         resultados_por_pagina[pagina] = resultado
 
                 logger.debug(
-                    f"Lote páginas {batch[0]}-{batch[-1]} concluído "
-                    f"(tentativa {tentativa + 1}): {len(resultados_por_pagina)}/{total_paginas} ok"
+                    "Lote páginas %s-%s concluído (tentativa %s): %s/%s ok",
+                    batch[0], batch[-1], tentativa + 1, len(resultados_por_pagina), total_paginas,
                 )
 
             paginas_pendentes = paginas_falhadas
@@ -769,7 +769,7 @@ async def listar_tarefa(token: str, protocolo: str, id_unidade: str):
                     type=ErrorType.EXTERNAL_SERVICE_ERROR,
                     message=f"Falha ao buscar todas as páginas de andamentos. {len(paginas_pendentes)} páginas falharam após {max_retries} tentativas.",
                     details={"paginas_falhadas": paginas_pendentes}
-                ).dict()
+                ).model_dump(mode="json")
             )
 
         # Combine in page order
@@ -777,7 +777,7 @@ async def listar_tarefa(token: str, protocolo: str, id_unidade: str):
         for pagina in sorted(resultados_por_pagina.keys()):
             todas_tarefas.extend(resultados_por_pagina[pagina])
 
-        logger.debug(f"Paginação concluída. Total esperado: {total_itens}, Total coletado: {len(todas_tarefas)}")
+        logger.debug("Paginação concluída. Total esperado: %s, Total coletado: %s", total_itens, len(todas_tarefas))
         return todas_tarefas
     except httpx.RequestError as e:
         raise HTTPException(
@@ -786,7 +786,7 @@ async def listar_tarefa(token: str, protocolo: str, id_unidade: str):
                 type=ErrorType.EXTERNAL_SERVICE_ERROR,
                 message="Erro ao conectar com o serviço SEI para consultar andamentos",
                 details={"error": str(e)}
-            ).dict()
+            ).model_dump(mode="json")
         )
 
 
@@ -947,7 +947,7 @@ async def login(usuario: str, senha: str, orgao: str, max_tentativas: int = 3):
                         type=ErrorType.EXTERNAL_SERVICE_ERROR,
                         message="Falha ao autenticar no SEI",
                         details={"status_code": response.status_code, "response": response.text}
-                    ).dict()
+                    ).model_dump(mode="json")
                 )
 
             try:
@@ -960,7 +960,7 @@ async def login(usuario: str, senha: str, orgao: str, max_tentativas: int = 3):
                         type=ErrorType.EXTERNAL_SERVICE_ERROR,
                         message="Resposta inválida do serviço SEI",
                         details={"error": "Resposta não é JSON válido"}
-                    ).dict()
+                    ).model_dump(mode="json")
                 )
         except HTTPException:
             raise
@@ -979,7 +979,7 @@ async def login(usuario: str, senha: str, orgao: str, max_tentativas: int = 3):
             type=ErrorType.EXTERNAL_SERVICE_ERROR,
             message="Erro ao conectar com o serviço SEI para login",
             details={"error": str(last_error), "tentativas": max_tentativas}
-        ).dict()
+        ).model_dump(mode="json")
     )
 
 
@@ -992,7 +992,7 @@ async def login(usuario: str, senha: str, orgao: str, max_tentativas: int = 3):
 
 async def consultar_documento(token: str, id_unidade: str, documento_formatado: str):
     try:
-        logger.debug(f"Consultando documento: {documento_formatado}")
+        logger.debug("Consultando documento: %s", documento_formatado)
         url = f"{settings.SEI_BASE_URL}/unidades/{id_unidade}/documentos"
         params = {"protocolo_documento": documento_formatado, "sinal_completo": "N"}
         headers = {"accept": "application/json", "token": token}
@@ -1007,7 +1007,7 @@ async def consultar_documento(token: str, id_unidade: str, documento_formatado:
                 type=ErrorType.EXTERNAL_SERVICE_ERROR,
                 message="Erro ao conectar com o serviço SEI para consultar documento",
                 details={"error": str(e)}
-            ).dict()
+            ).model_dump(mode="json")
         )
 
 
@@ -1072,7 +1072,7 @@ async def assinar_documento(
                 type=ErrorType.EXTERNAL_SERVICE_ERROR,
                 message="Erro ao conectar com o serviço SEI para assinar documento",
                 details={"error": str(e)}
-            ).dict()
+            ).model_dump(mode="json")
         )
 
 
@@ -1113,7 +1113,7 @@ async def baixar_documento(token: str, id_unidade: str, documento_formatado: str
                 type=ErrorType.EXTERNAL_SERVICE_ERROR,
                 message="Erro ao conectar com o serviço SEI para baixar documento",
                 details={"error": str(e)}
-            ).dict()
+            ).model_dump(mode="json")
         )
     except Exception as e:
         raise HTTPException(
@@ -1122,5 +1122,5 @@ async def baixar_documento(token: str, id_unidade: str, documento_formatado: str
                 type=ErrorType.PROCESSING_ERROR,
                 message="Erro ao processar documento baixado",
                 details={"error": str(e)}
-            ).dict()
+            ).model_dump(mode="json")
         )
@@ -304,6 +304,8 @@ def autologin_from_db(id_pessoa: int, settings: Settings) -> str:
     (which accepts both PG_* and DATABASE_* env vars). Raises ConfigError
     via `settings.require_*()` if anything is missing.
     """
+    import base64
+
     from cryptography.fernet import Fernet
 
     try:
@@ -334,7 +336,8 @@ def autologin_from_db(id_pessoa: int, settings: Settings) -> str:
     usuario_sei, senha_encrypted, orgao = row
     f = Fernet(settings.fernet_key.encode())
     try:
-        senha = f.decrypt(senha_encrypted.encode()).decode()
+        # senha_encrypted is BYTEA holding the raw (base64-decoded) Fernet token
+        senha = f.decrypt(base64.urlsafe_b64encode(bytes(senha_encrypted))).decode()
     except Exception as e:
         log.error("Failed to decrypt password for id_pessoa=%d: %s", id_pessoa, e)
         sys.exit(1)